@@ -0,0 +1,93 @@
+"""Measures the memory used per Image including its proxy managers, proxy
+images and proxy colors.
+
+    python scripts/benchmark-memory.py --site-root=./examples/sorolla-demo
+"""
+
+import argparse
+import gc
+import logging
+import pathlib
+import sys
+import tracemalloc
+
+
+sys.path.insert(0, str(pathlib.Path(__file__).parent.parent / "src"))
+
+
+from easel.site import Site  # noqa: E402
+from easel.site.contents import Image  # noqa: E402
+from easel.site.globals import Globals  # noqa: E402
+
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="{asctime} {name} {levelname}: {message}",
+    datefmt="%Y-%m-%d %H:%M:%S",
+    style="{",
+)
+
+
+logger = logging.getLogger()
+
+
+def run__benchmark(site_root: str, count: int) -> None:
+
+    Globals.init(root=site_root)
+
+    site = Site()
+    site.build()
+
+    image = next(site.iter_images())
+
+    logging.getLogger().setLevel(logging.WARNING)
+
+    gc.collect()
+    tracemalloc.start()
+
+    snapshot_start = tracemalloc.take_snapshot()
+
+    images = []
+
+    for _ in range(count):
+
+        item = Image(page=image.page, path=image.path, caption={"title": "Title"})
+
+        # Access everything a template would so lazily set attributes are
+        # included in the measurement.
+        item.src
+        item.caption_title
+        item.proxy_colors.load()
+
+        for proxy in item.proxy_images.proxies:
+            proxy.src
+
+        images.append(item)
+
+    gc.collect()
+
+    snapshot_end = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    size = sum(
+        stat.size_diff
+        for stat in snapshot_end.compare_to(snapshot_start, key_type="filename")
+    )
+
+    logging.getLogger().setLevel(logging.INFO)
+
+    logger.info(
+        f"{count} Images: {size / 2 ** 20:.1f} MiB total, {size / count:.0f} bytes "
+        f"per Image."
+    )
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--site-root", default="./examples/sorolla-demo")
+    parser.add_argument("--count", type=int, default=10000)
+
+    args = parser.parse_args()
+
+    run__benchmark(site_root=args.site_root, count=args.count)
@@ -16,23 +16,39 @@ logging.basicConfig(
 )
 
 
+import datetime
+import gc
+import hashlib
 import os
 import pathlib
 import re
-from typing import Optional, Union
+import time
+from typing import TYPE_CHECKING, Dict, List, NamedTuple, Optional, Tuple, Union
 
-from flask import Flask
+from flask import Flask, Response, g, render_template, request
+from werkzeug.http import is_resource_modified
 
 from .site import Site
-from .site.defaults import Key
-from .site.errors import ThemeConfigError
+from .site.defaults import Defaults, Key
+from .site.errors import Error, SiteConfigError, ThemeConfigError
 from .site.globals import Globals
-from .site.helpers import Utils
+from .site.helpers import LRUCache, Utils
+from .site.metrics import Metrics
+
+
+if TYPE_CHECKING:
+    from .site.pages import PageObj
 
 
 logger = logging.getLogger()
 
 
+class RenderedPage(NamedTuple):
+    html: str
+    etag: str
+    last_modified: Optional[datetime.datetime]
+
+
 class Easel(Flask):
     """Returns a thinly wrapped Flask application instance with two bound
     attributes, Easel._site and it's accessor Easel.site which returns a
@@ -45,16 +61,55 @@ class Easel(Flask):
         loglevel: Optional[str] = None,
         debug: Optional[bool] = None,
         testing: Optional[bool] = None,
+        workers: Optional[int] = None,
+        render_cache_size: int = Defaults.RENDER_CACHE_SIZE,
+        prerender: bool = False,
+        from_snapshot: Optional[bool] = None,
+        profile: Optional[bool] = None,
+        metrics: Optional[bool] = None,
+        lazy_proxies: Optional[bool] = None,
+        warm_proxies: Optional[bool] = None,
     ):
         super().__init__(__name__)
 
         ENV_ROOT: Optional[str] = os.environ.get(Key.SITE_ROOT, None)
         ENV_DEBUG: str = os.environ.get(Key.SITE_DEBUG, "FALSE")
         ENV_TESTING: str = os.environ.get(Key.SITE_TESTING, "FALSE")
+        ENV_WORKERS: Optional[str] = os.environ.get(Key.SITE_WORKERS, None)
+        ENV_FROM_SNAPSHOT: str = os.environ.get(Key.SITE_FROM_SNAPSHOT, "FALSE")
+        ENV_PROFILE: str = os.environ.get(Key.SITE_PROFILE, "FALSE")
+        ENV_METRICS: str = os.environ.get(Key.SITE_METRICS, "FALSE")
+        ENV_LAZY_PROXIES: str = os.environ.get(Key.SITE_LAZY_PROXIES, "FALSE")
+        ENV_WARM_PROXIES: str = os.environ.get(Key.SITE_WARM_PROXIES, "FALSE")
 
         root = root if root is not None else ENV_ROOT
         debug = debug if debug is not None else Utils.str_to_bool(ENV_DEBUG)
         testing = testing if testing is not None else Utils.str_to_bool(ENV_TESTING)
+        if workers is None and ENV_WORKERS is not None:
+            try:
+                workers = int(ENV_WORKERS)
+            except ValueError as error:
+                raise SiteConfigError(
+                    f"Expected a positive integer for '{Key.SITE_WORKERS}' got "
+                    f"'{ENV_WORKERS}'."
+                ) from error
+        from_snapshot = (
+            from_snapshot
+            if from_snapshot is not None
+            else Utils.str_to_bool(ENV_FROM_SNAPSHOT)
+        )
+        profile = profile if profile is not None else Utils.str_to_bool(ENV_PROFILE)
+        metrics = metrics if metrics is not None else Utils.str_to_bool(ENV_METRICS)
+        lazy_proxies = (
+            lazy_proxies
+            if lazy_proxies is not None
+            else Utils.str_to_bool(ENV_LAZY_PROXIES)
+        )
+        warm_proxies = (
+            warm_proxies
+            if warm_proxies is not None
+            else Utils.str_to_bool(ENV_WARM_PROXIES)
+        )
 
         if loglevel is not None:
 
@@ -77,11 +132,33 @@ class Easel(Flask):
         # Setup Globals object.
         Globals.debug = debug
         Globals.testing = testing
+        Globals.profile = profile
+        Globals.lazy_proxies = lazy_proxies
+        Globals.warm_proxies = warm_proxies
+
+        if workers is not None:
+            Globals.workers = workers
+
         Globals.init(root=root)
 
         # Create and bind Site.
         self._site = Site()
-        self._site.build()
+        self._site.build(from_snapshot=from_snapshot)
+
+        # Rendered HTML keyed by the Page's url along with the Page's generation
+        # it was rendered in. See Site.get_page_generation().
+        self._rendered_pages = LRUCache(maxsize=render_cache_size)
+
+        # The validators of every rendered Page keyed by the Page's url. These
+        # are kept even after the rendered HTML is evicted from the cache so
+        # conditional requests never require a Page to be re-rendered.
+        self._page_validators: Dict[
+            Optional[str], Tuple[Tuple[int, int], str, Optional[datetime.datetime]]
+        ] = {}
+
+        # The most recent modification time of the theme's config and templates
+        # keyed by the Site's build generation. See Easel._get_last_modified().
+        self._theme_mtime: Optional[Tuple[int, Optional[float]]] = None
 
         # Load blueprints.
         from .site.views import blueprint_site
@@ -118,6 +195,25 @@ class Easel(Flask):
 
         self.url_map._rules_by_endpoint["static"] = []
 
+        # Request and render timings are only collected and exposed if
+        # 'metrics' is True. See easel.site.metrics.
+        Metrics.enabled = metrics
+
+        if metrics is True:
+            self.before_request(self._metrics__before_request)
+            self.after_request(self._metrics__after_request)
+            self.add_url_rule(
+                Defaults.METRICS_URL, endpoint="metrics", view_func=self._view__metrics
+            )
+
+            for name in ["site_url", "theme_url"]:
+                self.jinja_env.filters[name] = Metrics.measured(
+                    Defaults.METRICS_PHASE_FILTERS, self.jinja_env.filters[name]
+                )
+
+        if prerender is True:
+            self.prerender()
+
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__}:{Globals.site_paths.root}>"
 
@@ -132,9 +228,31 @@ class Easel(Flask):
             "index": self.site.index,
             "menu": self.site.menu,
             "pages": self.site.pages,
+            "proxy_progress": self.site.proxy_progress,
         }
         # fmt:on
 
+    def _metrics__before_request(self) -> None:
+        g.metrics_start = time.perf_counter()
+
+    def _metrics__after_request(self, response: Response) -> Response:
+
+        start: Optional[float] = g.pop("metrics_start", None)
+
+        if start is not None and request.endpoint != "metrics":
+            Metrics.requests.observe(
+                time.perf_counter() - start, request.endpoint or "none"
+            )
+
+        return response
+
+    def _view__metrics(self) -> Response:
+        """ Returns the request and render timings in the Prometheus format. """
+
+        return self.response_class(
+            Metrics.expose(), content_type=Defaults.METRICS_CONTENT_TYPE
+        )
+
     @staticmethod
     def _filter__site_url(path: str) -> str:
         """Returns the path as absolute url to the site's static url '/site':
@@ -194,6 +312,208 @@ class Easel(Flask):
     def site(self) -> "Site":
         return self._site
 
+    def render_page(self, page: Optional["PageObj"] = None) -> str:
+        """Returns the rendered HTML for a Page or the 404 page if 'page' is
+        None. Renders are cached until the Site is rebuilt. The cache is
+        bypassed in debug mode so template changes are always picked up and
+        during a proxy warm-up. See Easel._get_rendered_page()."""
+
+        return self._get_rendered_page(page=page).html
+
+    def page_response(self, page: Optional["PageObj"] = None) -> Response:
+        """Returns a Response for a Page or the 404 page with an ETag and
+        Last-Modified header. The 404 handler doesn't use this, see
+        easel.theme.views.error_404(). Conditional requests matching a previously
+        rendered Page are answered with a '304 Not Modified' without
+        rendering the Page."""
+
+        url = page.url if page is not None else None
+
+        validators = self._page_validators.get(url, None)
+
+        if (
+            Globals.debug is False
+            and validators is not None
+            and validators[0] == self.site.get_page_generation(page=page)
+        ):
+
+            _, etag, last_modified = validators
+
+            if not is_resource_modified(
+                request.environ, etag=etag, last_modified=last_modified
+            ):
+                response = self.response_class(status=304)
+                response.set_etag(etag)
+                response.last_modified = last_modified
+                return response
+
+        rendered = self._get_rendered_page(page=page)
+
+        response = self.response_class(rendered.html)
+        response.set_etag(rendered.etag)
+        response.last_modified = rendered.last_modified
+
+        return response.make_conditional(request)
+
+    def _get_rendered_page(self, page: Optional["PageObj"] = None) -> RenderedPage:
+
+        # Pages rendered during a proxy warm-up show its current progress and
+        # lack the colors of Images that haven't been warmed up yet.
+        if Globals.debug is True or self.site.proxy_progress.is_done is False:
+            return self._build_rendered_page(page=page)
+
+        url = page.url if page is not None else None
+        generation = self.site.get_page_generation(page=page)
+
+        cached = self._rendered_pages.get(url)
+
+        # Stale renders are replaced rather than left in the cache until they're
+        # evicted.
+        if cached is not None and cached[0] == generation:
+            return cached[1]
+
+        rendered = self._build_rendered_page(page=page)
+
+        self._rendered_pages.set(url, (generation, rendered))
+        self._page_validators[url] = (
+            generation,
+            rendered.etag,
+            rendered.last_modified,
+        )
+
+        return rendered
+
+    def _build_rendered_page(self, page: Optional["PageObj"] = None) -> RenderedPage:
+
+        with Metrics.render(page=page.url if page is not None else "404"):
+            html = self._render_page(page=page)
+
+        return RenderedPage(
+            html=html,
+            etag=hashlib.sha256(html.encode("utf-8")).hexdigest(),
+            last_modified=self._get_last_modified(page=page),
+        )
+
+    @staticmethod
+    def _render_page(page: Optional["PageObj"] = None) -> str:
+
+        if page is None:
+            return render_template(Defaults.FILENAME_TEMPLATE_404_HTML)
+
+        return render_template(Defaults.FILENAME_TEMPLATE_MAIN_HTML, page=page)
+
+    def _get_last_modified(
+        self, page: Optional["PageObj"] = None
+    ) -> Optional[datetime.datetime]:
+        """Returns the most recent modification time of the site and theme
+        configs, the theme's templates along with the Page's directory, config,
+        cover, description and contents."""
+
+        paths: List[pathlib.Path] = [
+            Globals.site_paths.root / Defaults.FILENAME_SITE_YAML,
+        ]
+
+        if page is not None:
+
+            paths.extend([page.path, page.path / Defaults.FILENAME_PAGE_YAML])
+
+            for content in [page.cover, page.description, *page.contents]:
+
+                path = getattr(content, "path", None)
+
+                if path is not None:
+                    paths.append(path)
+
+        mtimes = []
+
+        theme_mtime = self._get_theme_mtime()
+
+        if theme_mtime is not None:
+            mtimes.append(theme_mtime)
+
+        for path in paths:
+            try:
+                mtimes.append(os.stat(path).st_mtime)
+            except OSError:
+                continue
+
+        if not mtimes:
+            return None
+
+        return datetime.datetime.fromtimestamp(
+            int(max(mtimes)), tz=datetime.timezone.utc
+        )
+
+    def _get_theme_mtime(self) -> Optional[float]:
+        """Returns the most recent modification time of the theme's config and
+        templates. Walking the theme's directory is only done once per Site
+        build generation rather than once per render."""
+
+        if self._theme_mtime is not None:
+
+            generation, mtime = self._theme_mtime
+
+            if generation == self.site.generation:
+                return mtime
+
+        paths: List[pathlib.Path] = [
+            Globals.theme_paths.root / Defaults.FILENAME_THEME_YAML,
+            *Globals.theme_paths.root.glob("**/*.html"),
+        ]
+
+        mtimes = []
+
+        for path in paths:
+            try:
+                mtimes.append(os.stat(path).st_mtime)
+            except OSError:
+                continue
+
+        mtime = max(mtimes) if mtimes else None
+
+        self._theme_mtime = (self.site.generation, mtime)
+
+        return mtime
+
+    def prerender(self) -> None:
+        """Renders every Page and the 404 page into the render cache."""
+
+        logger.info(f"Pre-rendering {len(self.site.pages)} pages.")
+
+        with self.app_context():
+
+            for page in [*self.site.pages, None]:
+                self.render_page(page=page)
+
+    def freeze(self) -> None:
+        """Prepares the built Site to be shared by forked worker processes e.g.
+        when running gunicorn with '--preload'. Every page is pre-rendered and
+        every object alive is then moved to the garbage collector's permanent
+        generation. Otherwise the first collection in each worker would touch,
+        and therefore copy, every page of the Site.
+
+        Proxies can't be warmed up in the background as the warm-up's thread
+        and process pool would be started before forking and not survive it.
+        Lazy proxies can be used instead.
+
+        https://docs.python.org/3/library/gc.html#gc.freeze"""
+
+        if Globals.warm_proxies is True:
+            raise Error(
+                "Warming up proxies isn't supported when sharing a Site with "
+                "worker processes. Use lazy proxies instead."
+            )
+
+        self.prerender()
+
+        gc.collect()
+        gc.freeze()
+
+        logger.info(f"Froze {gc.get_freeze_count()} objects to share with workers.")
+
+    def clear_render_cache(self) -> None:
+        self._rendered_pages.clear()
+
     def run(self, watch: bool = False, **kwargs) -> None:
 
         extra_files = (
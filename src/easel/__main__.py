@@ -1,8 +1,10 @@
 import sys
+from typing import Optional
 
 import click
 
 from . import Easel, __version__
+from .builder import Builder
 
 
 @click.group()
@@ -11,13 +13,65 @@ from . import Easel, __version__
 @click.option("-l", "--loglevel", default="INFO", show_default=True)
 @click.option("--debug", is_flag=True)
 @click.option("--testing", is_flag=True)
+@click.option("-w", "--workers", type=int, help="Defaults to the CPU count.")
+@click.option("--prerender", is_flag=True, help="Render all pages on startup.")
+@click.option(
+    "--from-snapshot",
+    is_flag=True,
+    help="Load the site from a snapshot in the site-cache if nothing changed.",
+)
+@click.option(
+    "--profile",
+    is_flag=True,
+    help="Log the build's timings and write them to the site-cache.",
+)
+@click.option(
+    "--metrics",
+    is_flag=True,
+    help="Expose request and render timings at '/_easel/metrics'.",
+)
+@click.option(
+    "--lazy-proxies",
+    is_flag=True,
+    help="Generate proxies on their first request instead of on startup.",
+)
+@click.option(
+    "--warm-proxies",
+    is_flag=True,
+    help="Generate proxies in the background instead of on startup.",
+)
 @click.pass_context
-def cli(context, site_root: str, loglevel: str, debug: bool, testing: bool) -> None:
+def cli(
+    context,
+    site_root: str,
+    loglevel: str,
+    debug: bool,
+    testing: bool,
+    workers: Optional[int],
+    prerender: bool,
+    from_snapshot: bool,
+    profile: bool,
+    metrics: bool,
+    lazy_proxies: bool,
+    warm_proxies: bool,
+) -> None:
 
     if "--help" in sys.argv:  # pragma: no cover
         return
 
-    context.obj = Easel(site_root, loglevel=loglevel, debug=debug, testing=testing)
+    context.obj = Easel(
+        site_root,
+        loglevel=loglevel,
+        debug=debug,
+        testing=testing,
+        workers=workers,
+        prerender=prerender,
+        from_snapshot=from_snapshot,
+        profile=profile,
+        metrics=metrics,
+        lazy_proxies=lazy_proxies,
+        warm_proxies=warm_proxies,
+    )
 
 
 @cli.command()
@@ -36,6 +90,15 @@ def serve(
     easel.run(watch=watch, host=host, port=port)
 
 
+@cli.command()
+@click.option("-o", "--output", help="Defaults to 'build' inside the site root.")
+@click.pass_obj
+def build(easel, output: Optional[str]) -> None:
+    """ Build the site as flat HTML files. """
+
+    Builder(easel, output=output).build()
+
+
 @cli.command()
 @click.pass_obj
 def rebuild_site_cache(easel) -> None:
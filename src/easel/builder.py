@@ -0,0 +1,393 @@
+import concurrent.futures
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import pathlib
+from typing import TYPE_CHECKING, Dict, Generator, List, Optional, Tuple, Union
+
+from .site.defaults import Defaults
+from .site.errors import Error
+from .site.globals import Globals
+from .site.helpers import Utils
+
+
+if TYPE_CHECKING:
+    from . import Easel
+
+
+logger = logging.getLogger(__name__)
+
+
+# The Easel instance being built. Set before forking worker processes so each
+# worker inherits the already built Site instead of having to re-build it.
+_easel: Optional["Easel"] = None
+
+
+class Builder:
+    """Exports an Easel site as a flat HTML site. Every Page is rendered to
+    'page-name/index.html' with the index Page also rendered to 'index.html'
+    and the 404 page to '404.html'. Site and theme assets are hard-linked, or
+    copied, into 'site' and 'theme' mirroring the urls the templates use:
+
+        build/
+            index.html
+            404.html
+            page-name/index.html
+            site/...
+            theme/...
+
+    A manifest of the output is kept in the output directory so re-building
+    only writes what has changed. Pages are re-rendered but only written if
+    the digest of their HTML differs from the previous build. Assets are only
+    re-linked if their source's fingerprint has changed. Anything written by
+    a previous build that's no longer part of the site is removed:
+
+        {
+            "version": [int: 1],
+            "pages": {
+                "page-name/index.html": [str: digest],
+                ...
+            },
+            "assets": {
+                "site/contents/pages/page-name/image.jpg": [list: [...]],
+                ...
+            },
+        }
+
+    After a build, Builder.written and Builder.removed list the output paths
+    that were changed, e.g. for syncing only those to a remote host."""
+
+    VERSION: int = 1
+
+    def __init__(
+        self,
+        easel: "Easel",
+        output: Optional[Union[pathlib.Path, str]] = None,
+        workers: Optional[int] = None,
+    ):
+        self._easel = easel
+        self._output = (
+            pathlib.Path(output).resolve()
+            if output is not None
+            else Globals.site_paths.build
+        )
+        self._workers = workers if workers is not None else Globals.workers
+
+        self._manifest: Dict[str, Dict[str, list]] = {"pages": {}, "assets": {}}
+
+        self.written: List[pathlib.Path] = []
+        self.removed: List[pathlib.Path] = []
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}: {self._output}>"
+
+    @property
+    def output(self) -> pathlib.Path:
+        return self._output
+
+    @property
+    def manifest_path(self) -> pathlib.Path:
+        return self.output / Defaults.FILENAME_BUILD_MANIFEST
+
+    def build(self) -> None:
+
+        logger.info(f"Building flat HTML site to {self.output}.")
+
+        self.written = []
+        self.removed = []
+
+        # Proxies are assets and must exist before they can be copied.
+        self._easel.site.generate_pending_proxies()
+
+        manifest_previous = self._load_manifest()
+
+        self._manifest = {"pages": {}, "assets": {}}
+
+        self._render_pages(manifest_previous=manifest_previous["pages"])
+        self._copy_assets(manifest_previous=manifest_previous["assets"])
+        self._remove_stale(manifest_previous=manifest_previous)
+        self._save_manifest()
+
+        logger.info(f"Wrote {len(self.written)} and removed {len(self.removed)} files.")
+
+    def _render_pages(self, manifest_previous: Dict[str, str]) -> None:
+
+        jobs: List[Tuple[Optional[str], str, Optional[str]]] = []
+
+        for url, path in self.iter_pages():
+
+            key = self._get_key(path)
+
+            jobs.append((url, str(path), manifest_previous.get(key, None)))
+
+        logger.info(f"Rendering {len(jobs)} pages with {self._workers} worker(s).")
+
+        global _easel
+        _easel = self._easel
+
+        try:
+            results = self._map(jobs)
+        finally:
+            _easel = None
+
+        for path, digest, written in results:
+
+            self._manifest["pages"][self._get_key(pathlib.Path(path))] = digest
+
+            if written is True:
+                self.written.append(pathlib.Path(path))
+
+    def _map(
+        self, jobs: List[Tuple[Optional[str], str, Optional[str]]]
+    ) -> List[Tuple[str, str, bool]]:
+        """Renders 'jobs' in-process if there's one worker or if processes
+        can't be forked on this platform. Otherwise across a process pool. As
+        the worker processes are forked they inherit the built Site."""
+
+        try:
+            context = multiprocessing.get_context("fork")
+        except ValueError:  # pragma: no cover
+            context = None
+
+        if self._workers <= 1 or context is None:
+            return list(map(render_page, jobs))
+
+        chunksize = max(1, len(jobs) // (self._workers * 4))
+
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=self._workers, mp_context=context
+        ) as executor:
+            return list(executor.map(render_page, jobs, chunksize=chunksize))
+
+    def _copy_assets(self, manifest_previous: Dict[str, list]) -> None:
+
+        count = 0
+
+        for src, dst in self.iter_assets():
+
+            key = self._get_key(dst)
+            fingerprint = Utils.get_fingerprint(src)
+
+            self._manifest["assets"][key] = fingerprint
+            count += 1
+
+            if manifest_previous.get(key, None) == fingerprint and dst.exists():
+                continue
+
+            Utils.link_or_copy(src, dst)
+
+            self.written.append(dst)
+
+        logger.info(f"Found {count} site and theme assets.")
+
+    def _remove_stale(self, manifest_previous: Dict[str, dict]) -> None:
+        """Removes files written by the previous build that are no longer part
+        of the site along with any directories left empty. Only paths recorded
+        in the manifest are ever removed."""
+
+        for section in ["pages", "assets"]:
+
+            stale = set(manifest_previous[section]) - set(self._manifest[section])
+
+            for key in sorted(stale):
+
+                path = self.output / key
+
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    continue
+
+                self.removed.append(path)
+
+                # Remove any parent directories left empty.
+                for parent in path.parents:
+
+                    if parent == self.output:
+                        break
+
+                    try:
+                        parent.rmdir()
+                    except OSError:
+                        break
+
+    def _load_manifest(self) -> Dict[str, dict]:
+
+        sections: Dict[str, dict] = {"pages": {}, "assets": {}}
+
+        try:
+            with open(self.manifest_path, "r") as f:
+                manifest = json.load(f)
+        except (FileNotFoundError, json.decoder.JSONDecodeError):
+            return sections
+
+        if type(manifest) is not dict or manifest.get("version") != self.VERSION:
+            logger.debug(
+                f"Ignoring outdated or invalid manifest {self.manifest_path}."
+            )
+            return sections
+
+        for section in sections:
+
+            entries = manifest.get(section, {})
+
+            if type(entries) is dict:
+                sections[section] = entries
+
+        return sections
+
+    def _save_manifest(self) -> None:
+
+        manifest = {
+            "version": self.VERSION,
+            **self._manifest,
+        }
+
+        self.output.mkdir(parents=True, exist_ok=True)
+
+        # Write to a temporary file first so an interrupted build never leaves
+        # a partially written manifest.
+        with Utils.open_atomic(self.manifest_path, "w") as f:
+            json.dump(manifest, f)
+
+    def _get_key(self, path: pathlib.Path) -> str:
+        return path.relative_to(self.output).as_posix()
+
+    def iter_pages(
+        self,
+    ) -> Generator[Tuple[Optional[str], pathlib.Path], None, None]:
+        """Returns a generator of Page urls and their output paths. The 404
+        page has a url of None."""
+
+        yield self._easel.site.index.url, self.output / "index.html"
+
+        for page in self._easel.site.pages:
+
+            name = Utils.urlify(page.url, leading_slash=False)
+
+            yield page.url, self.output / name / "index.html"
+
+        yield None, self.output / Defaults.FILENAME_TEMPLATE_404_HTML
+
+    def iter_assets(
+        self,
+    ) -> Generator[Tuple[pathlib.Path, pathlib.Path], None, None]:
+        """Returns a generator of site and theme assets and their output
+        paths. Hidden files, YAML configs, theme templates, the site-cache and
+        the output directory itself are skipped. The only files exported from
+        the site-cache are the proxy images of the Site's current Images."""
+
+        for static_url_path, root, suffixes in [
+            (
+                Globals.site_paths.static_url_path,
+                Globals.site_paths.root,
+                [".yaml", ".yml"],
+            ),
+            (
+                Globals.theme_paths.static_url_path,
+                Globals.theme_paths.root,
+                [".yaml", ".yml", ".html"],
+            ),
+        ]:
+
+            destination = self.output / static_url_path.strip("/")
+
+            for path in self._walk(root, suffixes=suffixes):
+                yield path, destination / path.relative_to(root)
+
+        destination = self.output / Globals.site_paths.static_url_path.strip("/")
+
+        for path in self._iter_proxies():
+            yield path, destination / path.relative_to(Globals.site_paths.root)
+
+    def _iter_proxies(self) -> Generator[pathlib.Path, None, None]:
+        """Returns a generator of the existing proxy images of every Image in
+        the Site. Proxies shared between identical Images are only returned
+        once."""
+
+        seen = set()
+
+        for image in self._easel.site.iter_images():
+            for proxy in image.proxy_images.all_proxies:
+
+                if proxy.path in seen or not proxy.exists():
+                    continue
+
+                seen.add(proxy.path)
+
+                yield proxy.path
+
+    def _walk(
+        self, root: pathlib.Path, suffixes: List[str]
+    ) -> Generator[pathlib.Path, None, None]:
+
+        for directory, directory_names, filenames in os.walk(root):
+
+            # Prune hidden directories, the site-cache and the output directory
+            # in-place so os.walk doesn't descend into them. Proxy images are
+            # added separately, see Builder._iter_proxies().
+            directory_names[:] = [
+                name
+                for name in directory_names
+                if not name.startswith(".")
+                and pathlib.Path(directory, name)
+                not in [self.output, Globals.site_cache.root]
+            ]
+
+            for filename in filenames:
+
+                path = pathlib.Path(directory, filename)
+
+                if self._is_skipped(path, suffixes=suffixes):
+                    continue
+
+                yield path
+
+    @staticmethod
+    def _is_skipped(path: pathlib.Path, suffixes: List[str]) -> bool:
+
+        if path.name.startswith("."):
+            return True
+
+        if path.suffix in suffixes:
+            return True
+
+        return False
+
+
+def render_page(
+    job: Tuple[Optional[str], str, Optional[str]]
+) -> Tuple[str, str, bool]:
+    """Renders the Page at 'url' to 'path' unless the digest of the rendered
+    HTML matches the one from the previous build and 'path' still exists.
+    Returns the path, the digest and whether the path was written. Must be
+    kept top-level so it can be pickled and sent to worker processes."""
+
+    url, path, digest_previous = job
+
+    if _easel is None:
+        raise Error("Builder worker started without an Easel instance.")
+
+    page = _easel.site.get_page(url) if url is not None else None
+
+    with _easel.app_context():
+        html = _easel.render_page(page=page)
+
+    data = html.encode("utf-8")
+    digest = hashlib.sha256(data).hexdigest()
+
+    path_output = pathlib.Path(path)
+
+    if digest == digest_previous and path_output.exists():
+        return path, digest, False
+
+    path_output.parent.mkdir(parents=True, exist_ok=True)
+
+    # Write to a temporary file and replace the original so a partially
+    # written page is never served.
+    with Utils.open_atomic(path_output, "wb") as f:
+        f.write(data)
+
+    return path, digest, True
@@ -1,6 +1,7 @@
 import abc
 import logging
 import pathlib
+import sys
 from typing import TYPE_CHECKING, Optional, Union
 
 from ..defaults import Defaults, Key
@@ -21,6 +22,12 @@ logger = logging.getLogger(__name__)
 
 
 class AbstractContent(abc.ABC):
+
+    # Contents are created for every file of every Page. Using __slots__ avoids
+    # a per-instance __dict__. Sub-classes must declare their own __slots__ to
+    # keep this benefit.
+    __slots__ = ("_page", "_config")
+
     def __init__(self, page: Union["AbstractPage", "PageObj"], **config):
 
         self._page = page
@@ -51,6 +58,8 @@ class File(AbstractContent):
     }
     """
 
+    __slots__ = ("_path", "_name", "_filename", "_extension", "_mimetype", "_src")
+
     def __repr__(self):
         return (
             f"<{self.__class__.__name__}: page:{self.page.directory_name} "
@@ -79,47 +88,71 @@ class File(AbstractContent):
                 f"{self.__class__.__name__} cannot be blank."
             )
 
-        if not self.path.exists():
+        self._validate_build__path(path=path)
+
+    def _validate_build__path(self, path: Union[str, pathlib.Path]) -> None:
+        """Resolves the File's path along with every attribute derived from it
+        once. Templates access these on every render."""
+
+        path = pathlib.Path(path)
+
+        # For Layout/LayoutGallery Pages, 'path' is passed as a string-type
+        # containing a path to the file relative to the Page's root directory.
+        # For Lazy/LazyGallery Pages, 'path' is passed as a pathlib.Path object
+        # containing an absolute path to the file.
+        if not path.is_absolute():
+            path = self.page.path / path
+
+        self._path = path
+        self._name = path.stem
+        self._filename = path.name
+        # Interned as there are only a handful of distinct extensions.
+        self._extension = sys.intern(path.suffix)
+
+        if not path.exists():
             raise MissingFile(f"Missing '{self.filename}' in {self.path}.")
 
+        # Resolved on first access. The site's root might not be set yet e.g.
+        # while testing and not all Files have a MIME Type.
+        self._src: Optional[pathlib.Path] = None
+        self._mimetype: Optional[str] = None
+
     @property
     def name(self) -> str:
         """ Returns the filename without the extension. """
-        return self.path.stem
+        return self._name
 
     @property
     def filename(self) -> str:
         """ Returns the whole filename. """
-        return self.path.name
+        return self._filename
 
     @property
     def extension(self) -> str:
         """ Returns the filename's extension. """
-        return self.path.suffix
+        return self._extension
 
     @property
     def path(self) -> pathlib.Path:
         """ Returns an absolute path to the File. """
-
-        path = pathlib.Path(self.config[Key.PATH])
-
-        # For Lazy/LazyGallery Pages, 'path' is passed as a pathlib.Path object
-        # containing an absolute path to the file.
-        if path.is_absolute():
-            return path
-
-        # For Layout/LayoutGallery Pages, 'path' is passed as a string-type
-        # containing a path to the file relative to the Page's root directory.
-        return self.page.path / path
+        return self._path
 
     @property
     def src(self) -> pathlib.Path:
         """ Returns a path relative to to /site-name. """
-        return self.path.relative_to(Globals.site_paths.root)
+
+        if self._src is None:
+            self._src = self._path.relative_to(Globals.site_paths.root)
+
+        return self._src
 
     @property
     def mimetype(self) -> Optional[str]:
-        return Utils.get_mimetype(extension=self.extension)
+
+        if self._mimetype is None:
+            self._mimetype = Utils.get_mimetype(extension=self._extension)
+
+        return self._mimetype
 
 
 class Image(File, CaptionMixin):
@@ -132,6 +165,8 @@ class Image(File, CaptionMixin):
         }
     """
 
+    __slots__ = ("_caption_html", "_proxy_images", "_proxy_colors")
+
     is_image: bool = True
 
     def __init__(self, *args, **kwargs):
@@ -170,6 +205,8 @@ class Video(File, CaptionMixin):
         }
     """
 
+    __slots__ = ("_caption_html",)
+
     is_video: bool = True
 
     def validate__config(self) -> None:
@@ -194,6 +231,8 @@ class Audio(File, CaptionMixin):
         }
     """
 
+    __slots__ = ("_caption_html",)
+
     is_audio: bool = True
 
     def validate__config(self) -> None:
@@ -219,6 +258,8 @@ class TextBlock(File):
         }
     """
 
+    __slots__ = ()
+
     is_text_block: bool = True
 
     def validate__config(self) -> None:
@@ -254,6 +295,8 @@ class Embedded(AbstractContent, CaptionMixin):
         }
     """
 
+    __slots__ = ("_caption_html",)
+
     is_embedded: bool = True
 
     def __repr__(self):
@@ -298,6 +341,8 @@ class Header(AbstractContent):
         }
     """
 
+    __slots__ = ()
+
     is_header: bool = True
 
     def __repr__(self):
@@ -355,6 +400,8 @@ class Break(AbstractContent):
         }
     """
 
+    __slots__ = ()
+
     is_break: bool = True
 
     def __repr__(self):
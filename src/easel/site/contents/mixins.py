@@ -1,6 +1,6 @@
 import abc
 import logging
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Dict, Optional
 
 from ..defaults import Defaults, Key
 from ..errors import ContentConfigError
@@ -24,8 +24,14 @@ class CaptionMixin(abc.ABC):
                 "description": [str?: None],
             },
         }
+
+    Captions are rendered to HTML once, either for the entire Site via
+    Site._build_captions() or on first access, and then re-used. Classes using
+    this mixin must provide a '_caption_html' slot.
     """
 
+    __slots__ = ()
+
     @property
     @abc.abstractmethod
     def config(self) -> dict:
@@ -74,13 +80,44 @@ class CaptionMixin(abc.ABC):
                 f"{self.page}: Unsupported value '{self.caption_align}' for '{Key.ALIGN}'."
             )
 
+    def compile_captions(self, compiled: Optional[Dict[str, str]] = None) -> None:
+        """Renders the caption's title and description to HTML. 'compiled' maps
+        Markdown strings to their rendered HTML allowing identical captions to
+        share a single render."""
+
+        compiled = compiled if compiled is not None else {}
+
+        caption_html: Dict[str, str] = {}
+
+        for key in [Key.TITLE, Key.DESCRIPTION]:
+
+            string = self._caption_config.get(key, "")
+
+            if string not in compiled:
+                compiled[string] = Markdown.from_string(string)
+
+            caption_html[key] = compiled[string]
+
+        self._caption_html = caption_html
+
     @property
     def caption_title(self) -> str:
-        return Markdown.from_string(self._caption_config.get(Key.TITLE, ""))
+        return self._get_caption_html()[Key.TITLE]
 
     @property
     def caption_description(self) -> str:
-        return Markdown.from_string(self._caption_config.get(Key.DESCRIPTION, ""))
+        return self._get_caption_html()[Key.DESCRIPTION]
+
+    def _get_caption_html(self) -> Dict[str, str]:
+
+        # The '_caption_html' slot is unset until the captions are compiled.
+        caption_html = getattr(self, "_caption_html", None)
+
+        if caption_html is None:
+            self.compile_captions()
+            caption_html = self._caption_html  # type: ignore
+
+        return caption_html
 
     @property
     def caption_align(self) -> Optional[str]:
@@ -1,14 +1,42 @@
 import abc
-import json
+import atexit
+import concurrent.futures
+import functools
+import hashlib
 import logging
+import operator
+import os
 import pathlib
-from typing import TYPE_CHECKING, Callable, List, Optional, Tuple
+import sys
+import threading
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
 
 import PIL.Image
-import PIL.ImageFilter
+import PIL.ImageChops
+import PIL.ImageStat
 
 from ..defaults import Defaults
 from ..globals import Globals
+from ..helpers import Utils
+
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    # Optional. Palettes are generated with Pillow alone without it.
+    numpy = None  # type: ignore
 
 
 if TYPE_CHECKING:
@@ -18,21 +46,38 @@ if TYPE_CHECKING:
 logger = logging.getLogger()
 
 
+# The settings of the default JPEG proxy images. Their quality is set per size.
+# See Defaults.PROXY_IMAGE_FORMATS and ThemeConfig.proxy_sizes.
+_PROXY_IMAGE_FORMAT_DEFAULT = {
+    "format": Defaults.PROXY_IMAGE_FORMAT,
+    "extension": Defaults.PROXY_IMAGE_EXTENSION,
+    "mimetype": Defaults.PROXY_IMAGE_MIMETYPE,
+}
+
+
 class BaseProxyManager(abc.ABC):
-    """BUG:LOW It would be ideal to trigger Proxy image/color generation and
-    loading i.e. the 'cache' method *after* the site has been built and
-    validated. However it seems like proxy items become immutable after
-    instantiation. In order for them to work properly, they must cached on
-    instantiation. If 'cache' is run later in the build process, they show
-    internal changes but these are undetectable from the Flask layer."""
+    """Proxy managers do not generate their proxies on instantiation. Once all
+    Pages have been built, every pending Image is passed to a ProxyGenerator
+    which generates the missing proxy images and colors across a pool of
+    worker processes or, if Globals.lazy_proxies is True, on the first request
+    for each proxy image. See Site.build() and Site.rebuild_cache()."""
+
+    # Every Image has two managers along with their proxies. Using __slots__
+    # avoids a per-instance __dict__ for each of them.
+    __slots__ = ("_image", "_key", "_root")
 
     def __init__(self, image: "Image"):
         self._image = image
 
-        self.root.mkdir(parents=True, exist_ok=True)
+        # Resolved on first access as the key requires the digest of the
+        # image's contents. Digests are computed in parallel before the first
+        # access, see Site._build_proxies().
+        self._key: Optional[str] = None
+        self._root: Optional[pathlib.Path] = None
 
     @abc.abstractmethod
-    def cache(self, force: bool) -> None:
+    def pending(self, force: bool) -> list:
+        """ Returns a list of proxies that require generating. """
         pass  # pragma: no cover
 
     @property
@@ -44,92 +89,197 @@ class BaseProxyManager(abc.ABC):
     def image(self) -> "Image":
         return self._image
 
+    def _get_key(self) -> str:
+        """Returns a key derived from the digest of the image's contents and
+        the proxy settings. Replacing an image invalidates its proxies while
+        identical images, regardless of their name or page, share them."""
+
+        digest = Globals.site_cache.get_digest(self.image.path)
+
+        settings = [
+            Defaults.PROXY_IMAGE_FORMAT,
+            Defaults.PROXY_IMAGE_EXTENSION,
+            *Globals.theme_config.proxy_sizes,
+            *[Defaults.PROXY_IMAGE_FORMATS[name] for name in get_proxy_formats()],
+        ]
+
+        return hashlib.sha256(f"{digest}:{settings}".encode("utf-8")).hexdigest()
+
     @property
-    def root(self) -> pathlib.Path:
-        """Returns an absolute path to the proxy's root data directory.
-        Transforms the original image path:
+    def key(self) -> str:
 
-            /site-name/pages/page-name/image-name.ext
+        if self._key is None:
+            self._key = self._get_key()
 
-        ...to the site-cache path:
+        return self._key
+
+    @property
+    def root(self) -> pathlib.Path:
+        """Returns an absolute path to the proxy's root data directory inside
+        the site-cache. Proxies are content-addressed:
 
-            /site-name/site-cache/pages/page-name/image-name
+            /site-name/site-cache/proxies/ke/key
         """
-        return (
-            Globals.site_paths.cache
-            / Defaults.DIRECTORY_NAME_PAGES
-            / self.image.page.directory_name
-            / self.image.name
-        )
+
+        if self._root is None:
+            self._root = Globals.site_cache.proxies / self.key[:2] / self.key
+
+        return self._root
 
 
 class ProxyImageManager(BaseProxyManager):
+    """Manages the JPEG proxy images of an Image, one for each of the theme's
+    'proxies.sizes', along with a variant of each in every format listed in
+    the theme's 'proxies.formats'. Proxy images are accessed by name e.g.
+    'content.proxy_images.medium' or, for names shadowed by an attribute, via
+    ProxyImageManager.get(). Themes can use the variants via
+    ProxyImageManager.sources:
+
+        <picture>
+            {% for source in content.proxy_images.sources %}
+                <source type="{{ source.type }}" srcset="{{ source.srcset }}">
+            {% endfor %}
+            <img src="{{ content.proxy_images.medium.src | site_url }}">
+        </picture>
+
+    Requests for a JPEG proxy image are also answered with the best variant
+    the client accepts. See easel.site.views.serve_proxy()."""
+
+    __slots__ = ("_proxies",)
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-        self._small = ProxyImage(manager=self, config=Defaults.PROXY_IMAGE_SMALL)
-        self._medium = ProxyImage(manager=self, config=Defaults.PROXY_IMAGE_MEDIUM)
-        self._large = ProxyImage(manager=self, config=Defaults.PROXY_IMAGE_LARGE)
+        self._proxies = [
+            ProxyImage(manager=self, config=config)
+            for config in Globals.theme_config.proxy_sizes
+        ]
 
-        self.cache()
+    def __getattr__(self, name: str) -> "ProxyImage":
 
-    def cache(self, force: bool = False) -> None:
+        # Private attributes are never proxy images. This also prevents
+        # infinite recursion when unpickling before '_proxies' is set.
+        if name.startswith("_"):
+            raise AttributeError(name)
 
-        if self.all_proxies_exist() and force is False:
-            return
+        proxy = self.get(name)
 
-        with PIL.Image.open(self.image.path) as image:
+        if proxy is None:
+            raise AttributeError(
+                f"'{self.__class__.__name__}' has no proxy image named '{name}'."
+            )
 
-            image = image.convert("RGB")
+        return proxy
 
-            # NOTE: The order of self.proxies here matters. Instead of loading
-            # the image three times to create three resolutions, we load the
-            # image once and resize it three times from largest to smallest.
-            for image_proxy in self.proxies:
+    def get(self, name: str) -> Optional["ProxyImage"]:
+        """ Returns the JPEG proxy image named 'name' or None. """
 
-                if image_proxy.exists() and force is False:
-                    continue
+        for proxy in self._proxies:
+            if proxy.name == name:
+                return proxy
 
-                logger.debug(
-                    f"Generating {image_proxy.name}, {image_proxy.size[0]}px "
-                    f"proxy image for '{self.image.filename}'."
-                )
+        return None
 
-                image.thumbnail(image_proxy.size)
+    def pending(self, force: bool = False) -> List["ProxyImage"]:
 
-                image.save(
-                    image_proxy.path,
-                    format=Defaults.PROXY_IMAGE_FORMAT,
-                    quality=Defaults.PROXY_IMAGE_QUALITY,
-                )
+        if force is True:
+            return self.all_proxies
+
+        # Trust the manifest rather than checking the site-cache for each
+        # proxy image. See Site.rebuild_cache() for repairing the site-cache.
+        generated = Globals.site_cache.get_proxies(self.key)["images"]
+
+        return [proxy for proxy in self.all_proxies if proxy.filename not in generated]
 
     def all_proxies_exist(self) -> bool:
-        return all(proxy.exists() for proxy in self.proxies)
+        return all(proxy.exists() for proxy in self.all_proxies)
 
-    @property
-    def proxies(self) -> List["ProxyImage"]:
-        return [self.large, self.medium, self.small]
+    def srcset(self, format: Optional[str] = None) -> str:
+        """Returns a 'srcset' of the proxy images in 'format', one of the
+        theme's 'proxies.formats', or of the JPEG proxy images if None."""
+
+        proxies = [
+            proxy if format is None else proxy.get_variant(format)
+            for proxy in self.proxies
+        ]
+
+        return ", ".join(
+            f"{proxy.url} {proxy.size[0]}w" for proxy in proxies if proxy is not None
+        )
 
     @property
-    def small(self) -> "ProxyImage":
-        return self._small
+    def sources(self) -> List[Dict[str, str]]:
+        """Returns the 'type' and 'srcset' of each variant format in order of
+        preference for use in a <picture>'s <source> tags."""
+
+        return [
+            {
+                "type": Defaults.PROXY_IMAGE_FORMATS[name]["mimetype"],
+                "srcset": self.srcset(format=name),
+            }
+            for name in get_proxy_formats()
+        ]
 
     @property
-    def medium(self) -> "ProxyImage":
-        return self._medium
+    def proxies(self) -> List["ProxyImage"]:
+        # NOTE: The order of the proxies here matters. See generate_proxies().
+        return self._proxies
 
     @property
-    def large(self) -> "ProxyImage":
-        return self._large
+    def all_proxies(self) -> List["ProxyImage"]:
+        """Returns the JPEG proxy images each followed by their variants. Each
+        variant is saved from the same downscaled image as its JPEG."""
+
+        proxies = []
+
+        for proxy in self.proxies:
+            proxies.append(proxy)
+            proxies.extend(proxy.variants)
+
+        return proxies
 
 
 class ProxyImage:
-    def __init__(self, manager: "ProxyImageManager", config: dict):
+
+    __slots__ = (
+        "_manager",
+        "_name",
+        "_size",
+        "_quality",
+        "_format",
+        "_filename",
+        "_path",
+        "_src",
+        "_variants",
+    )
+
+    def __init__(
+        self, manager: "ProxyImageManager", config: dict, format: Optional[str] = None
+    ):
         self._manager = manager
 
-        # TODO:LOW Are we happy with the way these are being configured?
-        self._name: str = config.get("name")  # type:ignore
-        self._size: Tuple[int, int] = config.get("size")  # type:ignore
+        self._name: str = config["name"]
+        self._size: Tuple[int, int] = config["size"]
+
+        # The settings are shared between all proxy images of the same format.
+        self._format: dict = (
+            Defaults.PROXY_IMAGE_FORMATS[format]
+            if format is not None
+            else _PROXY_IMAGE_FORMAT_DEFAULT
+        )
+
+        # Each size sets the quality of its JPEG while variants use the quality
+        # of their format.
+        self._quality: int = (
+            self._format["quality"] if format is not None else config["quality"]
+        )
+
+        # Paths are resolved once, on first access, as templates access them on
+        # every render. See BaseProxyManager.key.
+        self._filename = sys.intern(f"{self._name}{self._format['extension']}")
+        self._path: Optional[pathlib.Path] = None
+        self._src: Optional[pathlib.Path] = None
+        self._variants: Optional[List["ProxyImage"]] = None
 
     def exists(self) -> bool:
         return self.path.exists()
@@ -144,148 +294,175 @@ class ProxyImage:
 
     @property
     def filename(self) -> str:
-        return f"{self.name}{self._manager.image.extension}"
+        return self._filename
 
     @property
     def path(self) -> pathlib.Path:
-        return self._manager.root / self.filename
+
+        if self._path is None:
+            self._path = self._manager.root / self._filename
+
+        return self._path
 
     @property
     def src(self) -> pathlib.Path:
-        return self.path.relative_to(Globals.site_paths.root)
-
 
-class ProxyColorManager(BaseProxyManager):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
+        if self._src is None:
+            self._src = self.path.relative_to(Globals.site_paths.root)
 
-        self._average = ProxyColor(
-            manager=self, name="average", generate_color=self._generate_color__average
-        )
-        self._dominant = ProxyColor(
-            manager=self, name="dominant", generate_color=self._generate_color__dominant
-        )
+        return self._src
 
-        self.cache()
+    @property
+    def url(self) -> str:
+        """ Returns the proxy image's url. See Easel._filter__site_url(). """
+        return Utils.urlify(f"{Globals.site_paths.static_url_path}{os.sep}{self.src}")
 
-    def cache(self, force: bool = False) -> None:
+    @property
+    def format(self) -> str:
+        return self._format["format"]
 
-        for proxy in self.proxies:
-            proxy.load_or_generate(force=force)
+    @property
+    def quality(self) -> int:
+        return self._quality
 
     @property
-    def proxies(self) -> List["ProxyColor"]:
-        return [self.average, self.dominant]
+    def mimetype(self) -> str:
+        return self._format["mimetype"]
 
     @property
-    def average(self) -> "ProxyColor":
-        return self._average
+    def variants(self) -> List["ProxyImage"]:
+        """Returns this proxy image in each of the theme's 'proxies.formats' in
+        order of preference. Empty for the variants themselves. Variants are
+        only created on first access, usually the first render of their Page,
+        so Images that are never rendered don't keep an extra ProxyImage per
+        size and format. Once created they're kept along with their paths."""
 
-    def _generate_color__average(self) -> List[int]:
+        if self._format is not _PROXY_IMAGE_FORMAT_DEFAULT:
+            return []
 
-        with PIL.Image.open(self.image.path) as image:
+        if self._variants is None:
 
-            image = image.convert("RGB")
-            image = image.resize((1, 1))
-            color = image.getpixel((0, 0))
+            config = {"name": self._name, "size": self._size, "quality": self._quality}
 
-            return list(color)  # type:ignore
+            self._variants = [
+                ProxyImage(manager=self._manager, config=config, format=name)
+                for name in get_proxy_formats()
+            ]
 
-    @property
-    def dominant(self) -> "ProxyColor":
-        return self._dominant
+        return self._variants
 
-    def _generate_color__dominant(self) -> List[int]:
-        # TODO:LOW Need a better method for getting the dominant color.
+    def get_variant(self, format: str) -> Optional["ProxyImage"]:
 
-        with PIL.Image.open(self.image.path) as image:
+        mimetype = Defaults.PROXY_IMAGE_FORMATS[format]["mimetype"]
 
-            image = image.convert("RGB")
+        for variant in self.variants:
+            if variant.mimetype == mimetype:
+                return variant
 
-            resolution = 32
+        return None
 
-            image.thumbnail((resolution, resolution), resample=0)
 
-            """
-                [
-                    (frequency, (R, G, B)),
-                    (frequency, (R, G, B)),
-                    ...
-                ]
-            """
-            pixel_data = image.getcolors(resolution * resolution)
+class ProxyColorManager(BaseProxyManager):
+    """Manages the average and dominant colors of an Image along with its
+    palette if the theme's 'proxies.palette' is set."""
 
-            # Sort them by frequency.
-            pixel_data_sorted = sorted(pixel_data, key=lambda i: i[0], reverse=True)
+    __slots__ = ("_average", "_dominant", "_palette")
 
-            # (frequency, (R, G, B))
-            pixel_data_dominant = pixel_data_sorted[0]
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
 
-            # (R, G, B)
-            dominant_color = pixel_data_dominant[1]
+        self._average = ProxyColor(manager=self, name="average")
+        self._dominant = ProxyColor(manager=self, name="dominant")
 
-            return list(dominant_color)  # type:ignore
+        size = Globals.theme_config.proxy_palette_size
 
+        self._palette: Optional[ProxyPalette] = (
+            ProxyPalette(manager=self, name="palette", size=size) if size else None
+        )
 
-class ProxyColor:
-    def __init__(
-        self, manager: "ProxyColorManager", name: str, generate_color: Callable
-    ):
-        self._manager = manager
-        self._name = name
-        self._generate_color = generate_color
+    def pending(self, force: bool = False) -> List["ProxyColor"]:
 
-        self._color: Optional[List[int]] = None
+        if force is True:
+            return self.proxies
 
-    # TODO:MED ProxyColor: load_or_generate, _load and _save need refactoring.
+        # Attempt to load each color from the manifest before deeming it as
+        # pending.
+        return [proxy for proxy in self.proxies if not proxy.load()]
 
-    def load_or_generate(self, force: bool = False) -> None:
+    def load(self) -> None:
+        """ Loads all available colors from the manifest. """
 
-        if self._color is not None and force is False:
-            return
+        for proxy in self.proxies:
+            proxy.load()
 
-        if force is True:
-            logger.debug(
-                f"Generating '{self.name}' color data for '{self._manager.image.filename}'."
-            )
-            self.color = self._generate_color()
-            self._save()
-            return
+    def update(self, colors: Dict[str, list]) -> None:
+        """ Sets and saves colors returned from generate_proxies(). """
 
-        color = self._load()
+        for proxy in self.proxies:
 
-        if color is None:
-            logger.debug(
-                f"Error/invalid color data in '{self.path.name}' for "
-                f"'{self._manager.image.filename}'. Generating {self.name} "
-                f"color data for '{self._manager.image.filename}'."
-            )
-            self.color = self._generate_color()
-        else:
-            self.color = color
+            color = colors.get(proxy.name, None)
 
-        self._save()
+            if color is None:
+                continue
 
-    def _load(self) -> Optional[List[int]]:
+            proxy.color = color
+            proxy.save()
 
-        try:
-            with open(self.path, "r") as f:
-                color = json.load(f)
-        except (FileNotFoundError, json.decoder.JSONDecodeError):
-            return
+    @property
+    def proxies(self) -> List["ProxyColor"]:
 
-        if type(color) is not list:
-            return
+        if self._palette is None:
+            return [self.average, self.dominant]
+
+        return [self.average, self.dominant, self._palette]
+
+    @property
+    def average(self) -> "ProxyColor":
+        return self._average
 
-        return color
+    @property
+    def dominant(self) -> "ProxyColor":
+        return self._dominant
 
-    def _save(self) -> None:
+    @property
+    def palette(self) -> Optional["ProxyPalette"]:
+        return self._palette
 
-        with open(self.path, "w") as f:
-            json.dump(self.color, f)
 
-    def exists(self) -> bool:
-        return self.path.exists()
+class ProxyColor:
+
+    __slots__ = ("_manager", "_name", "_color")
+
+    def __init__(self, manager: "ProxyColorManager", name: str):
+        self._manager = manager
+        self._name = name
+
+        self._color: Optional[List[int]] = None
+
+    def load(self) -> bool:
+        """ Loads the color from the manifest. Returns whether it was found. """
+
+        if self._color is not None:
+            return True
+
+        color = Globals.site_cache.get_proxies(self._manager.key)["colors"].get(
+            self.name, None
+        )
+
+        if not self._is_valid(color):
+            return False
+
+        self.color = color
+
+        return True
+
+    def save(self) -> None:
+        Globals.site_cache.update_proxies(
+            self._manager.key, colors={self.name: self.color}
+        )
+
+    def _is_valid(self, color: Any) -> bool:
+        return type(color) is list
 
     @property
     def color(self) -> List[int]:
@@ -301,14 +478,6 @@ class ProxyColor:
     def name(self) -> str:
         return self._name
 
-    @property
-    def filename(self) -> str:
-        return f"{self.name}.json"
-
-    @property
-    def path(self) -> pathlib.Path:
-        return self._manager.root / self.filename
-
     @property
     def rgb(self) -> dict:
         """Returns the color as a dictionary. This is because this value needs
@@ -319,3 +488,819 @@ class ProxyColor:
             "G": self.color[1],
             "B": self.color[2],
         }
+
+
+class ProxyPalette(ProxyColor):
+    """The 'size' most common colors of an image, most common first. Stored
+    in the site-cache alongside the other colors:
+
+        "palette": [
+            [list: [int, int, int]],
+            ...
+        ]
+
+    Images with fewer distinct colors than 'size' repeat their least common
+    one so a palette always has 'size' colors."""
+
+    __slots__ = ("_size",)
+
+    def __init__(self, manager: "ProxyColorManager", name: str, size: int):
+        super().__init__(manager=manager, name=name)
+
+        self._size = size
+
+    def _is_valid(self, color: Any) -> bool:
+        # Changing the theme's 'proxies.palette' invalidates stored palettes.
+        return type(color) is list and len(color) == self._size
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def colors(self) -> List[List[int]]:
+        """ Returns the palette's colors. Black until it's been generated. """
+
+        if self._color is None:
+            return [[0, 0, 0]] * self._size
+
+        return self._color  # type:ignore
+
+    @property
+    def rgb(self) -> List[dict]:  # type:ignore
+        return [{"R": color[0], "G": color[1], "B": color[2]} for color in self.colors]
+
+
+class ProxyProgress(NamedTuple):
+    """The progress of a proxy warm-up. See ProxyGenerator.warm_up()."""
+
+    done: int = 0
+    total: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def is_done(self) -> bool:
+        return self.done >= self.total
+
+    @property
+    def percent(self) -> int:
+
+        if self.total == 0:
+            return 100
+
+        return int(100 * self.done / self.total)
+
+    @property
+    def eta(self) -> Optional[float]:
+        """Returns the estimated number of seconds left or None if nothing has
+        been generated yet."""
+
+        if self.is_done:
+            return 0.0
+
+        if self.done == 0:
+            return None
+
+        return self.elapsed / self.done * (self.total - self.done)
+
+
+class ProxyGenerator:
+    """Generates proxy images and colors for a batch of Images across a pool
+    of worker processes. Each Image with pending proxies is described by a
+    'job', a picklable dictionary with the following attributes:
+
+        {
+            "path": [str: None],
+            "images": [
+                {
+                    "name": [str: None],
+                    "filename": [str: None],
+                    "path": [str: None],
+                    "size": [tuple: None],
+                    "format": [str: None],
+                    "quality": [int: None],
+                    "save": [bool: False],
+                },
+                ...
+            ],
+            "colors": [list: []],
+            "palette": [int: 0],
+        }
+
+    Jobs are processed by generate_proxies() and the generated colors are
+    collected back into each Image's ProxyColorManager. The time each job
+    spent generating images and colors is recorded in Globals.timings under
+    'proxy images' and 'proxy colors'.
+
+    If 'defer' is passed to ProxyGenerator.run(), jobs are only registered
+    under the src of each of their proxy images. A job is then processed on
+    the first request for one of its proxy images. See ProxyGenerator.generate()
+    and Globals.lazy_proxies. Alternatively deferred jobs can be processed in
+    the background. See ProxyGenerator.warm_up() and Globals.warm_proxies.
+
+    NOTE: Images sharing a proxy root i.e. the same file referenced twice in a
+    Page, are processed once."""
+
+    def __init__(self, workers: Optional[int] = None):
+        self._workers: int = workers if workers is not None else Globals.workers
+
+        self._jobs: Dict[pathlib.Path, dict] = {}
+        self._images_by_root: Dict[pathlib.Path, List["Image"]] = {}
+
+        # Deferred jobs keyed by the src of each of their proxy images.
+        self._roots_by_src: Dict[str, pathlib.Path] = {}
+
+        # Jobs in progress. Requests for a job that's in progress wait on its
+        # Event rather than generating the same proxies again.
+        self._in_progress: Dict[pathlib.Path, threading.Event] = {}
+
+        self._lock = threading.Lock()
+        self._saved: float = time.perf_counter()
+
+        # Jobs submitted to the warm-up's pool but not finished. Cancelled by
+        # ProxyGenerator.close().
+        self._futures: Dict[concurrent.futures.Future, pathlib.Path] = {}
+        self._closed: bool = False
+
+        self._warm_up: Optional[threading.Thread] = None
+        self._warm_up_total: int = 0
+        self._warm_up_done: int = 0
+        self._warm_up_start: Optional[float] = None
+        self._warm_up_end: Optional[float] = None
+
+    def run(
+        self, images: Iterable["Image"], force: bool = False, defer: bool = False
+    ) -> None:
+
+        for image in images:
+
+            root = image.proxy_colors.root
+
+            if root in self._images_by_root:
+                self._images_by_root[root].append(image)
+                image.proxy_colors.load()
+                continue
+
+            self._images_by_root[root] = [image]
+
+            job = self.build_job(image=image, force=force)
+
+            if job is None:
+                continue
+
+            self._jobs[root] = job
+
+        if not self._jobs:
+            return
+
+        if defer is True:
+
+            for root, job in self._jobs.items():
+                for proxy in self._images_by_root[root][0].proxy_images.all_proxies:
+                    self._roots_by_src[proxy.src.as_posix()] = root
+
+            logger.info(f"Deferring proxy generation for {len(self._jobs)} images.")
+
+            # Deferred results are only saved periodically. See
+            # ProxyGenerator._save().
+            atexit.register(self.close)
+
+            return
+
+        self.run_pending()
+
+    def run_pending(self) -> None:
+        """ Processes all pending jobs across the pool of worker processes. """
+
+        with self._lock:
+            jobs = {
+                root: job
+                for root, job in self._jobs.items()
+                if root not in self._in_progress
+            }
+
+        if not jobs:
+            return
+
+        logger.info(
+            f"Generating proxies for {len(jobs)} images with {self.workers} "
+            f"worker(s)."
+        )
+
+        for root, result in zip(jobs, self._map(list(jobs.values()))):
+            with self._lock:
+                self._update(root=root, result=result)
+
+        # Wait for any jobs being processed by a request or the warm-up.
+        for event in list(self._in_progress.values()):
+            event.wait()
+
+    def generate(self, src: str) -> bool:
+        """Processes the deferred job of the proxy image at 'src', relative to
+        the site's root, in the calling thread. Concurrent calls for any proxy
+        image of the same job wait for the first to finish. Returns whether
+        'src' was pending."""
+
+        with self._lock:
+
+            root = self._roots_by_src.get(src, None)
+
+            if root is None:
+                return False
+
+            event = self._in_progress.get(root, None)
+
+            if event is None:
+                event = threading.Event()
+                self._in_progress[root] = event
+                job = self._jobs[root]
+            else:
+                job = None
+
+        if job is None:
+            event.wait()
+            return True
+
+        try:
+
+            logger.debug(f"Generating deferred proxies for '{job['path']}'.")
+
+            result = generate_proxies(job)
+
+            with self._lock:
+                self._update(root=root, result=result)
+                self._save(force=not self._jobs)
+
+        finally:
+
+            with self._lock:
+                del self._in_progress[root]
+
+            event.set()
+
+        return True
+
+    def get_source(self, src: str) -> Optional[pathlib.Path]:
+        """Returns the path to the source image of the proxy image at 'src' if
+        it's pending. Used to serve the source image in its place."""
+
+        root = self._roots_by_src.get(src, None)
+
+        if root is None:
+            return None
+
+        return pathlib.Path(self._jobs[root]["path"])
+
+    def get_images(self, src: str) -> List["Image"]:
+        """Returns every Image sharing the deferred job of the proxy image at
+        'src' if it's pending. Their colors are updated once it's processed."""
+
+        root = self._roots_by_src.get(src, None)
+
+        if root is None:
+            return []
+
+        return list(self._images_by_root[root])
+
+    def warm_up(self, callback: Optional[Callable[[], None]] = None) -> None:
+        """Processes all deferred jobs on a background thread using the pool of
+        worker processes. Progress is logged periodically and is available via
+        ProxyGenerator.progress. 'callback' is called once all jobs have been
+        processed."""
+
+        with self._lock:
+
+            roots = [root for root in self._jobs if root not in self._in_progress]
+
+            for root in roots:
+                self._in_progress[root] = threading.Event()
+
+        self._warm_up_total = len(roots)
+        self._warm_up_done = 0
+        self._warm_up_start = time.perf_counter()
+        self._warm_up_end = None
+
+        if not roots:
+            return
+
+        logger.info(f"Warming up proxies for {len(roots)} images in the background.")
+
+        self._warm_up = threading.Thread(
+            target=self._run_warm_up,
+            kwargs={"roots": roots, "callback": callback},
+            name="easel-proxy-warm-up",
+            daemon=True,
+        )
+        self._warm_up.start()
+
+    def _run_warm_up(
+        self, roots: List[pathlib.Path], callback: Optional[Callable[[], None]]
+    ) -> None:
+
+        jobs = {root: self._jobs[root] for root in roots}
+
+        logged = time.perf_counter()
+
+        for root, result in self._imap_unordered(jobs):
+
+            with self._lock:
+
+                if result is not None:
+                    self._update(root=root, result=result)
+
+                self._in_progress.pop(root).set()
+
+                # Persist progress so a restart doesn't start over.
+                self._save()
+
+            self._warm_up_done += 1
+
+            if time.perf_counter() - logged >= Defaults.PROXY_WARM_UP_LOG_INTERVAL:
+
+                logged = time.perf_counter()
+
+                self._log_progress()
+
+        if self._closed is True:
+
+            # Release any requests waiting on jobs that were cancelled.
+            with self._lock:
+                for root in roots:
+                    event = self._in_progress.pop(root, None)
+                    if event is not None:
+                        event.set()
+
+            return
+
+        with self._lock:
+            self._save(force=True)
+
+        self._warm_up_end = time.perf_counter()
+
+        self._log_progress()
+
+        if callback is not None:
+            callback()
+
+    def close(self) -> None:
+        """Cancels any queued warm-up jobs and saves any results not yet saved
+        to the site-cache. Called on exit or when the generator is replaced by
+        a re-build. Jobs already running are left to finish."""
+
+        atexit.unregister(self.close)
+
+        self._closed = True
+
+        # Python 3.8 has no ProcessPoolExecutor.shutdown(cancel_futures=True).
+        for future in list(self._futures):
+            future.cancel()
+
+        with self._lock:
+            self._save(force=True)
+
+    def _save(self, force: bool = False) -> None:
+        """Saves the site-cache at most every Defaults.PROXY_SAVE_INTERVAL
+        seconds unless 'force' is True. Deferred jobs finish one at a time so
+        saving the whole manifest after each would be wasteful. Must be called
+        while holding the lock."""
+
+        now = time.perf_counter()
+
+        if force is False and now - self._saved < Defaults.PROXY_SAVE_INTERVAL:
+            return
+
+        self._saved = now
+
+        Globals.site_cache.save()
+
+    def _log_progress(self) -> None:
+
+        progress = self.progress
+
+        eta = f"{progress.eta:.0f}s" if progress.eta is not None else "unknown"
+
+        logger.info(
+            f"Warmed up proxies for {progress.done}/{progress.total} images "
+            f"({progress.percent}%). ETA: {eta}."
+        )
+
+    def _imap_unordered(
+        self, jobs: Dict[pathlib.Path, dict]
+    ) -> Iterator[Tuple[pathlib.Path, Optional[dict]]]:
+        """Returns the root and result of each job as it finishes. The result
+        of a job that fails is None leaving the job pending. Stops once the
+        generator is closed.
+
+        Only Defaults.PROXY_WARM_UP_QUEUE_SIZE jobs per worker are submitted
+        at a time. The pool's queue is drained before the interpreter exits so
+        submitting every job up front would block exiting until all of them
+        have been processed."""
+
+        workers = min(self.workers, len(jobs))
+
+        if workers <= 1:
+
+            for root, job in jobs.items():
+
+                if self._closed is True:
+                    return
+
+                yield root, self._get_result(job, lambda: generate_proxies(job))
+
+            return
+
+        queued = iter(jobs.items())
+        queue_size = workers * Defaults.PROXY_WARM_UP_QUEUE_SIZE
+
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+
+            while True:
+
+                while self._closed is False and len(self._futures) < queue_size:
+
+                    root, job = next(queued, (None, None))
+
+                    if root is None:
+                        break
+
+                    try:
+                        self._futures[executor.submit(generate_proxies, job)] = root
+                    except RuntimeError:
+                        # The interpreter is shutting down.
+                        self._closed = True
+
+                if not self._futures:
+                    return
+
+                done, _ = concurrent.futures.wait(
+                    self._futures, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+
+                for future in done:
+
+                    root = self._futures.pop(future)
+
+                    if future.cancelled():
+                        continue
+
+                    yield root, self._get_result(jobs[root], future.result)
+
+    @staticmethod
+    def _get_result(job: dict, function: Callable[[], dict]) -> Optional[dict]:
+
+        try:
+            return function()
+        except Exception as error:
+            logger.error(f"Failed generating proxies for '{job['path']}': {error}")
+            return None
+
+    @property
+    def progress(self) -> ProxyProgress:
+        """Returns the progress of the warm-up. Nothing has elapsed until a
+        warm-up is started."""
+
+        if self._warm_up_start is None:
+            return ProxyProgress(done=self._warm_up_done, total=self._warm_up_total)
+
+        end = self._warm_up_end
+        if end is None:
+            end = time.perf_counter()
+
+        return ProxyProgress(
+            done=self._warm_up_done,
+            total=self._warm_up_total,
+            elapsed=end - self._warm_up_start,
+        )
+
+    def _update(self, root: pathlib.Path, result: dict) -> None:
+        """Records the result of a job in the site-cache and in every Image
+        sharing its proxies. Must be called while holding the lock."""
+
+        job = self._jobs.pop(root)
+
+        image, *_ = self._images_by_root[root]
+
+        for proxy in image.proxy_images.all_proxies:
+            self._roots_by_src.pop(proxy.src.as_posix(), None)
+
+        for name, seconds in result["timings"].items():
+            Globals.timings.add(f"proxy {name}", seconds, item=str(image.src))
+
+        Globals.site_cache.update_proxies(
+            image.proxy_images.key,
+            images=[proxy["filename"] for proxy in job["images"]],
+        )
+
+        for image in self._images_by_root[root]:
+            image.proxy_colors.update(result["colors"])
+
+    @property
+    def pending(self) -> int:
+        """ Returns the number of jobs left to process. """
+        return len(self._jobs)
+
+    @staticmethod
+    def build_job(image: "Image", force: bool = False) -> Optional[dict]:
+        """ Returns a job for the Image or None if nothing is pending. """
+
+        pending_images = image.proxy_images.pending(force=force)
+        pending_colors = image.proxy_colors.pending(force=force)
+
+        if not pending_images and not pending_colors:
+            return None
+
+        # Variants are derived on demand so proxy images are compared by their
+        # filenames rather than their identity. See ProxyImage.variants.
+        pending_filenames = {proxy.filename for proxy in pending_images}
+
+        # NOTE: All proxy images are listed, even those that are not pending,
+        # as the colors are computed from the smallest one.
+        return {
+            "path": str(image.path),
+            "images": [
+                {
+                    "name": proxy.name,
+                    "filename": proxy.filename,
+                    "path": str(proxy.path),
+                    "size": proxy.size,
+                    "format": proxy.format,
+                    "quality": proxy.quality,
+                    "save": proxy.filename in pending_filenames,
+                }
+                for proxy in image.proxy_images.all_proxies
+            ],
+            "colors": [proxy.name for proxy in pending_colors],
+            "palette": Globals.theme_config.proxy_palette_size,
+        }
+
+    def _map(self, jobs: List[dict]) -> Iterable[dict]:
+
+        workers = min(self.workers, len(jobs))
+
+        if workers <= 1:
+            return map(generate_proxies, jobs)
+
+        # Send jobs in chunks to cut down on inter-process overhead while
+        # still leaving enough chunks to balance the load across workers.
+        chunksize = max(1, len(jobs) // (workers * 4))
+
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(generate_proxies, jobs, chunksize=chunksize))
+
+    @property
+    def workers(self) -> int:
+        return self._workers
+
+
+def generate_proxies(job: dict) -> dict:
+    """Processes a job built by ProxyGenerator.build_job(). The source image is
+    decoded once. Each proxy image is derived from the previous, larger one
+    and the colors are then computed from the smallest, already downscaled
+    image. Saves the pending proxy images and returns the generated colors
+    keyed by name along with the time spent on each:
+
+        {
+            "colors": {
+                "average": [list: [int, int, int]],
+                ...
+            },
+            "timings": {
+                "images": [float: seconds],
+                "colors": [float: seconds],
+            },
+        }
+
+    NOTE: This runs inside worker processes and therefore must not depend on
+    Globals or any other state from the parent process."""
+
+    start = time.perf_counter()
+
+    with PIL.Image.open(job["path"]) as image:
+
+        # JPEGs can be decoded at 1/2, 1/4 or 1/8 of their resolution. Request
+        # the smallest decode scale that still covers the largest proxy. This
+        # is a no-op for other formats.
+        if job["images"]:
+            image.draft("RGB", _get_draft_size(image.size, job["images"][0]["size"]))
+
+        image = image.convert("RGB")
+
+        # NOTE: The order of the proxies here matters. They are resized from
+        # largest to smallest, each one starting from the previous result.
+        # Variants follow their JPEG and share its size making thumbnail() a
+        # no-op for them.
+        for proxy in job["images"]:
+
+            image.thumbnail(proxy["size"])
+
+            if proxy["save"] is False:
+                continue
+
+            logger.debug(
+                f"Generating {proxy['size'][0]}px {proxy['format']} proxy image for "
+                f"'{job['path']}'."
+            )
+
+            os.makedirs(os.path.dirname(proxy["path"]), exist_ok=True)
+
+            # Write to a temporary file and replace the original so a proxy
+            # that's being served is never partially written.
+            with Utils.open_atomic(proxy["path"], "wb") as f:
+                image.save(f, format=proxy["format"], quality=proxy["quality"])
+
+        lap = time.perf_counter()
+
+        colors: Dict[str, List[int]] = {}
+
+        for name in job["colors"]:
+
+            logger.debug(f"Generating '{name}' color data for '{job['path']}'.")
+
+            if name == "palette":
+                colors[name] = _generate_palette(image, size=job["palette"])
+            else:
+                colors[name] = _COLOR_GENERATORS[name](image)
+
+    end = time.perf_counter()
+
+    return {
+        "colors": colors,
+        "timings": {
+            "images": lap - start,
+            "colors": end - lap,
+        },
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def _is_format_supported(format: str) -> bool:
+    """Returns whether this build of Pillow can save 'format'. Logs a warning
+    once for each unsupported format."""
+
+    PIL.Image.init()
+
+    if format in PIL.Image.SAVE:
+        return True
+
+    logger.warning(f"Skipping '{format}' proxy images. Not supported by Pillow.")
+
+    return False
+
+
+def get_proxy_formats() -> List[str]:
+    """Returns the names of the theme's 'proxies.formats' this build of Pillow
+    supports in order of preference. See Defaults.PROXY_IMAGE_FORMATS."""
+
+    formats = Globals.theme_config.proxy_formats
+
+    return [
+        name
+        for name, settings in Defaults.PROXY_IMAGE_FORMATS.items()
+        if name in formats and _is_format_supported(settings["format"])
+    ]
+
+
+def _get_draft_size(size: Tuple[int, int], box: Tuple[int, int]) -> Tuple[int, int]:
+    """Returns the size an image of 'size' will have once it's been fit inside
+    of 'box' with Image.thumbnail(). Passing this to Image.draft() as opposed
+    to 'box' allows the decoder to pick a smaller scale for images whose
+    aspect ratio differs from the box's."""
+
+    width, height = size
+
+    scale = min(box[0] / width, box[1] / height)
+
+    if scale >= 1:
+        return size
+
+    return (max(1, round(width * scale)), max(1, round(height * scale)))
+
+
+def _generate_color__average(image: PIL.Image.Image) -> List[int]:
+
+    stat = PIL.ImageStat.Stat(image)
+
+    return [round(value) for value in stat.mean]
+
+
+def _generate_color__dominant(image: PIL.Image.Image) -> List[int]:
+    """Returns the mean of the pixels in the most common bin of a coarse color
+    histogram. Binning groups together near-identical colors, e.g. noise and
+    JPEG artifacts, that counting exact colors would split apart. Each step is
+    a single call into Pillow keeping this faster than sorting exact colors.
+    Ties between bins are broken by the brightest bin."""
+
+    sample = _get_color_sample(image)
+
+    # ImageChops.add() returns floor((a + b) / scale). Adding the sample to
+    # itself bins each channel into Defaults.PROXY_COLOR_BITS bits.
+    coarse = PIL.ImageChops.add(sample, sample, scale=2 * _COLOR_BIN_WIDTH)
+
+    count, color = max(coarse.getcolors(sample.width * sample.height))
+
+    # Mask the pixels whose bin matches the dominant bin. Converting with this
+    # matrix maps a difference of zero to 255 and clips everything else to 0.
+    mask = PIL.ImageChops.difference(
+        coarse, PIL.Image.new("RGB", sample.size, color)
+    ).convert("L", _COLOR_MASK_MATRIX)
+
+    histogram = sample.histogram(mask)
+
+    return [
+        round(sum(map(operator.mul, range(256), channel)) / count)
+        for channel in (histogram[:256], histogram[256:512], histogram[512:])
+    ]
+
+
+def _generate_palette(image: PIL.Image.Image, size: int) -> List[List[int]]:
+    """Returns the 'size' most common colors of an image, most common first.
+    With NumPy the colors are clustered using k-means seeded from the most
+    common bins of a coarse color histogram. Otherwise Pillow's median cut is
+    used. See ProxyPalette."""
+
+    sample = _get_color_sample(image)
+
+    if numpy is not None:
+        palette = _get_palette__kmeans(sample, size=size)
+    else:
+        palette = _get_palette__median_cut(sample, size=size)
+
+    return palette + palette[-1:] * (size - len(palette))
+
+
+def _get_palette__kmeans(sample: PIL.Image.Image, size: int) -> List[List[int]]:
+
+    pixels = numpy.asarray(sample).reshape(-1, 3)
+    bins = _get_color_bins(pixels)
+
+    counts = numpy.bincount(bins)
+    seeds = numpy.argsort(-counts, kind="stable")[:size]
+    seeds = seeds[counts[seeds] > 0]
+
+    pixels = pixels.astype(numpy.float64)
+    centers = numpy.array([pixels[bins == seed].mean(axis=0) for seed in seeds])
+
+    for _ in range(Defaults.PROXY_PALETTE_ITERATIONS):
+
+        # Assign every pixel to its nearest center at once then move each
+        # center to the mean of its pixels.
+        distances = ((pixels[:, numpy.newaxis] - centers[numpy.newaxis]) ** 2).sum(
+            axis=2
+        )
+        labels = distances.argmin(axis=1)
+
+        counts = numpy.bincount(labels, minlength=len(centers))
+
+        sums = numpy.zeros_like(centers)
+        numpy.add.at(sums, labels, pixels)
+
+        filled = counts > 0
+        centers[filled] = sums[filled] / counts[filled, numpy.newaxis]
+
+    order = numpy.argsort(-counts, kind="stable")
+    order = order[counts[order] > 0]
+
+    return numpy.rint(centers[order]).astype(int).tolist()
+
+
+def _get_palette__median_cut(sample: PIL.Image.Image, size: int) -> List[List[int]]:
+
+    quantized = sample.quantize(colors=size, method=PIL.Image.MEDIANCUT)
+
+    palette = quantized.getpalette()
+    colors = sorted(quantized.getcolors(size), key=lambda item: (-item[0], item[1]))
+
+    return [palette[index * 3 : index * 3 + 3] for _, index in colors]
+
+
+def _get_color_sample(image: PIL.Image.Image) -> PIL.Image.Image:
+    """Returns a copy of 'image' no larger than Defaults.PROXY_COLOR_SAMPLE_SIZE.
+    Image.reduce() averages each block of pixels which is both faster than
+    Image.resize() and less noisy than nearest neighbour resampling."""
+
+    factor = max(1, max(image.size) // Defaults.PROXY_COLOR_SAMPLE_SIZE)
+
+    return image.reduce(factor)
+
+
+def _get_color_bins(pixels: "numpy.ndarray") -> "numpy.ndarray":
+    """ Returns the histogram bin of each pixel in an (N, 3) array of pixels. """
+
+    bits = Defaults.PROXY_COLOR_BITS
+
+    coarse = pixels.astype(numpy.intp) >> (8 - bits)
+
+    return (coarse[:, 0] << (bits * 2)) | (coarse[:, 1] << bits) | coarse[:, 2]
+
+
+# The width of each channel's histogram bin.
+_COLOR_BIN_WIDTH = 2 ** (8 - Defaults.PROXY_COLOR_BITS)
+
+# Maps an RGB difference of zero to a grayscale 255 and anything else to 0.
+_COLOR_MASK_MATRIX = (-255, -255, -255, 255)
+
+
+_COLOR_GENERATORS = {
+    "average": _generate_color__average,
+    "dominant": _generate_color__dominant,
+}
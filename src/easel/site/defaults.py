@@ -15,7 +15,9 @@ class Defaults:
 
     DIRECTORY_NAME_BUILD: str = "build"
     DIRECTORY_NAME_CONTENTS: str = "contents"
+    DIRECTORY_NAME_MARKDOWN: str = "markdown"
     DIRECTORY_NAME_PAGES: str = "pages"
+    DIRECTORY_NAME_PROXIES: str = "proxies"
     DIRECTORY_NAME_SITE_CACHE: str = "site-cache"
     DIRECTORY_NAME_STATIC: str = "static"
     DIRECTORY_NAME_TEMPLATES: str = "templates"
@@ -26,6 +28,11 @@ class Defaults:
     FILENAME_THEME_YAML: str = "theme.yaml"
     FILENAME_TEMPLATE_MAIN_HTML: str = "main.html"
     FILENAME_TEMPLATE_404_HTML: str = "404.html"
+    FILENAME_SITE_CACHE_MANIFEST: str = "manifest.json"
+    FILENAME_SITE_CACHE_LOCK: str = "manifest.lock"
+    FILENAME_SITE_CACHE_SNAPSHOT: str = "snapshot.pickle"
+    FILENAME_SITE_CACHE_PROFILE: str = "build-profile.json"
+    FILENAME_BUILD_MANIFEST: str = ".easel-manifest.json"
 
     DATE_SEPARATOR: str = "-"
 
@@ -54,18 +61,78 @@ class Defaults:
 
     PROXY_IMAGE_FORMAT: str = "JPEG"
     PROXY_IMAGE_QUALITY: int = 95
-    PROXY_IMAGE_SMALL = {
-        "name": "small",
-        "size": (256, 256),
-    }
-    PROXY_IMAGE_MEDIUM = {
-        "name": "medium",
-        "size": (512, 512),
-    }
-    PROXY_IMAGE_LARGE = {
-        "name": "large",
-        "size": (1024, 1024),
+    PROXY_IMAGE_EXTENSION: str = ".jpg"
+    PROXY_IMAGE_MIMETYPE: str = "image/jpeg"
+
+    # Formats that can be generated in addition to the default JPEG proxies.
+    # Listed in order of preference when negotiating which one to serve.
+    PROXY_IMAGE_FORMATS: Dict[str, dict] = {
+        "avif": {
+            "format": "AVIF",
+            "extension": ".avif",
+            "mimetype": "image/avif",
+            "quality": 60,
+        },
+        "webp": {
+            "format": "WEBP",
+            "extension": ".webp",
+            "mimetype": "image/webp",
+            "quality": 80,
+        },
     }
+    VALID_PROXY_IMAGE_FORMATS: Tuple[str, ...] = tuple(PROXY_IMAGE_FORMATS)
+    DEFAULT_PROXY_IMAGE_FORMATS: List[str] = ["webp"]
+    # The default ladder of proxy image sizes. Each 'size' is the box in pixels
+    # the proxy image is fit inside of. Themes can replace it via the
+    # 'proxies.sizes' entry in their 'theme.yaml'.
+    DEFAULT_PROXY_IMAGE_SIZES: List[dict] = [
+        {"name": "large", "size": 1024},
+        {"name": "medium", "size": 512},
+        {"name": "small", "size": 256},
+    ]
+
+    # Proxy colors are computed from a box-downsampled copy of the smallest
+    # proxy image no larger than this many pixels.
+    PROXY_COLOR_SAMPLE_SIZE: int = 32
+    # Bits per channel of the color histogram used to find the dominant color
+    # and to seed the palette. 4 bits per channel results in 4096 bins.
+    PROXY_COLOR_BITS: int = 4
+    # k-means iterations when generating a palette with NumPy.
+    PROXY_PALETTE_ITERATIONS: int = 8
+    # The number of colors in each image's palette. 0 disables palettes.
+    DEFAULT_PROXY_PALETTE_SIZE: int = 0
+    PROXY_PALETTE_SIZE_MAX: int = 256
+
+    # Seconds between logging the progress of a proxy warm-up.
+    PROXY_WARM_UP_LOG_INTERVAL: float = 5.0
+    # Jobs queued per worker process during a proxy warm-up.
+    PROXY_WARM_UP_QUEUE_SIZE: int = 2
+    # Seconds between saving the site-cache while deferred proxies are being
+    # generated. Anything unsaved is saved on exit.
+    PROXY_SAVE_INTERVAL: float = 5.0
+
+    RENDER_CACHE_SIZE: int = 512
+    MARKDOWN_CACHE_SIZE: int = 256
+
+    METRICS_URL: str = "/_easel/metrics"
+    METRICS_CONTENT_TYPE: str = "text/plain; version=0.0.4; charset=utf-8"
+    METRICS_BUCKETS: Tuple[float, ...] = (
+        0.0005,
+        0.001,
+        0.0025,
+        0.005,
+        0.01,
+        0.025,
+        0.05,
+        0.1,
+        0.25,
+        0.5,
+        1.0,
+        2.5,
+    )
+    METRICS_PHASE_TEMPLATE: str = "template"
+    METRICS_PHASE_MARKDOWN: str = "markdown"
+    METRICS_PHASE_FILTERS: str = "filters"
 
     DEFAULT_THEME_NAME_BUILTIN: str = "sorolla"
     VALID_THEME_NAMES_BUILTIN = [
@@ -153,6 +220,7 @@ class Key:
     DESCRIPTION: str = "description"
     EMBEDDED: str = "embedded"
     EXTRAS: str = "extras"
+    FORMATS: str = "formats"
     FAVICON: str = "favicon"
     HEADER: str = "header"
     HEIGHT: str = "height"
@@ -172,12 +240,22 @@ class Key:
     MENU: str = "menu"
     NAME: str = "name"
     OPTIONS: str = "options"
+    PALETTE: str = "palette"
     PATH: str = "path"
+    PROXIES: str = "proxies"
+    QUALITY: str = "quality"
     SHOW_CAPTIONS: str = "show-captions"
     SITE_DEBUG: str = "SITE_DEBUG"
+    SITE_FROM_SNAPSHOT: str = "SITE_FROM_SNAPSHOT"
+    SITE_LAZY_PROXIES: str = "SITE_LAZY_PROXIES"
+    SITE_METRICS: str = "SITE_METRICS"
+    SITE_PROFILE: str = "SITE_PROFILE"
     SITE_ROOT: str = "SITE_ROOT"
     SITE_TESTING: str = "SITE_TESTING"
+    SITE_WARM_PROXIES: str = "SITE_WARM_PROXIES"
+    SITE_WORKERS: str = "SITE_WORKERS"
     SIZE: str = "size"
+    SIZES: str = "sizes"
     SPACER: str = "spacer"
     TEXT: str = "text"
     TEXT_BLOCK: str = "text-block"
@@ -1,15 +1,22 @@
 import abc
+import concurrent.futures
+import datetime
 import glob
+import hashlib
 import importlib
 import importlib.util
 import json
 import logging
+import os
 import pathlib
-from typing import Any, Generator, List, Optional, Union
+import pickle
+import sys
+from typing import Any, Dict, Generator, Iterable, List, Optional, Tuple, Union
 
+from .. import __version__
 from .defaults import Defaults, Key
 from .errors import SiteConfigError, ThemeConfigError
-from .helpers import SafeDict, Utils
+from .helpers import SafeDict, Timings, Utils
 
 
 logger = logging.getLogger(__name__)
@@ -20,30 +27,49 @@ class _Globals:
 
         self._site_paths = SitePaths(self)
         self._site_config = SiteConfig(self)
+        self._site_cache = SiteCache(self)
         self._theme_paths = ThemePaths(self)
         self._theme_config = ThemeConfig(self)
 
+        self._workers: int = os.cpu_count() or 1
+        self._profile: bool = False
+        self._lazy_proxies: bool = False
+        self._warm_proxies: bool = False
+        self._timings = Timings()
+
     def init(self, root: Optional[Union[pathlib.Path, str]]):
 
-        # The site's root directory is first set.
-        self.site_paths.load(root=root)
+        self.timings.reset()
+
+        with self.timings.phase("init"):
+
+            # The site's root directory is first set.
+            self.site_paths.load(root=root)
+
+            # Using the site's root directory, the site-cache's manifest is
+            # loaded.
+            self.site_cache.load()
+
+        with self.timings.phase("config"):
 
-        # Using the site's root directory, the 'site.yaml' is loaded and merged
-        # with the default site config creating the final site config.
-        self.site_config.load()
+            # Using the site's root directory, the 'site.yaml' is loaded and
+            # merged with the default site config creating the final site
+            # config.
+            self.site_config.load()
 
-        # Using the 'theme' entry from the 'site.yaml', the theme's root
-        # directory is determined.
-        self.theme_paths.load()
+            # Using the 'theme' entry from the 'site.yaml', the theme's root
+            # directory is determined.
+            self.theme_paths.load()
 
-        # Using the theme's root directory, the 'theme.yaml' is loaded and
-        # merged with the 'theme' entry from the 'site.yaml' creating the final
-        # theme config.
-        self.theme_config.load()
+            # Using the theme's root directory, the 'theme.yaml' is loaded and
+            # merged with the 'theme' entry from the 'site.yaml' creating the
+            # final theme config.
+            self.theme_config.load()
 
     def reset(self) -> None:
         self.site_paths.reset()
         self.site_config.reset()
+        self.site_cache.reset()
         self.theme_paths.reset()
         self.theme_config.reset()
 
@@ -55,6 +81,10 @@ class _Globals:
     def site_config(self) -> "SiteConfig":
         return self._site_config
 
+    @property
+    def site_cache(self) -> "SiteCache":
+        return self._site_cache
+
     @property
     def theme_paths(self) -> "ThemePaths":
         return self._theme_paths
@@ -79,6 +109,57 @@ class _Globals:
     def testing(self, value: bool) -> None:
         self._testing = value
 
+    @property
+    def timings(self) -> "Timings":
+        """ Returns the durations of each phase of the last build. """
+        return self._timings
+
+    @property
+    def profile(self) -> bool:
+        """Returns whether a summary of the build's timings is logged and
+        written to the site-cache. See Site.build()."""
+        return self._profile
+
+    @profile.setter
+    def profile(self, value: bool) -> None:
+        self._profile = value
+
+    @property
+    def lazy_proxies(self) -> bool:
+        """Returns whether proxies are generated on their first request rather
+        than during Site.build(). See ProxyGenerator."""
+        return self._lazy_proxies
+
+    @lazy_proxies.setter
+    def lazy_proxies(self, value: bool) -> None:
+        self._lazy_proxies = value
+
+    @property
+    def warm_proxies(self) -> bool:
+        """Returns whether proxies are generated in the background after
+        Site.build(). Until then, the source image is served in place of each
+        proxy image. See ProxyGenerator.warm_up()."""
+        return self._warm_proxies
+
+    @warm_proxies.setter
+    def warm_proxies(self, value: bool) -> None:
+        self._warm_proxies = value
+
+    @property
+    def workers(self) -> int:
+        """ Returns the number of processes used to generate proxies. """
+        return self._workers
+
+    @workers.setter
+    def workers(self, value: int) -> None:
+
+        if type(value) is not int or value < 1:
+            raise SiteConfigError(
+                f"Expected a positive integer for 'workers' got '{value}'."
+            )
+
+        self._workers = value
+
 
 class GlobalsBase(abc.ABC):
     def __init__(self, globals: "_Globals", /):
@@ -183,6 +264,11 @@ class SitePaths(GlobalsBase):
         """ Returns /absolute/path/to/site-name/site-cache """
         return self.root / Defaults.DIRECTORY_NAME_SITE_CACHE
 
+    @property
+    def build(self) -> pathlib.Path:
+        """ Returns /absolute/path/to/site-name/build """
+        return self.root / Defaults.DIRECTORY_NAME_BUILD
+
     @property
     def assets(self) -> List[str]:
         """Returns a list of paths pointing to all the sub-directories and
@@ -334,6 +420,564 @@ class SiteConfig(GlobalsBase):
         return self.__config[Key.THEME][Key.PATH]
 
 
+class SiteCache(GlobalsBase):
+    """Manages the site-cache's manifest, a JSON file persisting the results of
+    the previous build so a restart only re-processes what has changed:
+
+        {
+            "version": [int: 2],
+            "sources": {
+                "contents/pages/page-name/image.jpg": {
+                    "fingerprint": [list: [size, mtime, inode]],
+                    "digest": [str: None],
+                },
+                ...
+            },
+            "pages": {
+                "contents/pages/page-name": {
+                    "fingerprints": {
+                        "contents/pages/page-name/page.yaml": [list: [...]],
+                        "contents/pages/page-name": [list: [...]],
+                        ...
+                    },
+                    "config": [dict?: None],
+                    "contents": [list?: None],
+                },
+                ...
+            },
+            "proxies": {
+                "key": {
+                    "images": [list: []],
+                    "colors": [dict: {}],
+                },
+                ...
+            },
+        }
+
+    A file's contents are only re-hashed when its fingerprint changes. Proxies
+    are keyed on these digests, see BaseProxyManager.key. A page's entry is
+    discarded as soon as any of its tracked paths has changed. Tracking a
+    directory catches files being added, removed or renamed within it.
+
+    Rendered Markdown files are stored outside of the manifest in the
+    site-cache's 'markdown' directory, see _Markdown.from_file(). A pickled
+    snapshot of the built Site can be stored in 'snapshot.pickle', see
+    Site.build()."""
+
+    VERSION: int = 2
+    VERSION_SNAPSHOT: int = 1
+
+    SECTIONS: Tuple[str, ...] = (
+        "sources",
+        "pages",
+        "proxies",
+    )
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.reset()
+
+    def load(self) -> None:
+
+        self.reset()
+
+        self._loaded = True
+
+        self._manifest.update(self._read())
+
+    def _read(self) -> Dict[str, dict]:
+        """ Returns the sections of the manifest currently on disk. """
+
+        try:
+            with open(self.path, "r") as f:
+                manifest = json.load(f, object_hook=self._decode)
+        except (FileNotFoundError, json.decoder.JSONDecodeError):
+            return {}
+
+        if type(manifest) is not dict or manifest.get("version") != self.VERSION:
+            logger.debug(f"Ignoring outdated or invalid manifest {self.path}.")
+            return {}
+
+        return {
+            section: manifest[section]
+            for section in self.SECTIONS
+            if type(manifest.get(section)) is dict
+        }
+
+    def reset(self) -> None:
+        self._manifest: Dict[str, dict] = {section: {} for section in self.SECTIONS}
+        self._touched: Dict[str, set] = {section: set() for section in self.SECTIONS}
+        self._touched_markdown: set = set()
+        self._validated: set = set()
+        self._dirty: bool = False
+        self._loaded: bool = False
+
+    def validate(self) -> None:
+        pass
+
+    def save(self, prune: bool = False) -> None:
+        """Writes the manifest to the site-cache if it has changed. If 'prune'
+        is True, entries and rendered Markdown files that were not accessed
+        since loading are dropped.
+
+        Other processes e.g. multiple gunicorn workers generating lazy proxies
+        might have written to the manifest since it was loaded. Their entries
+        are merged in under a file lock before writing so that the last writer
+        doesn't drop them. See SiteCache._merge()."""
+
+        if prune is False and self._dirty is False:
+            return
+
+        self.root.mkdir(parents=True, exist_ok=True)
+
+        with Utils.lock_file(self.path_lock):
+
+            self._merge(self._read())
+
+            if prune is True:
+
+                self._prune_markdown()
+
+                for section in self.SECTIONS:
+
+                    entries = self._manifest[section]
+                    untouched = set(entries) - self._touched[section]
+
+                    for key in untouched:
+                        del entries[key]
+
+                    self._dirty = self._dirty or bool(untouched)
+
+            if self._dirty is False:
+                return
+
+            manifest = {
+                "version": self.VERSION,
+                **self._manifest,
+            }
+
+            # Write to a temporary file first so concurrent readers never see a
+            # partially written manifest.
+            with Utils.open_atomic(self.path, "w") as f:
+                json.dump(manifest, f, default=self._encode)
+
+        self._dirty = False
+
+    def _merge(self, manifest: Dict[str, dict]) -> None:
+        """Merges the entries of 'manifest' missing from the manifest in memory.
+        Entries in memory take precedence except for proxies, whose images and
+        colors are combined as they're keyed on the contents of their source
+        image. Merged entries are only ever validated on access, like any
+        loaded entry, so merging a stale entry is harmless."""
+
+        for section, entries in manifest.items():
+
+            current = self._manifest[section]
+
+            for key, entry in entries.items():
+
+                if key not in current:
+                    current[key] = entry
+                    continue
+
+                if section != "proxies" or type(entry) is not dict:
+                    continue
+
+                current[key]["images"] = sorted(
+                    {*current[key]["images"], *entry.get("images", [])}
+                )
+                current[key]["colors"] = {
+                    **entry.get("colors", {}),
+                    **current[key]["colors"],
+                }
+
+    def prefetch_digests(
+        self, paths: Iterable[pathlib.Path], workers: Optional[int] = None
+    ) -> None:
+        """Computes the digests of every file in 'paths' whose fingerprint has
+        changed across a pool of 'workers' threads, defaulting to
+        Globals.workers. hashlib releases the GIL while hashing so a cold
+        site-cache doesn't hash every file serially. The digests are then
+        returned by get_digest(). Missing files are skipped."""
+
+        pending: Dict[str, Tuple[pathlib.Path, List[int]]] = {}
+
+        for path in paths:
+
+            key = self._get_key(path)
+
+            if key in pending:
+                continue
+
+            try:
+                fingerprint = Utils.get_fingerprint(path)
+            except FileNotFoundError:
+                continue
+
+            source = self._manifest["sources"].get(key, None)
+
+            if source is not None and source.get("fingerprint") == fingerprint:
+                continue
+
+            pending[key] = (path, fingerprint)
+
+        if not pending:
+            return
+
+        logger.debug(f"Hashing contents of {len(pending)} files.")
+
+        workers = workers if workers is not None else self.globals.workers
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+
+            digests = executor.map(
+                Utils.get_digest, [path for path, _ in pending.values()]
+            )
+
+            for (key, (_, fingerprint)), digest in zip(pending.items(), digests):
+                self._manifest["sources"][key] = {
+                    "fingerprint": fingerprint,
+                    "digest": digest,
+                }
+
+        self._dirty = True
+
+    def get_digest(self, path: pathlib.Path) -> str:
+        """Returns the digest of a file's contents. The digest is reused from
+        the manifest if the file's fingerprint hasn't changed."""
+
+        key = self._get_key(path)
+        fingerprint = Utils.get_fingerprint(path)
+
+        self._touched["sources"].add(key)
+
+        source = self._manifest["sources"].get(key, None)
+
+        if source is not None and source.get("fingerprint") == fingerprint:
+            return source["digest"]
+
+        logger.debug(f"Hashing contents of {path}.")
+
+        digest = Utils.get_digest(path)
+
+        self._manifest["sources"][key] = {
+            "fingerprint": fingerprint,
+            "digest": digest,
+        }
+        self._dirty = True
+
+        return digest
+
+    def get_page(self, path: pathlib.Path) -> Optional[dict]:
+        """Returns the manifest entry for a page directory or None if any of
+        its tracked paths have changed since it was recorded."""
+
+        # Pages can be created without a site e.g. while testing.
+        if self._loaded is False:
+            return None
+
+        key = self._get_key(path)
+
+        self._touched["pages"].add(key)
+
+        entry = self._manifest["pages"].get(key, None)
+
+        if entry is None:
+            return None
+
+        if key in self._validated:
+            return entry
+
+        for path_tracked, fingerprint in entry.get("fingerprints", {}).items():
+
+            try:
+                fingerprint_current = Utils.get_fingerprint(
+                    self.globals.site_paths.root / path_tracked
+                )
+            except FileNotFoundError:
+                fingerprint_current = None
+
+            if fingerprint_current != fingerprint:
+                logger.debug(f"Page {path} has changed since the last build.")
+                del self._manifest["pages"][key]
+                self._dirty = True
+                return None
+
+        self._validated.add(key)
+
+        return entry
+
+    def update_page(
+        self, path: pathlib.Path, tracked: Iterable[pathlib.Path], **values
+    ) -> None:
+        """Records 'values' for a page directory along with the fingerprints
+        of the 'tracked' paths its values were derived from. Values that can't
+        be serialized to JSON are skipped."""
+
+        if self._loaded is False:
+            return
+
+        key = self._get_key(path)
+
+        self._touched["pages"].add(key)
+        self._validated.add(key)
+
+        entry = self._manifest["pages"].setdefault(key, {"fingerprints": {}})
+
+        for path_tracked in tracked:
+            entry["fingerprints"][self._get_key(path_tracked)] = Utils.get_fingerprint(
+                path_tracked
+            )
+
+        for name, value in values.items():
+
+            try:
+                json.dumps(value, default=self._encode)
+            except TypeError:
+                logger.debug(f"Skipping caching '{name}' for page {path}.")
+                continue
+
+            entry[name] = value
+
+        self._dirty = True
+
+    def get_proxies(self, key: str) -> dict:
+        """Returns the manifest entry for the set of proxies stored under 'key'
+        containing the names of the generated proxy images and the colors."""
+
+        self._touched["proxies"].add(key)
+
+        entry = self._manifest["proxies"].get(key, {})
+
+        return {
+            "images": entry.get("images", []),
+            "colors": entry.get("colors", {}),
+        }
+
+    def update_proxies(
+        self,
+        key: str,
+        images: Optional[Iterable[str]] = None,
+        colors: Optional[Dict[str, List[int]]] = None,
+    ) -> None:
+
+        self._touched["proxies"].add(key)
+
+        entry = self._manifest["proxies"].setdefault(key, {"images": [], "colors": {}})
+
+        if images is not None:
+            entry["images"] = sorted({*entry["images"], *images})
+
+        if colors is not None:
+            entry["colors"].update(colors)
+
+        self._dirty = True
+
+    def get_markdown(self, key: str) -> Optional[str]:
+        """Returns the rendered Markdown stored under 'key' or None if it was
+        never stored. See _Markdown.from_file()."""
+
+        if self._loaded is False:
+            return None
+
+        self._touched_markdown.add(key)
+
+        try:
+            with open(self._get_markdown_path(key), "r", encoding="utf-8") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def update_markdown(self, key: str, html: str) -> None:
+
+        if self._loaded is False:
+            return
+
+        self._touched_markdown.add(key)
+
+        path = self._get_markdown_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # See SiteCache.save().
+        with Utils.open_atomic(path, "w", encoding="utf-8") as f:
+            f.write(html)
+
+    def touch_markdown(self, key: str) -> None:
+        """Marks the rendered Markdown stored under 'key' as in use without
+        reading it. Markdown is only rendered once a page is so the Site marks
+        every Markdown file it contains while building. See save()."""
+
+        self._touched_markdown.add(key)
+
+    def _prune_markdown(self) -> None:
+        """ Removes the rendered Markdown files that weren't accessed. """
+
+        if self._loaded is False or not self.markdown.exists():
+            return
+
+        for path in self.markdown.glob("*/*.html"):
+
+            if path.stem in self._touched_markdown:
+                continue
+
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                continue
+
+    def get_snapshot(self) -> Optional[Any]:
+        """Returns the snapshot stored with update_snapshot() or None if it's
+        missing, was written by another version or any of its inputs have
+        changed. Only the snapshot's header is read to validate it."""
+
+        try:
+            with open(self.snapshot, "rb") as f:
+
+                header = pickle.load(f)
+
+                if not self._is_valid_snapshot(header):
+                    return None
+
+                return pickle.load(f)
+
+        except FileNotFoundError:
+            return None
+        except Exception as error:
+            logger.debug(f"Ignoring unreadable snapshot {self.snapshot}: {error}")
+            return None
+
+    def update_snapshot(self, inputs: Iterable[pathlib.Path], value: Any) -> None:
+        """Pickles 'value' to the site-cache along with the fingerprints of the
+        'inputs' it was built from."""
+
+        fingerprints: Dict[str, Optional[List[int]]] = {}
+
+        for path in inputs:
+            try:
+                fingerprints[str(path)] = Utils.get_fingerprint(path)
+            except FileNotFoundError:
+                fingerprints[str(path)] = None
+
+        header = {
+            "version": self.VERSION_SNAPSHOT,
+            "easel": __version__,
+            "python": sys.version,
+            "root": str(self.globals.site_paths.root),
+            "theme": self.globals.theme_config.digest,
+            "fingerprints": fingerprints,
+        }
+
+        self.root.mkdir(parents=True, exist_ok=True)
+
+        # See SiteCache.save().
+        with Utils.open_atomic(self.snapshot, "wb") as f:
+            pickle.dump(header, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def save_profile(self, profile: dict) -> None:
+        """ Writes the build's timings to the site-cache as JSON. """
+
+        self.root.mkdir(parents=True, exist_ok=True)
+
+        # See SiteCache.save().
+        with Utils.open_atomic(self.profile, "w") as f:
+            json.dump(profile, f, indent=4)
+
+    def _is_valid_snapshot(self, header: Any) -> bool:
+
+        if type(header) is not dict:
+            return False
+
+        if (
+            header.get("version") != self.VERSION_SNAPSHOT
+            or header.get("easel") != __version__
+            or header.get("python") != sys.version
+            or header.get("root") != str(self.globals.site_paths.root)
+            or header.get("theme") != self.globals.theme_config.digest
+        ):
+            logger.debug(f"Ignoring outdated snapshot {self.snapshot}.")
+            return False
+
+        for path, fingerprint in header.get("fingerprints", {}).items():
+
+            try:
+                fingerprint_current = Utils.get_fingerprint(pathlib.Path(path))
+            except FileNotFoundError:
+                fingerprint_current = None
+
+            if fingerprint_current != fingerprint:
+                logger.debug(f"Ignoring snapshot. {path} has changed.")
+                return False
+
+        return True
+
+    def _get_markdown_path(self, key: str) -> pathlib.Path:
+        return self.markdown / key[:2] / f"{key}.html"
+
+    def _get_key(self, path: pathlib.Path) -> str:
+        return str(path.relative_to(self.globals.site_paths.root))
+
+    @staticmethod
+    def _encode(value: Any) -> dict:
+        """Encodes the dates and datetimes PyYAML parses from config files.
+        See SiteCache._decode()."""
+
+        if isinstance(value, datetime.datetime):
+            return {"__datetime__": value.isoformat()}
+
+        if isinstance(value, datetime.date):
+            return {"__date__": value.isoformat()}
+
+        raise TypeError(f"Object of type '{type(value).__name__}' is not supported.")
+
+    @staticmethod
+    def _decode(value: dict) -> Any:
+
+        if "__datetime__" in value:
+            return datetime.datetime.fromisoformat(value["__datetime__"])
+
+        if "__date__" in value:
+            return datetime.date.fromisoformat(value["__date__"])
+
+        return value
+
+    @property
+    def root(self) -> pathlib.Path:
+        """ Returns /absolute/path/to/site-name/site-cache """
+        return self.globals.site_paths.cache
+
+    @property
+    def path(self) -> pathlib.Path:
+        """ Returns /absolute/path/to/site-name/site-cache/manifest.json """
+        return self.root / Defaults.FILENAME_SITE_CACHE_MANIFEST
+
+    @property
+    def path_lock(self) -> pathlib.Path:
+        """ Returns /absolute/path/to/site-name/site-cache/manifest.lock """
+        return self.root / Defaults.FILENAME_SITE_CACHE_LOCK
+
+    @property
+    def proxies(self) -> pathlib.Path:
+        """ Returns /absolute/path/to/site-name/site-cache/proxies """
+        return self.root / Defaults.DIRECTORY_NAME_PROXIES
+
+    @property
+    def profile(self) -> pathlib.Path:
+        """ Returns /absolute/path/to/site-name/site-cache/build-profile.json """
+        return self.root / Defaults.FILENAME_SITE_CACHE_PROFILE
+
+    @property
+    def snapshot(self) -> pathlib.Path:
+        """ Returns /absolute/path/to/site-name/site-cache/snapshot.pickle """
+        return self.root / Defaults.FILENAME_SITE_CACHE_SNAPSHOT
+
+    @property
+    def markdown(self) -> pathlib.Path:
+        """ Returns /absolute/path/to/site-name/site-cache/markdown """
+        return self.root / Defaults.DIRECTORY_NAME_MARKDOWN
+
+
 class ThemePaths(GlobalsBase):
 
     _root: Optional[pathlib.Path] = None
@@ -498,9 +1142,20 @@ class ThemeConfig(GlobalsBase):
 
     __config = {}
 
+    # fmt:off
+    _config_builtin = {
+        Key.PROXIES: {
+            Key.FORMATS: Defaults.DEFAULT_PROXY_IMAGE_FORMATS,
+            Key.SIZES: Defaults.DEFAULT_PROXY_IMAGE_SIZES,
+            Key.PALETTE: Defaults.DEFAULT_PROXY_PALETTE_SIZE,
+        },
+    }
+    # fmt:on
     _config_default = {}
     _config_user = {}
 
+    _proxy_sizes: List[dict] = []
+
     def load(self) -> None:
 
         # Load the 'theme.yaml' from the theme root.
@@ -511,14 +1166,20 @@ class ThemeConfig(GlobalsBase):
         # Grab the 'theme' entry from the 'site.yaml'.
         self._config_user = self.globals.site_config.theme
 
-        self.validate()
-
         # Merge the 'theme' entry from the 'site.yaml' with the default
-        # 'theme.yaml' and set the combined dictionary as the site's config.
+        # 'theme.yaml' and Easel's built-in theme config and set the combined
+        # dictionary as the site's config.
         self.__config = Utils.update_dict(
-            original=self._config_default, updates=self._config_user
+            original=Utils.update_dict(
+                original=self._config_builtin, updates=self._config_default
+            ),
+            updates=self._config_user,
         )
 
+        self.validate()
+
+        self._proxy_sizes = self._load_proxy_sizes()
+
         # DEBUGGING
         # logger.debug(json.dumps(self.__config, indent=4))
 
@@ -526,9 +1187,148 @@ class ThemeConfig(GlobalsBase):
         self.__config = {}
         self._config_default = {}
         self._config_user = {}
+        self._proxy_sizes = []
 
     def validate(self) -> None:
-        pass
+
+        proxies = self.__config[Key.PROXIES]
+
+        if type(proxies) is not dict:
+            raise ThemeConfigError(
+                f"Expected type 'dict' for '{Key.PROXIES}' got "
+                f"'{type(proxies).__name__}'."
+            )
+
+        formats = proxies[Key.FORMATS]
+
+        if type(formats) is not list:
+            raise ThemeConfigError(
+                f"Expected type 'list' for '{Key.PROXIES}.{Key.FORMATS}' got "
+                f"'{type(formats).__name__}'."
+            )
+
+        for name in formats:
+            if name not in Defaults.VALID_PROXY_IMAGE_FORMATS:
+                raise ThemeConfigError(
+                    f"Unsupported proxy image format '{name}'. Expected one of "
+                    f"{list(Defaults.VALID_PROXY_IMAGE_FORMATS)}."
+                )
+
+        sizes = proxies[Key.SIZES]
+
+        if type(sizes) is not list or not sizes:
+            raise ThemeConfigError(
+                f"Expected a non-empty 'list' for '{Key.PROXIES}.{Key.SIZES}' got "
+                f"'{sizes}'."
+            )
+
+        names = set()
+
+        for entry in sizes:
+
+            if type(entry) is not dict:
+                raise ThemeConfigError(
+                    f"Expected type 'dict' for each entry in "
+                    f"'{Key.PROXIES}.{Key.SIZES}' got '{type(entry).__name__}'."
+                )
+
+            name = entry.get(Key.NAME, None)
+
+            # Names are used as filenames and accessed as attributes in
+            # templates e.g. 'content.proxy_images.medium'.
+            if type(name) is not str or not name.isidentifier() or name[0] == "_":
+                raise ThemeConfigError(
+                    f"Expected a valid identifier for '{Key.NAME}' in "
+                    f"'{Key.PROXIES}.{Key.SIZES}' got '{name}'."
+                )
+
+            if name in names:
+                raise ThemeConfigError(
+                    f"Duplicate proxy image size '{name}' in "
+                    f"'{Key.PROXIES}.{Key.SIZES}'."
+                )
+
+            names.add(name)
+
+            size = entry.get(Key.SIZE, None)
+
+            if type(size) is not int or size <= 0:
+                raise ThemeConfigError(
+                    f"Expected a positive 'int' for '{Key.SIZE}' of proxy image "
+                    f"size '{name}' got '{size}'."
+                )
+
+            quality = entry.get(Key.QUALITY, Defaults.PROXY_IMAGE_QUALITY)
+
+            if type(quality) is not int or not 1 <= quality <= 100:
+                raise ThemeConfigError(
+                    f"Expected an 'int' between 1 and 100 for '{Key.QUALITY}' of "
+                    f"proxy image size '{name}' got '{quality}'."
+                )
+
+        palette = proxies[Key.PALETTE]
+
+        if (
+            type(palette) is not int
+            or not 0 <= palette <= Defaults.PROXY_PALETTE_SIZE_MAX
+        ):
+            raise ThemeConfigError(
+                f"Expected an 'int' between 0 and {Defaults.PROXY_PALETTE_SIZE_MAX} "
+                f"for '{Key.PROXIES}.{Key.PALETTE}' got '{palette}'."
+            )
+
+    def _load_proxy_sizes(self) -> List[dict]:
+        """Returns the validated 'proxies.sizes' sorted from largest to
+        smallest as each proxy image is downscaled from the previous one. See
+        easel.site.contents.proxies.generate_proxies()."""
+
+        sizes = [
+            {
+                "name": entry[Key.NAME],
+                "size": (entry[Key.SIZE], entry[Key.SIZE]),
+                "quality": entry.get(Key.QUALITY, Defaults.PROXY_IMAGE_QUALITY),
+            }
+            for entry in self.__config[Key.PROXIES][Key.SIZES]
+        ]
+
+        return sorted(sizes, key=lambda size: size["size"], reverse=True)
+
+    @property
+    def proxy_formats(self) -> List[str]:
+        """Returns the names of the formats generated in addition to the
+        default JPEG proxy images. See Defaults.PROXY_IMAGE_FORMATS."""
+        return self.__config[Key.PROXIES][Key.FORMATS]
+
+    @property
+    def proxy_sizes(self) -> List[dict]:
+        """Returns the name, size and JPEG quality of each proxy image from
+        largest to smallest:
+
+            [
+                {
+                    "name": [str: None],
+                    "size": [tuple: (int, int)],
+                    "quality": [int: Defaults.PROXY_IMAGE_QUALITY],
+                },
+                ...
+            ]
+        """
+        return self._proxy_sizes
+
+    @property
+    def proxy_palette_size(self) -> int:
+        """Returns the number of colors in each image's palette or 0 if
+        palettes are disabled. See ProxyColorManager.palette."""
+        return self.__config[Key.PROXIES][Key.PALETTE]
+
+    @property
+    def digest(self) -> str:
+        """Returns a SHA-256 digest of the merged theme config. Used to detect
+        changes to the config without comparing its sources."""
+
+        config = json.dumps(self.__config, sort_keys=True, default=str)
+
+        return hashlib.sha256(config.encode("utf-8")).hexdigest()
 
     def __getitem__(self, key: str) -> Any:
         try:
@@ -1,12 +1,19 @@
 import collections.abc
+import contextlib
 import copy
 import datetime
+import functools
+import hashlib
 import logging
 import os
 import pathlib
 import re
+import shutil
+import tempfile
+import threading
+import time
 import unicodedata
-from typing import Optional, Union
+from typing import IO, Any, Dict, Generator, Hashable, List, Optional, Tuple, Union
 
 import yaml
 
@@ -14,9 +21,21 @@ from .defaults import Defaults
 from .errors import ConfigLoadError
 
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    # Not available on Windows.
+    fcntl = None  # type: ignore
+
+
 logger = logging.getLogger(__name__)
 
 
+# The process's umask. Read once, on the first call to Utils.get_umask().
+_umask: Optional[int] = None
+_umask_lock = threading.Lock()
+
+
 class Utils:
     @staticmethod
     def load_config(path: pathlib.Path) -> dict:
@@ -40,6 +59,165 @@ class Utils:
 
         return data
 
+    @staticmethod
+    def get_fingerprint(path: pathlib.Path) -> List[int]:
+        """Returns a cheap fingerprint of a file's current state. Used to
+        detect changes without reading the file."""
+
+        stat = path.stat()
+
+        return [stat.st_size, stat.st_mtime_ns, stat.st_ino]
+
+    @staticmethod
+    def get_digest(path: pathlib.Path, chunk_size: int = 2 ** 20) -> str:
+        """ Returns the SHA-256 digest of a file's contents. """
+
+        digest = hashlib.sha256()
+
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(chunk_size), b""):
+                digest.update(chunk)
+
+        return digest.hexdigest()
+
+    @staticmethod
+    def get_umask() -> int:
+        """Returns the process's umask. Linux exposes it in /proc. Elsewhere it
+        can only be read by setting it, which briefly affects files created by
+        other threads, so it's only ever read once."""
+
+        global _umask
+
+        with _umask_lock:
+
+            if _umask is not None:
+                return _umask
+
+            try:
+                with open("/proc/self/status", "r") as f:
+                    for line in f:
+                        if line.startswith("Umask:"):
+                            _umask = int(line.split()[1], 8)
+                            break
+            except (OSError, ValueError):
+                pass
+
+            if _umask is None:
+                _umask = os.umask(0)
+                os.umask(_umask)
+
+            return _umask
+
+    @staticmethod
+    @contextlib.contextmanager
+    def open_atomic(
+        path: Union[pathlib.Path, str], mode: str = "w", **kwargs
+    ) -> Generator[IO, None, None]:
+        """Opens a uniquely named temporary file next to 'path' and replaces
+        'path' with it once the block exits. Readers never see a partially
+        written file and concurrent writers, be it threads or processes, never
+        share a temporary file. If the block raises, the temporary file is
+        removed and 'path' is left untouched."""
+
+        directory, name = os.path.split(path)
+
+        fd, path_temp = tempfile.mkstemp(
+            dir=directory or None, prefix=f".{name}.", suffix=".tmp"
+        )
+
+        try:
+
+            # Temporary files are only readable by their owner. Use the same
+            # permissions as a file created with open().
+            os.chmod(path_temp, 0o666 & ~Utils.get_umask())
+
+            with open(fd, mode, **kwargs) as f:
+                yield f
+
+            os.replace(path_temp, path)
+
+        except BaseException:
+
+            try:
+                os.unlink(path_temp)
+            except FileNotFoundError:
+                pass
+
+            raise
+
+    @staticmethod
+    @contextlib.contextmanager
+    def lock_file(path: Union[pathlib.Path, str]) -> Generator[None, None, None]:
+        """Holds an exclusive lock on 'path' for the duration of the block,
+        creating it if it doesn't exist. Used to serialize read-modify-write
+        cycles across processes e.g. multiple gunicorn workers. A no-op where
+        fcntl isn't available."""
+
+        if fcntl is None:  # pragma: no cover
+            yield
+            return
+
+        with open(path, "a") as f:
+
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    @staticmethod
+    def link_or_copy(src: pathlib.Path, dst: pathlib.Path) -> None:
+        """Hard-links 'src' to 'dst'. If the two paths are on different
+        devices or the filesystem doesn't support hard-links, 'src' is
+        reflinked i.e. a copy-on-write clone, falling back to copying it. An
+        existing 'dst' is replaced rather than written to as it might itself be
+        a hard-link to another file."""
+
+        dst.parent.mkdir(parents=True, exist_ok=True)
+
+        try:
+            dst.unlink()
+        except FileNotFoundError:
+            pass
+
+        try:
+            os.link(src, dst)
+            return
+        except OSError:
+            pass
+
+        if Utils.reflink(src, dst):
+            shutil.copystat(src, dst)
+            return
+
+        shutil.copy2(src, dst)
+
+    @staticmethod
+    def reflink(src: pathlib.Path, dst: pathlib.Path) -> bool:
+        """Clones 'src' to 'dst' using the FICLONE ioctl on filesystems that
+        support it e.g. Btrfs and XFS. Returns False if cloning failed, leaving
+        no 'dst' behind.
+
+        https://man7.org/linux/man-pages/man2/ioctl_ficlone.2.html"""
+
+        if fcntl is None:  # pragma: no cover
+            return False
+
+        FICLONE = 0x40049409
+
+        try:
+            with open(src, "rb") as f_src, open(dst, "wb") as f_dst:
+                fcntl.ioctl(f_dst.fileno(), FICLONE, f_src.fileno())
+        except OSError:
+            try:
+                dst.unlink()
+            except FileNotFoundError:
+                pass
+            return False
+
+        return True
+
     @staticmethod
     def str_to_bool(value: str) -> bool:
         return value.upper() in ["TRUE", "ENABLED", "YES", "1"]
@@ -107,6 +285,7 @@ class Utils:
         return string
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def normalize_page_path(path: Union[str, pathlib.Path]) -> str:
         """Ensures path is relative to the 'Globals.site_paths.pages' directory.
 
@@ -229,3 +408,159 @@ class SafeDict(dict):
             return self.setdefault(key, type(self)())
 
         return super().__getitem__(key)
+
+
+class LRUCache:
+    """Creates a thread-safe mapping holding at most 'maxsize' items. Once
+    full, the least recently used item is evicted to make room for a new one.
+    A 'maxsize' of 0 disables the cache.
+
+    https://docs.python.org/3/library/collections.html#ordereddict-examples-and-recipes
+    """
+
+    def __init__(self, maxsize: int = 128):
+        self._maxsize = maxsize
+        self._items: "collections.OrderedDict[Hashable, Any]" = (
+            collections.OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._items
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+
+        with self._lock:
+
+            try:
+                self._items.move_to_end(key)
+            except KeyError:
+                return default
+
+            return self._items[key]
+
+    def set(self, key: Hashable, value: Any) -> None:
+
+        if self._maxsize <= 0:
+            return
+
+        with self._lock:
+
+            self._items[key] = value
+            self._items.move_to_end(key)
+
+            while len(self._items) > self._maxsize:
+                self._items.popitem(last=False)
+
+    def clear(self) -> None:
+
+        with self._lock:
+            self._items.clear()
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+
+class Timings:
+    """Records how long each phase of a build takes along with the durations
+    of individual items e.g. each page or image, within a phase. Phases with
+    the same name accumulate."""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        self._phases: Dict[str, float] = {}
+        self._items: Dict[str, Dict[str, float]] = {}
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> Generator[None, None, None]:
+
+        start = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+    def add(self, name: str, seconds: float, item: Optional[str] = None) -> None:
+        """Adds 'seconds' to the phase 'name' or, if 'item' is passed, to the
+        item within the phase."""
+
+        if item is None:
+            self._phases[name] = self._phases.get(name, 0.0) + seconds
+            return
+
+        items = self._items.setdefault(name, {})
+        items[item] = items.get(item, 0.0) + seconds
+
+    @property
+    def phases(self) -> Dict[str, float]:
+        return self._phases
+
+    @property
+    def items(self) -> Dict[str, Dict[str, float]]:
+        return self._items
+
+    def slowest(self, name: str, count: int = 5) -> List[Tuple[str, float]]:
+        """ Returns the slowest 'count' items within the phase 'name'. """
+
+        items = self._items.get(name, {})
+
+        return sorted(items.items(), key=lambda item: item[1], reverse=True)[:count]
+
+    def summary(self, count: int = 5) -> str:
+        """Returns a table of each phase's duration along with the slowest
+        items within each phase. Items recorded without a matching phase e.g.
+        those timed inside worker processes, are listed after the phases with
+        their summed duration and no percentage as they may overlap:
+
+            Phase                    Seconds       %
+            ---------------------------------------
+            pages                      1.204   60.2%
+              page-name                0.803
+              ...
+        """
+
+        total = sum(self._phases.values()) or 1.0
+
+        names = [
+            *self._phases,
+            *[name for name in self._items if name not in self._phases],
+        ]
+
+        width = max([40, *[len(name) + 2 for name in names]])
+
+        lines = [
+            f"{'Phase':<{width}}{'Seconds':>10}{'%':>8}",
+            "-" * (width + 18),
+        ]
+
+        for name in names:
+
+            if name in self._phases:
+                seconds = self._phases[name]
+                lines.append(f"{name:<{width}}{seconds:>10.3f}{seconds / total:>8.1%}")
+            else:
+                seconds = sum(self._items[name].values())
+                lines.append(f"{name:<{width}}{seconds:>10.3f}")
+
+            for item, seconds_item in self.slowest(name, count=count):
+
+                # Long items e.g. image paths are truncated from the left.
+                if len(item) > width - 4:
+                    item = f"...{item[-(width - 7):]}"
+
+                lines.append(f"  {item:<{width - 2}}{seconds_item:>10.3f}")
+
+        return "\n".join(lines)
+
+    def to_dict(self) -> dict:
+        return {
+            "phases": self._phases,
+            "items": self._items,
+        }
@@ -1,46 +1,152 @@
+import hashlib
+import json
 import os
 import pathlib
-from typing import Optional, Union
+import threading
+from typing import List, Optional, Union
 
 import markdown as _markdown
+import pymdownx
 
+from .defaults import Defaults
 from .globals import Globals
-from .helpers import Utils
+from .helpers import LRUCache, Utils
+from .metrics import Metrics
 
 
 class _Markdown:
-    @staticmethod
+
+    # The maximum number of converters, one per 'base_path', kept per thread.
+    CONVERTERS_MAXSIZE: int = 64
+
+    EXTENSIONS: List[str] = [
+        "nl2br",
+        "sane_lists",
+        "pymdownx.pathconverter",
+        "pymdownx.smartsymbols",
+        "pymdownx.magiclink",
+        "pymdownx.tasklist",
+        "pymdownx.extra",
+        "pymdownx.caret",
+        "pymdownx.tilde",
+        "pymdownx.mark",
+    ]
+
+    def __init__(
+        self, cache_size: int = Defaults.MARKDOWN_CACHE_SIZE, cache_on_disk: bool = True
+    ):
+        self._local = threading.local()
+
+        # Rendered Markdown files keyed by their path and fingerprint.
+        self._rendered = LRUCache(maxsize=cache_size)
+
+        self.cache_on_disk = cache_on_disk
+
     def _convert(
-        string: str, base_path: Optional[Union[str, pathlib.Path]] = None
+        self, string: str, base_path: Optional[Union[str, pathlib.Path]] = None
     ) -> str:
+
+        md = self._get_converter(base_path=base_path)
+
+        # Clear any state e.g. footnotes or abbreviations left over from the
+        # previous document converted with this instance.
+        return md.reset().convert(string)
+
+    def _get_converter(
+        self, base_path: Optional[Union[str, pathlib.Path]] = None
+    ) -> _markdown.Markdown:
+        """Returns a converter for 'base_path'. Loading the extensions is far
+        more expensive than converting a short string so converters are kept
+        and re-used. Converters aren't thread-safe so each thread has its own
+        set."""
+
+        converters: Optional[LRUCache] = getattr(self._local, "converters", None)
+
+        if converters is None:
+            converters = LRUCache(maxsize=self.CONVERTERS_MAXSIZE)
+            self._local.converters = converters
+
+        key = str(base_path) if base_path is not None else None
+
+        md = converters.get(key)
+
+        if md is None:
+            md = self._build_converter(base_path=base_path)
+            converters.set(key, md)
+
+        return md
+
+    @classmethod
+    def _build_converter(
+        cls, base_path: Optional[Union[str, pathlib.Path]] = None
+    ) -> _markdown.Markdown:
         """ https://facelessuser.github.io/pymdown-extensions/ """
 
-        md = _markdown.Markdown(
-            extensions=[
-                "nl2br",
-                "sane_lists",
-                "pymdownx.pathconverter",
-                "pymdownx.smartsymbols",
-                "pymdownx.magiclink",
-                "pymdownx.tasklist",
-                "pymdownx.extra",
-                "pymdownx.caret",
-                "pymdownx.tilde",
-                "pymdownx.mark",
-            ],
-            extension_configs={
-                "pymdownx.pathconverter": {
-                    "absolute": True,
-                    "base_path": base_path,
-                }
-            },
+        return _markdown.Markdown(
+            extensions=cls.EXTENSIONS,
+            extension_configs=cls._get_extension_configs(base_path=base_path),
         )
 
-        return md.convert(string)
+    @staticmethod
+    def _get_extension_configs(
+        base_path: Optional[Union[str, pathlib.Path]] = None
+    ) -> dict:
+        return {
+            "pymdownx.pathconverter": {
+                "absolute": True,
+                "base_path": base_path,
+            }
+        }
 
     def from_file(self, path: pathlib.Path) -> str:
-        """ Render Markdown from a file. """
+        """Render Markdown from a file. Renders are memoized on the file's path
+        and fingerprint so a file is only converted again once it changes.
+        Renders are kept in memory and, if 'cache_on_disk' is True, stored in
+        the site-cache so they survive a restart."""
+
+        with Metrics.measure(Defaults.METRICS_PHASE_MARKDOWN):
+
+            key = self.get_key(path=path)
+
+            html = self._rendered.get(key)
+
+            if html is not None:
+                return html
 
+            if self.cache_on_disk is True:
+                html = Globals.site_cache.get_markdown(key)
+
+            if html is None:
+
+                html = self._from_file(path=path)
+
+                if self.cache_on_disk is True:
+                    Globals.site_cache.update_markdown(key, html)
+
+            self._rendered.set(key, html)
+
+            return html
+
+    def get_key(self, path: pathlib.Path) -> str:
+        """Returns the key the rendered Markdown file at 'path' is stored under.
+        It changes along with the file's fingerprint, the versions of Markdown
+        and pymdown-extensions and the extensions' configs, all of which change
+        the rendered HTML."""
+
+        key = json.dumps(
+            [
+                str(path),
+                Utils.get_fingerprint(path),
+                _markdown.__version__,
+                pymdownx.__version__,
+                self.EXTENSIONS,
+                self._get_extension_configs(base_path=self._get_base_path(path)),
+            ]
+        )
+
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    def _from_file(self, path: pathlib.Path) -> str:
         """ 'base_path' is pre-pended to any 'path' or 'src' in <a>, <script>,
         <img>, and <link> tags, allowing the use of relative paths in markdown
         files. NOTE: This is emulating Easel._filter__site_url() with a
@@ -61,23 +167,28 @@ class _Markdown:
         via https://facelessuser.github.io/pymdown-extensions/extensions/pathconverter/
         """
 
-        path_relative = path.relative_to(Globals.site_paths.root).parent
-        base_path = Utils.urlify(
-            f"{Globals.site_paths.static_url_path}{os.sep}{path_relative}"
-        )
-
         with open(path, encoding="utf-8") as f:
             string = f.read()
 
-        return self._convert(string=string, base_path=base_path)
+        return self._convert(string=string, base_path=self._get_base_path(path))
+
+    @staticmethod
+    def _get_base_path(path: pathlib.Path) -> str:
+
+        path_relative = path.relative_to(Globals.site_paths.root).parent
+
+        return Utils.urlify(
+            f"{Globals.site_paths.static_url_path}{os.sep}{path_relative}"
+        )
 
     def from_string(self, string: Optional[str] = None) -> str:
         """ Render Markdown from a string. """
 
-        if string is None:
+        if not string:
             return ""
 
-        return self._convert(string)
+        with Metrics.measure(Defaults.METRICS_PHASE_MARKDOWN):
+            return self._convert(string)
 
 
 Markdown = _Markdown()
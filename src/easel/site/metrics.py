@@ -0,0 +1,240 @@
+import bisect
+import contextlib
+import functools
+import threading
+import time
+from typing import Callable, Dict, Generator, List, Optional, Tuple
+
+from .defaults import Defaults
+
+
+class Histogram:
+    """A thread-safe histogram of durations in seconds with one series per
+    set of label values. Exposed in the Prometheus text format:
+
+        # HELP name help
+        # TYPE name histogram
+        name_bucket{label="value",le="0.001"} 0
+        ...
+        name_bucket{label="value",le="+Inf"} 4
+        name_sum{label="value"} 0.0123
+        name_count{label="value"} 4
+
+    Each series is a list of per-bucket counts followed by the sum and count
+    of all observations. Buckets are stored non-cumulatively and summed when
+    exposed to keep Histogram.observe() cheap."""
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labels: Tuple[str, ...],
+        buckets: Tuple[float, ...] = Defaults.METRICS_BUCKETS,
+    ):
+        self._name = name
+        self._help = help
+        self._labels = labels
+        self._buckets = buckets
+
+        self._series: Dict[Tuple[str, ...], List[float]] = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}: {self._name}>"
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def observe(self, seconds: float, *values: str) -> None:
+
+        # The last bucket holds observations larger than any bound i.e. '+Inf'.
+        index = bisect.bisect_left(self._buckets, seconds)
+
+        with self._lock:
+
+            series = self._series.get(values, None)
+
+            if series is None:
+                series = [0.0] * (len(self._buckets) + 3)
+                self._series[values] = series
+
+            series[index] += 1
+            series[-2] += seconds
+            series[-1] += 1
+
+    def get(self, *values: str) -> Optional[Tuple[float, int]]:
+        """ Returns the sum and count of a series or None if it's empty. """
+
+        with self._lock:
+            series = self._series.get(values, None)
+
+        if series is None:
+            return None
+
+        return series[-2], int(series[-1])
+
+    def clear(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+    def expose(self) -> List[str]:
+
+        lines = [
+            f"# HELP {self._name} {self._help}",
+            f"# TYPE {self._name} histogram",
+        ]
+
+        with self._lock:
+            series_all = [
+                (values, list(series)) for values, series in self._series.items()
+            ]
+
+        bounds = [*[f"{bound:g}" for bound in self._buckets], "+Inf"]
+
+        for values, series in sorted(series_all):
+
+            labels = [
+                f'{label}="{self._escape(value)}"'
+                for label, value in zip(self._labels, values)
+            ]
+
+            cumulative = 0.0
+
+            for bound, count in zip(bounds, series):
+
+                cumulative += count
+
+                labels_bucket = ",".join([*labels, f'le="{bound}"'])
+
+                lines.append(f"{self._name}_bucket{{{labels_bucket}}} {cumulative:g}")
+
+            labels_series = ",".join(labels)
+
+            lines.append(f"{self._name}_sum{{{labels_series}}} {series[-2]!r}")
+            lines.append(f"{self._name}_count{{{labels_series}}} {series[-1]:g}")
+
+        return lines
+
+    @staticmethod
+    def _escape(value: str) -> str:
+        return value.replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
+
+
+class _Metrics:
+    """Collects request and render timings while Easel is serving. Disabled by
+    default. Every render is broken down into the time spent converting
+    Markdown, running template filters and, the remainder, rendering the
+    template itself. The breakdown of the render in progress is kept per
+    thread so Metrics.measure() can be called from anywhere without needing
+    to know which Page is being rendered.
+
+    NOTE: Metrics are kept per process. When serving with multiple worker
+    processes each worker exposes its own metrics."""
+
+    def __init__(self):
+
+        self.enabled: bool = False
+
+        self._local = threading.local()
+
+        self.requests = Histogram(
+            name="easel_request_duration_seconds",
+            help="Time spent handling a request.",
+            labels=("endpoint",),
+        )
+        self.renders = Histogram(
+            name="easel_page_render_seconds",
+            help="Time spent rendering a Page.",
+            labels=("page",),
+        )
+        self.phases = Histogram(
+            name="easel_page_render_phase_seconds",
+            help="Time spent rendering a Page by phase.",
+            labels=("page", "phase"),
+        )
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}: enabled={self.enabled}>"
+
+    @contextlib.contextmanager
+    def render(self, page: str) -> Generator[None, None, None]:
+        """Times the render of 'page'. Renders nested within another render
+        are counted as part of the outer one."""
+
+        if self.enabled is False or getattr(self._local, "phases", None) is not None:
+            yield
+            return
+
+        phases: Dict[str, float] = {
+            Defaults.METRICS_PHASE_MARKDOWN: 0.0,
+            Defaults.METRICS_PHASE_FILTERS: 0.0,
+        }
+
+        self._local.phases = phases
+
+        start = time.perf_counter()
+
+        try:
+            yield
+        finally:
+
+            seconds = time.perf_counter() - start
+
+            self._local.phases = None
+
+            self.renders.observe(seconds, page)
+
+            for phase, seconds_phase in phases.items():
+                self.phases.observe(seconds_phase, page, phase)
+
+            self.phases.observe(
+                max(0.0, seconds - sum(phases.values())),
+                page,
+                Defaults.METRICS_PHASE_TEMPLATE,
+            )
+
+    @contextlib.contextmanager
+    def measure(self, phase: str) -> Generator[None, None, None]:
+        """Adds the time spent inside the block to 'phase' of the render in
+        progress. A no-op outside of a render."""
+
+        phases: Optional[Dict[str, float]] = getattr(self._local, "phases", None)
+
+        if phases is None:
+            yield
+            return
+
+        start = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            phases[phase] = phases.get(phase, 0.0) + time.perf_counter() - start
+
+    def measured(self, phase: str, function: Callable) -> Callable:
+        """ Returns 'function' wrapped with Metrics.measure(). """
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with self.measure(phase):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    def expose(self) -> str:
+        """ Returns all metrics in the Prometheus text format. """
+
+        lines: List[str] = []
+
+        for histogram in [self.requests, self.renders, self.phases]:
+            lines.extend(histogram.expose())
+
+        return "\n".join(lines) + "\n"
+
+    def clear(self) -> None:
+        for histogram in [self.requests, self.renders, self.phases]:
+            histogram.clear()
+
+
+Metrics = _Metrics()
@@ -4,6 +4,7 @@ from typing import Any, Optional, Type, Union
 
 from ..defaults import Defaults, Key
 from ..errors import PageConfigError
+from ..globals import Globals
 from ..helpers import Utils
 from .pages import Layout, LayoutGallery, Lazy, LazyGallery
 
@@ -56,7 +57,18 @@ class _PageFactory:
 
         path_page_config: pathlib.Path = path / Defaults.FILENAME_PAGE_YAML
 
-        page_config: dict = Utils.load_config(path=path_page_config)
+        # Reuse the 'page.yaml' parsed during the previous build if the page
+        # hasn't changed since. See SiteCache.
+        entry: Optional[dict] = Globals.site_cache.get_page(path=path)
+
+        if entry is not None and "config" in entry:
+            page_config: dict = entry["config"]
+        else:
+            page_config = Utils.load_config(path=path_page_config)
+
+            Globals.site_cache.update_page(
+                path=path, tracked=[path, path_page_config], config=page_config
+            )
 
         try:
             page_type: str = page_config[Key.TYPE]
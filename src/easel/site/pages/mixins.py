@@ -1,11 +1,12 @@
 import abc
-import glob
 import logging
+import os
 import pathlib
-from typing import TYPE_CHECKING, Generator
+from typing import TYPE_CHECKING, List, Optional, Set, Tuple
 
 from ..defaults import Defaults, Key
 from ..errors import PageConfigError
+from ..globals import Globals
 
 
 if TYPE_CHECKING:
@@ -16,6 +17,9 @@ logger = logging.getLogger(__name__)
 
 
 class LazyMixin(abc.ABC):
+
+    _lazy_contents: Optional[List[pathlib.Path]] = None
+
     @property
     @abc.abstractmethod
     def config(self) -> "PageConfig":
@@ -28,36 +32,26 @@ class LazyMixin(abc.ABC):
 
     def validate__lazy_config(self) -> None:
 
-        if not len(list(self._directory_contents)):
+        if not len(self._directory_contents):
             logger.warning(f"{self}: Page has no contents.")
 
     @property
-    def _directory_contents(self) -> Generator[pathlib.Path, None, None]:
+    def _directory_contents(self) -> List[pathlib.Path]:
         """Returns the contents of the Page's root directory. Primarily used
-        for creating Content objects to populate the Page.
+        for creating Content objects to populate the Page. The directory is
+        only filtered once, the result is shared between validating and
+        building the Page."""
 
-        NOTE: The glob module ignores the contents of hidden directories as
-        well as hidden files. Note that 'hidden' here means those which start
-        with a dot. This makes it really convenient to hide whole directories
-        inside Page's directory.
+        if self._lazy_contents is None:
+            self._lazy_contents = list(self._filter_directory())
 
-        Ideally we'd use pathlib here, but when recursing with
-        Path.glob("**/*"), we get every single item including those inside
-        hidden directories.
+        return self._lazy_contents
 
-        https://docs.python.org/3/library/glob.html"""
-
-        # Create a generator and feed it using iglob which returns an iterator.
-        valid_paths = (
-            pathlib.Path(path)
-            for path in glob.iglob(f"{self.path}/**/*", recursive=True)
-        )
+    def _filter_directory(self) -> List[pathlib.Path]:
 
-        for path in valid_paths:
+        paths: List[pathlib.Path] = []
 
-            # Ignore directories and symlinks.
-            if path.is_dir() or path.is_symlink():
-                continue
+        for path in self._walk_directory():
 
             # Ignore 'private' files.
             if path.name.startswith("_"):
@@ -82,7 +76,93 @@ class LazyMixin(abc.ABC):
                 logger.warning(f"Unsupported file '{path.name}' found in {self}.")
                 continue
 
-            yield path
+            paths.append(path)
+
+        return paths
+
+    def _walk_directory(self) -> List[pathlib.Path]:
+        """Returns every file inside the Page's root directory. The result is
+        recorded in the site-cache's manifest along with the directories that
+        were walked and reused until one of them changes. See SiteCache."""
+
+        entry = Globals.site_cache.get_page(path=self.path)
+
+        if entry is not None and "contents" in entry:
+            return [self.path / path for path in entry["contents"]]
+
+        files: List[pathlib.Path] = []
+        directories: List[pathlib.Path] = [self.path]
+
+        self._scan_directory(self.path, files=files, directories=directories)
+
+        Globals.site_cache.update_page(
+            path=self.path,
+            tracked=directories,
+            contents=[str(path.relative_to(self.path)) for path in files],
+        )
+
+        return files
+
+    @classmethod
+    def _scan_directory(
+        cls,
+        path: pathlib.Path,
+        files: List[pathlib.Path],
+        directories: List[pathlib.Path],
+        parents: Optional[Set[Tuple[int, int]]] = None,
+    ) -> None:
+        """Recursively collects the files and sub-directories inside 'path'.
+        The type of each entry comes from os.scandir() so no extra stat calls
+        are made per file.
+
+        Hidden files and directories, those starting with a dot, are ignored.
+        This makes it really convenient to hide whole directories inside a
+        Page's directory. Symlinked directories are followed while symlinked
+        files are ignored. 'parents' holds the device and inode of every
+        directory being walked to avoid looping over a symlink pointing to one
+        of its parents.
+
+        https://docs.python.org/3/library/os.html#os.scandir"""
+
+        if parents is None:
+            stat = path.stat()
+            parents = {(stat.st_dev, stat.st_ino)}
+
+        with os.scandir(path) as entries:
+
+            for entry in entries:
+
+                if entry.name.startswith("."):
+                    continue
+
+                # Follows symlinks. Broken symlinks are neither a directory
+                # nor a file.
+                if entry.is_dir():
+
+                    stat = entry.stat()
+                    inode = (stat.st_dev, stat.st_ino)
+
+                    if inode in parents:
+                        logger.warning(f"Skipping symlink loop at {entry.path}.")
+                        continue
+
+                    directories.append(pathlib.Path(entry.path))
+
+                    parents.add(inode)
+                    cls._scan_directory(
+                        pathlib.Path(entry.path),
+                        files=files,
+                        directories=directories,
+                        parents=parents,
+                    )
+                    parents.remove(inode)
+
+                    continue
+
+                if entry.is_symlink():
+                    continue
+
+                files.append(pathlib.Path(entry.path))
 
 
 class LayoutMixin(abc.ABC):
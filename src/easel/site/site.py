@@ -1,15 +1,23 @@
 import logging
-from typing import TYPE_CHECKING, List, Optional
+import pathlib
+import shutil
+import time
+from typing import TYPE_CHECKING, Dict, Generator, Iterable, List, Optional, Set, Tuple
 
+from .contents.mixins import CaptionMixin
+from .contents.proxies import ProxyGenerator, ProxyProgress
 from .defaults import Key
 from .errors import Error, SiteConfigError
 from .globals import Globals
 from .helpers import Utils
+from .markdown import Markdown
 from .menus import LinkPage, MenuFactory
 from .pages import PageFactory
 
 
 if TYPE_CHECKING:
+    from .contents import Image
+    from .contents.proxies import ProxyImage
     from .globals import SiteConfig
     from .menus import MenuObj
     from .pages import PageObj
@@ -24,14 +32,44 @@ from .defaults import Defaults
 class Site:
 
     _pages: Optional[List["PageObj"]] = None
+    _pages_by_url: Optional[Dict[str, "PageObj"]] = None
     _menu: Optional[List["MenuObj"]] = None
 
     _index: Optional["PageObj"] = None
 
+    _proxy_generator: Optional[ProxyGenerator] = None
+    _proxies_by_src: Optional[Dict[str, "ProxyImage"]] = None
+
+    _generation: int = 0
+    _page_generations: Optional[Dict[str, int]] = None
+
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__}: {Globals.site_paths.root}>"
 
-    def build(self) -> None:
+    def build(self, from_snapshot: bool = False) -> None:
+        """Builds the Site. If 'from_snapshot' is True, the Site is loaded from
+        the snapshot in the site-cache if none of the files it was built from
+        have changed. Otherwise the Site is built and a new snapshot is
+        stored."""
+
+        self._proxies_by_src = None
+        self._page_generations = {}
+
+        if from_snapshot is True:
+
+            with Globals.timings.phase("snapshot"):
+                loaded = self._load_snapshot()
+
+            if loaded is True:
+
+                # Deferred proxies are never generated for a snapshot so they
+                # must be registered again.
+                if Globals.lazy_proxies is True or Globals.warm_proxies is True:
+                    self._build_proxies()
+
+                self._report_timings()
+                self._generation += 1
+                return
 
         logger.info(f"Building Site from {Globals.site_paths.root}.")
 
@@ -39,18 +77,305 @@ class Site:
             logger.info("Set 'loglevel' to 'DEBUG' for more information.")
 
         self._build()
-        self._validate()
+
+        with Globals.timings.phase("validate"):
+            self._validate()
+
+        with Globals.timings.phase("captions"):
+            self._build_captions()
+
+        with Globals.timings.phase("proxies"):
+            self._build_proxies()
+
+        with Globals.timings.phase("site-cache"):
+
+            self._track_markdown()
+
+            Globals.site_cache.save(prune=True)
+
+            if from_snapshot is True:
+                self._save_snapshot()
+
+        self._report_timings()
+
+        self._generation += 1
+
+    def _report_timings(self) -> None:
+        """Logs a summary of the build's timings. If Globals.profile is True,
+        the summary is logged at the INFO level and the timings are written to
+        the site-cache."""
+
+        summary = Globals.timings.summary()
+
+        if Globals.profile is False:
+            logger.debug(f"Build timings:\n{summary}")
+            return
+
+        logger.info(f"Build timings:\n{summary}")
+
+        Globals.site_cache.save_profile(Globals.timings.to_dict())
+
+    def _load_snapshot(self) -> bool:
+
+        snapshot = Globals.site_cache.get_snapshot()
+
+        if snapshot is None:
+            return False
+
+        logger.info(f"Loading Site from snapshot {Globals.site_cache.snapshot}.")
+
+        self._pages = snapshot["pages"]
+        self._menu = snapshot["menu"]
+        self._index = snapshot["index"]
+
+        self._build_pages_by_url()
+
+        return True
+
+    def _save_snapshot(self) -> None:
+
+        snapshot = {
+            "pages": self._pages,
+            "menu": self._menu,
+            "index": self._index,
+        }
+
+        Globals.site_cache.update_snapshot(
+            inputs=self._get_snapshot_inputs(), value=snapshot
+        )
+
+    def _get_snapshot_inputs(self) -> Set[pathlib.Path]:
+        """Returns every path the Site was built from. The site.yaml, the theme
+        directory and its theme.yaml, the pages directory, every page's
+        directory, page.yaml and the directories walked for Lazy pages along
+        with every file used as content."""
+
+        inputs: Set[pathlib.Path] = {
+            Globals.site_paths.root / Defaults.FILENAME_SITE_YAML,
+            Globals.site_paths.pages,
+            Globals.theme_paths.root,
+            Globals.theme_paths.root / Defaults.FILENAME_THEME_YAML,
+        }
+
+        for page in self.pages:
+
+            inputs.add(page.path)
+            inputs.add(page.path / Defaults.FILENAME_PAGE_YAML)
+
+            entry = Globals.site_cache.get_page(path=page.path) or {}
+
+            for path in entry.get("fingerprints", {}):
+                inputs.add(Globals.site_paths.root / path)
+
+            for content in [page.cover, page.description, *page.contents]:
+
+                path = getattr(content, "path", None)
+
+                if path is not None:
+                    inputs.add(path)
+
+        return inputs
 
     def _build(self) -> None:
-        self._build_pages()
-        self._build_menu()
-        self._set_index()
 
-    def _build_pages(self) -> None:
+        with Globals.timings.phase("discovery"):
+            paths = list(Globals.site_paths.iter_pages())
 
-        self._pages = [
-            PageFactory.build(path=path) for path in Globals.site_paths.iter_pages()
-        ]
+        with Globals.timings.phase("pages"):
+            self._build_pages(paths=paths)
+            self._build_pages_by_url()
+
+        with Globals.timings.phase("menu"):
+            self._build_menu()
+            self._set_index()
+
+    def _build_pages(self, paths: List[pathlib.Path]) -> None:
+
+        self._pages = []
+
+        for path in paths:
+
+            start = time.perf_counter()
+
+            self._pages.append(PageFactory.build(path=path))
+
+            Globals.timings.add("pages", time.perf_counter() - start, item=path.name)
+
+    def _build_pages_by_url(self) -> None:
+        """Builds a lookup of Pages by their url along with the aliases that
+        Utils.normalize_page_path() would resolve to it. For example the Page
+        with the url '/page-name' is also found with:
+
+            page-name
+            /page-name/
+            pages/page-name
+            contents/pages/page-name
+            ...
+        """
+
+        self._pages_by_url = {}
+
+        for page in self.pages:
+
+            name = Utils.urlify(page.url, leading_slash=False)
+
+            for prefix in [
+                "",
+                f"{Defaults.DIRECTORY_NAME_PAGES}/",
+                f"{Defaults.DIRECTORY_NAME_CONTENTS}/{Defaults.DIRECTORY_NAME_PAGES}/",
+            ]:
+                for alias in [
+                    f"{prefix}{name}",
+                    f"/{prefix}{name}",
+                    f"./{prefix}{name}",
+                ]:
+                    self._pages_by_url.setdefault(alias, page)
+                    self._pages_by_url.setdefault(f"{alias}/", page)
+
+    def _build_captions(self) -> None:
+        """Renders every caption in the Site to HTML up-front. Identical
+        captions are only rendered once."""
+
+        compiled: Dict[str, str] = {}
+
+        for page in self.pages:
+
+            for content in [page.cover, *page.contents]:
+
+                if not isinstance(content, CaptionMixin):
+                    continue
+
+                content.compile_captions(compiled=compiled)
+
+        logger.debug(f"Compiled {len(compiled)} unique captions.")
+
+    def _track_markdown(self) -> None:
+        """Marks the rendered Markdown of every TextBlock in the Site as in use.
+        Markdown is only rendered along with its Page so without this, pruning
+        the site-cache would remove it. See SiteCache.save()."""
+
+        for page in self.pages:
+
+            for content in [page.description, *page.contents]:
+
+                if not getattr(content, "is_text_block", False):
+                    continue
+
+                try:
+                    key = Markdown.get_key(path=content.path)  # type: ignore
+                except OSError:
+                    continue
+
+                Globals.site_cache.touch_markdown(key)
+
+    def _build_proxies(self, force: bool = False, defer: Optional[bool] = None) -> None:
+
+        if defer is None:
+            defer = Globals.lazy_proxies is True or Globals.warm_proxies is True
+
+        if self._proxy_generator is not None:
+            self._proxy_generator.close()
+
+        # Proxies are keyed on the digests of their images. Compute any missing
+        # ones up front rather than one at a time. See BaseProxyManager.key.
+        Globals.site_cache.prefetch_digests(image.path for image in self.iter_images())
+
+        self._proxy_generator = ProxyGenerator()
+        self._proxy_generator.run(images=self.iter_images(), force=force, defer=defer)
+
+        if defer is True and Globals.warm_proxies is True:
+            self._proxy_generator.warm_up(callback=self._on_proxies_warmed_up)
+
+    def _on_proxies_warmed_up(self) -> None:
+        """Invalidates Pages rendered during the warm-up as they were rendered
+        before their Images' colors were generated."""
+
+        self._generation += 1
+
+    def generate_proxy(self, src: str) -> bool:
+        """Generates the deferred proxies of the proxy image at 'src' relative
+        to the site's root. Returns whether 'src' was pending. See
+        Globals.lazy_proxies."""
+
+        if self._proxy_generator is None:
+            return False
+
+        images = self._proxy_generator.get_images(src=src)
+
+        if self._proxy_generator.generate(src=src) is False:
+            return False
+
+        # Only the Pages showing the Images were rendered before their colors
+        # were generated. The rest of the Site is left untouched.
+        for image in images:
+            self._invalidate_page(page=image.page)
+
+        return True
+
+    def _invalidate_page(self, page: "PageObj") -> None:
+
+        if self._page_generations is None:
+            self._page_generations = {}
+
+        self._page_generations[page.url] = self._page_generations.get(page.url, 0) + 1
+
+    def get_proxy(self, src: str) -> Optional["ProxyImage"]:
+        """Returns the JPEG proxy image at 'src' relative to the site's root or
+        None if 'src' isn't one."""
+
+        if self._proxies_by_src is None:
+            self._proxies_by_src = {
+                proxy.src.as_posix(): proxy
+                for image in self.iter_images()
+                for proxy in image.proxy_images.proxies
+            }
+
+        return self._proxies_by_src.get(src, None)
+
+    def get_proxy_variant(
+        self, src: str, mimetypes: Iterable[str]
+    ) -> Optional["ProxyImage"]:
+        """Returns the preferred variant of the JPEG proxy image at 'src' in
+        one of 'mimetypes' or None if there's no such variant."""
+
+        proxy = self.get_proxy(src=src)
+
+        if proxy is None:
+            return None
+
+        for variant in proxy.variants:
+            if variant.mimetype in mimetypes and variant.exists():
+                return variant
+
+        return None
+
+    def get_proxy_source(self, src: str) -> Optional[pathlib.Path]:
+        """Returns the path to the source image of the deferred proxy image at
+        'src' if it's still pending. See Globals.warm_proxies."""
+
+        if self._proxy_generator is None:
+            return None
+
+        return self._proxy_generator.get_source(src=src)
+
+    @property
+    def proxy_progress(self) -> ProxyProgress:
+        """ Returns the progress of the proxy warm-up. See Globals.warm_proxies. """
+
+        if self._proxy_generator is None:
+            return ProxyProgress()
+
+        return self._proxy_generator.progress
+
+    def generate_pending_proxies(self) -> None:
+        """ Generates all deferred proxies. See Globals.lazy_proxies. """
+
+        if self._proxy_generator is None:
+            return
+
+        self._proxy_generator.run_pending()
+
+        Globals.site_cache.save()
 
     def _build_menu(self) -> None:
 
@@ -99,19 +424,75 @@ class Site:
                 )
 
     def rebuild_cache(self) -> None:
-        # TODO:LOW This method might have room for some optimization.
 
         logger.info(f"Rebuilding site-cache to {Globals.site_paths.cache}.")
 
+        with Globals.timings.phase("rebuild proxies"):
+            self._build_proxies(force=True, defer=False)
+            self._remove_orphaned_proxies()
+
+        with Globals.timings.phase("rebuild site-cache"):
+            Globals.site_cache.save(prune=True)
+
+        self._report_timings()
+
+        self._generation += 1
+
+    def _remove_orphaned_proxies(self) -> None:
+        """Removes proxies in the site-cache that are no longer referenced by
+        any Image along with the site-cache's legacy 'pages' directory and its
+        rendered Markdown files."""
+
+        roots = {image.proxy_images.root for image in self.iter_images()}
+
+        for root in Globals.site_cache.proxies.glob("*/*"):
+
+            if root in roots:
+                continue
+
+            logger.debug(f"Removing orphaned proxies {root}.")
+
+            shutil.rmtree(root, ignore_errors=True)
+
+        shutil.rmtree(
+            Globals.site_paths.cache / Defaults.DIRECTORY_NAME_PAGES,
+            ignore_errors=True,
+        )
+
+        shutil.rmtree(Globals.site_cache.markdown, ignore_errors=True)
+
+    def iter_images(self) -> Generator["Image", None, None]:
+        """ Returns a generator of every Image in the Site including covers. """
+
         for page in self.pages:
+
+            if page.cover is not None:
+                yield page.cover
+
             for content in page.contents:
 
-                try:
-                    content.proxy_images.cache(force=True)  # type: ignore
-                    content.proxy_colors.cache(force=True)  # type: ignore
-                except AttributeError:
+                if not getattr(content, "is_image", False):
                     continue
 
+                yield content  # type: ignore
+
+    @property
+    def generation(self) -> int:
+        """Returns a counter incremented every time the Site is built. Used to
+        invalidate anything derived from a previous build e.g. rendered pages."""
+        return self._generation
+
+    def get_page_generation(self, page: Optional["PageObj"] = None) -> Tuple[int, int]:
+        """Returns the Site's generation along with a counter incremented every
+        time one of the Page's Images has its proxies generated on demand. Used
+        to invalidate anything derived from a single Page e.g. its rendered
+        HTML. See Site.generate_proxy()."""
+
+        if page is None or self._page_generations is None:
+            return (self._generation, 0)
+
+        return (self._generation, self._page_generations.get(page.url, 0))
+
     @property
     def config(self) -> "SiteConfig":
         return Globals.site_config
@@ -142,13 +523,13 @@ class Site:
 
     def get_page(self, page_url: str) -> Optional["PageObj"]:
 
-        page_url = Utils.normalize_page_path(path=page_url)
-
-        for page in self.pages:
+        if self._pages_by_url is None:
+            raise Error("Site must be built before accessing pages.")
 
-            if page.url != page_url:
-                continue
+        page = self._pages_by_url.get(page_url, None)
 
+        if page is not None:
             return page
 
-        return None
+        # Fallback for any urls that aren't an alias. This is memoized.
+        return self._pages_by_url.get(Utils.normalize_page_path(path=page_url), None)
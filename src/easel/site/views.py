@@ -1,4 +1,6 @@
-from flask import Blueprint
+from typing import Optional
+
+from flask import Blueprint, Response, current_app, request, send_file
 
 from .globals import Globals
 
@@ -9,3 +11,67 @@ blueprint_site = Blueprint(
     static_folder=str(Globals.site_paths.root),
     static_url_path=Globals.site_paths.static_url_path,
 )
+
+
+@blueprint_site.before_request
+def serve_proxy() -> Optional[Response]:
+    """Handles requests for proxies. With Globals.lazy_proxies the proxy is
+    generated before it's served. With Globals.warm_proxies the source image is
+    served until the proxy has been generated in the background. Requests for a
+    JPEG proxy are answered with its WebP/AVIF variant if the client accepts
+    one. This keeps the urls in templates unchanged."""
+
+    if request.endpoint != "site.static":
+        return None
+
+    filename = (request.view_args or {}).get("filename", None)
+
+    if filename is None:
+        return None
+
+    if Globals.lazy_proxies is True:
+        current_app.site.generate_proxy(src=filename)
+
+    elif Globals.warm_proxies is True:
+
+        path = current_app.site.get_proxy_source(src=filename)
+
+        if path is not None:
+
+            # The source must not be cached in place of the proxy. Set directly
+            # as send_file() names its cache timeout argument differently
+            # across Flask versions.
+            response = send_file(path)
+            response.cache_control.max_age = 0
+            response.cache_control.no_store = True
+
+            return response
+
+    # Wildcards are ignored as e.g. 'image/*' doesn't imply AVIF support.
+    accepted = {mimetype for mimetype, quality in request.accept_mimetypes if quality}
+
+    variant = current_app.site.get_proxy_variant(src=filename, mimetypes=accepted)
+
+    if variant is None:
+        return None
+
+    return send_file(variant.path, mimetype=variant.mimetype)
+
+
+@blueprint_site.after_request
+def vary_proxy(response: Response) -> Response:
+    """Marks responses for JPEG proxy images with variants as depending on the
+    'Accept' header so caches don't serve a variant to a client that doesn't
+    support it."""
+
+    filename = (request.view_args or {}).get("filename", None)
+
+    if request.endpoint != "site.static" or filename is None:
+        return response
+
+    proxy = current_app.site.get_proxy(src=filename)
+
+    if proxy is not None and proxy.variants:
+        response.vary.add("Accept")
+
+    return response
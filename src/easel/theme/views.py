@@ -1,8 +1,6 @@
 from typing import TYPE_CHECKING, Optional
 
-from flask import Blueprint, abort, current_app, render_template
-
-from easel.site.defaults import Defaults
+from flask import Blueprint, Response, abort, current_app
 
 from ..site.globals import Globals
 
@@ -21,24 +19,26 @@ blueprint_theme = Blueprint(
 
 
 @blueprint_theme.route("/")
-def index() -> str:
+def index() -> Response:
 
     page: "PageObj" = current_app.site.index
 
-    return render_template(Defaults.FILENAME_TEMPLATE_MAIN_HTML, page=page)
+    return current_app.page_response(page=page)
 
 
 @blueprint_theme.route("/<path:page_url>")
-def render_page(page_url: str) -> str:
+def render_page(page_url: str) -> Response:
 
     page: Optional["PageObj"] = current_app.site.get_page(page_url=page_url)
 
     if page is None:
         abort(404)
 
-    return render_template(Defaults.FILENAME_TEMPLATE_MAIN_HTML, page=page)
+    return current_app.page_response(page=page)
 
 
 @blueprint_theme.errorhandler(404)
 def error_404(error):
-    return render_template(Defaults.FILENAME_TEMPLATE_404_HTML)
+    # Sent without validators. A conditional request for a missing page must
+    # never be answered with a '304 Not Modified'.
+    return current_app.render_page(page=None)
@@ -0,0 +1,16 @@
+"""WSGI entry point for serving a site with multiple worker processes e.g.
+with gunicorn. The site-root is read from the SITE_ROOT environment variable.
+
+    $ export SITE_ROOT=./my-project
+    $ gunicorn --preload --workers=4 "easel.wsgi:app"
+
+With '--preload' the Site is built once in the master process and shared by
+the workers it forks, see Easel.freeze(). Without it each worker builds its
+own Site. Either way proxies can't be warmed up in the background, use
+SITE_LAZY_PROXIES instead of SITE_WARM_PROXIES."""
+
+from . import Easel
+
+
+app = Easel()
+app.freeze()
@@ -1,3 +1,5 @@
+import pathlib
+import shutil
 from typing import Dict
 
 import pytest
@@ -12,7 +14,9 @@ from easel.site.pages import (
     PageObj,
 )
 from tests.test_configs import (
+    TESTING_SITES_ROOT,
     PageTestConfig,
+    TestSites,
     test_config__layout,
     test_config__layout_gallery,
     test_config__lazy,
@@ -21,12 +25,37 @@ from tests.test_configs import (
 )
 
 
+@pytest.fixture(scope="session", autouse=True)
+def remove_test_sites():
+    yield
+    shutil.rmtree(TESTING_SITES_ROOT.parent, ignore_errors=True)
+
+
 @pytest.fixture(autouse=True)
 def reset__Globals_site_paths_root():
     yield
     Globals.reset()
 
 
+@pytest.fixture(autouse=True)
+def reset__Globals_proxy_modes():
+    yield
+    Globals.lazy_proxies = False
+    Globals.warm_proxies = False
+
+
+@pytest.fixture
+def site_copy(tmp_path) -> pathlib.Path:
+    """Returns the path to a fresh copy of ./tests/data/sites/site-valid without
+    its site-cache. Used for testing how the site-cache handles changes."""
+
+    root = tmp_path / TestSites.valid.name
+
+    shutil.copytree(TestSites.valid, root, ignore=shutil.ignore_patterns("site-cache"))
+
+    return root
+
+
 # -----------------------------------------------------------------------------
 # Pages in ./tests/sites/site-valid/contents/pages
 # -----------------------------------------------------------------------------
@@ -0,0 +1,180 @@
+import os
+import pathlib
+
+import pytest
+
+from easel import Easel
+from easel.builder import Builder
+from easel.site.globals import Globals
+from easel.site.helpers import Utils
+
+
+@pytest.fixture
+def easel(site_copy: pathlib.Path) -> Easel:
+    return Easel(site_copy, testing=True)
+
+
+def test__Builder__build(easel: Easel) -> None:
+
+    builder = Builder(easel)
+    builder.build()
+
+    assert builder.output == Globals.site_paths.build
+    assert (builder.output / "index.html").is_file()
+    assert (builder.output / "404.html").is_file()
+
+    for page in easel.site.pages:
+
+        path = builder.output / Utils.urlify(page.url, leading_slash=False)
+
+        with easel.app_context():
+            assert (path / "index.html").read_text() == easel.render_page(page)
+
+    # Proxies and site contents are served from '/site'.
+    for image in easel.site.iter_images():
+        assert (builder.output / "site" / image.src).is_file()
+        assert (builder.output / "site" / image.proxy_images.large.src).is_file()
+
+    # Theme assets but not theme templates are served from '/theme'.
+    assert (builder.output / "theme" / "images" / "menu.png").is_file()
+    assert not (builder.output / "theme" / "main.html").exists()
+
+    # Configs, the site-cache and the build itself are skipped.
+    assert not (builder.output / "site" / "site.yaml").exists()
+    assert not (builder.output / "site" / "site-cache" / "manifest.json").exists()
+    assert not (builder.output / "site" / "build").exists()
+
+
+def test__Builder__build_site_cache(site_copy: pathlib.Path) -> None:
+
+    easel = Easel(site_copy, testing=True, profile=True, from_snapshot=True)
+
+    # An orphaned proxy directory left behind by a removed image.
+    orphan = Globals.site_cache.proxies / "00" / "orphan" / "large.jpg"
+    orphan.parent.mkdir(parents=True)
+    orphan.write_bytes(b"")
+
+    builder = Builder(easel)
+    builder.build()
+
+    site_cache = builder.output / "site" / "site-cache"
+
+    # Only the proxies of the Site's current images are exported.
+    assert {path for path in site_cache.rglob("*") if path.is_file()} == {
+        site_cache / proxy.src.relative_to(Globals.site_cache.root.name)
+        for image in easel.site.iter_images()
+        for proxy in image.proxy_images.all_proxies
+    }
+
+
+def test__Builder__build_hardlinks(easel: Easel) -> None:
+
+    builder = Builder(easel)
+    builder.build()
+
+    image = next(easel.site.iter_images())
+
+    assert os.path.samefile(image.path, builder.output / "site" / image.src)
+
+
+def test__Builder__build_workers(easel: Easel, tmp_path: pathlib.Path) -> None:
+
+    builder_inline = Builder(easel, output=tmp_path / "inline", workers=1)
+    builder_inline.build()
+
+    builder_parallel = Builder(easel, output=tmp_path / "parallel", workers=2)
+    builder_parallel.build()
+
+    for _, path in builder_inline.iter_pages():
+
+        path_parallel = builder_parallel.output / path.relative_to(
+            builder_inline.output
+        )
+
+        assert path.read_text() == path_parallel.read_text()
+
+
+def test__Builder__build_incremental(site_copy: pathlib.Path) -> None:
+
+    asset = site_copy / "contents" / "asset.txt"
+    asset.write_text("asset")
+
+    easel = Easel(site_copy, testing=True)
+
+    builder = Builder(easel)
+    builder.build()
+
+    assert builder.manifest_path.is_file()
+    assert builder.written
+    assert not builder.removed
+
+    # Nothing has changed so nothing is written.
+    builder.build()
+
+    assert not builder.written
+    assert not builder.removed
+
+    # Removed assets are removed from the output.
+    asset.unlink()
+
+    builder.build()
+
+    assert not builder.written
+    assert builder.removed == [builder.output / "site" / "contents" / "asset.txt"]
+    assert not (builder.output / "site" / "contents" / "asset.txt").exists()
+
+
+def test__Builder__build_incremental_page(site_copy: pathlib.Path) -> None:
+
+    easel = Easel(site_copy, testing=True)
+
+    Builder(easel).build()
+
+    page_yaml = site_copy / "contents" / "pages" / "page-lazy" / "page.yaml"
+    page_yaml.write_text(
+        page_yaml.read_text().replace("title: PageLazy\n", "title: Changed\n")
+    )
+
+    easel = Easel(site_copy, testing=True)
+
+    builder = Builder(easel)
+    builder.build()
+
+    path = builder.output / "page-lazy" / "index.html"
+
+    assert builder.written == [path]
+    assert "Changed" in path.read_text()
+
+
+def test__Utils__link_or_copy(tmp_path: pathlib.Path, monkeypatch) -> None:
+
+    src = tmp_path / "src.txt"
+    src.write_text("src")
+
+    dst = tmp_path / "nested" / "dst.txt"
+
+    Utils.link_or_copy(src, dst)
+
+    assert os.path.samefile(src, dst)
+
+    def link_fail(*args, **kwargs):
+        raise OSError("Cross-device link.")
+
+    monkeypatch.setattr(os, "link", link_fail)
+
+    Utils.link_or_copy(src, dst)
+
+    assert not os.path.samefile(src, dst)
+    assert dst.read_text() == "src"
+
+
+def test__Builder__build_lazy_proxies(site_copy: pathlib.Path) -> None:
+
+    easel = Easel(site_copy, testing=True, lazy_proxies=True)
+
+    builder = Builder(easel)
+    builder.build()
+
+    # Deferred proxies are generated before the assets are copied.
+    for image in easel.site.iter_images():
+        assert (builder.output / "site" / image.proxy_images.large.src).is_file()
@@ -64,3 +64,24 @@ def test__rebuild_site_cache(runner):
     )
 
     assert result.exit_code == 0
+
+
+def test__rebuild_site_cache_workers(runner):
+
+    result = runner.invoke(
+        cli,
+        [*TEST_SITE_VALID, "--workers=2", "rebuild-site-cache"],
+    )
+
+    assert result.exit_code == 0
+
+
+def test__build(runner, site_copy):
+
+    result = runner.invoke(
+        cli,
+        ["--site-root", str(site_copy), "--testing", "build"],
+    )
+
+    assert result.exit_code == 0
+    assert (site_copy / "build" / "index.html").is_file()
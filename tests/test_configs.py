@@ -1,5 +1,7 @@
 import datetime
 import pathlib
+import shutil
+import tempfile
 from typing import List, Optional, Union
 
 from easel.site.contents import (
@@ -17,10 +19,21 @@ from easel.site.defaults import Key
 
 TESTING_DATA_ROOT = pathlib.Path(__file__).parent / "data"
 
+# Building a site writes to its site-cache. The tests run against a copy of the
+# sites so ./tests/data is never written to. See conftest.remove_test_sites().
+TESTING_SITES_ROOT = pathlib.Path(tempfile.mkdtemp(prefix="easel-tests-")) / "sites"
+
+shutil.copytree(
+    TESTING_DATA_ROOT / "sites",
+    TESTING_SITES_ROOT,
+    symlinks=True,
+    ignore=shutil.ignore_patterns("site-cache"),
+)
+
 
 class TestSites:
 
-    root = TESTING_DATA_ROOT / "sites"
+    root = TESTING_SITES_ROOT
 
     valid = root / "site-valid"
     missing_site_yaml = root / "site-missing-site.yaml"
@@ -3,6 +3,7 @@ import pytest
 from easel.site.contents import Audio, Embedded, Image, Video
 from easel.site.defaults import Key
 from easel.site.errors import ContentConfigError
+from easel.site.markdown import Markdown
 from easel.site.pages import PageObj
 
 
@@ -132,3 +133,43 @@ def test__CaptionsMixin__invalid_alignment(page_test_content_types: "PageObj") -
 
     with pytest.raises(ContentConfigError):
         Image(page=page_test_content_types, **config)
+
+
+def test__CaptionsMixin__compile_captions(
+    page_test_content_types: "PageObj", monkeypatch
+) -> None:
+
+    images = [
+        Image(
+            page=page_test_content_types,
+            **{
+                Key.PATH: "./contents/image.jpg",
+                Key.CAPTION: {Key.TITLE: "Title"},
+            },
+        )
+        for _ in range(3)
+    ]
+
+    rendered = []
+    from_string_original = Markdown.from_string
+
+    def from_string_counted(string=None):
+        rendered.append(string)
+        return from_string_original(string)
+
+    monkeypatch.setattr(Markdown, "from_string", from_string_counted)
+
+    compiled: dict = {}
+
+    for image in images:
+        image.compile_captions(compiled=compiled)
+
+    # Identical captions are rendered once.
+    assert rendered == ["Title", ""]
+
+    for image in images:
+        assert image.caption_title == "<p>Title</p>"
+        assert image.caption_description == ""
+
+    # Compiled captions aren't rendered again on access.
+    assert rendered == ["Title", ""]
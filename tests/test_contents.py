@@ -1,3 +1,5 @@
+import pathlib
+
 import pytest
 
 from easel.site.contents import Audio, Break, Embedded, Header, Image, TextBlock, Video
@@ -101,6 +103,57 @@ def test__Image__valid(page_test_content_types: "PageObj") -> None:
     assert image.proxy_colors is not None
 
 
+def test__Image__paths_resolved_once(
+    page_test_content_types: "PageObj", monkeypatch
+) -> None:
+
+    image = Image(page=page_test_content_types, path="./contents/image.jpg")
+
+    src = image.src
+
+    # Proxy paths and variants are resolved on first access.
+    for proxy in image.proxy_images.proxies:
+        assert proxy.src is proxy.src
+        assert [variant.src.name for variant in proxy.variants] == [
+            f"{proxy.name}.webp"
+        ]
+
+    def relative_to_fail(*args, **kwargs):
+        raise AssertionError("Paths should only be resolved once.")
+
+    monkeypatch.setattr(pathlib.PurePath, "relative_to", relative_to_fail)
+
+    assert image.src is src
+    assert image.path == Globals.site_paths.root / src
+    assert image.filename == "image.jpg"
+
+    for proxy in image.proxy_images.proxies:
+        assert proxy.path == Globals.site_paths.root / proxy.src
+        assert proxy.src.name == f"{proxy.name}.jpg"
+        assert proxy.variants is proxy.variants
+
+        for variant in proxy.variants:
+            assert variant.path == Globals.site_paths.root / variant.src
+
+
+def test__Image__srcset(page_test_content_types: "PageObj") -> None:
+
+    image = Image(page=page_test_content_types, path="./contents/image.jpg")
+
+    large, medium, small = image.proxy_images.proxies
+
+    assert image.proxy_images.srcset() == (
+        f"{large.url} {large.size[0]}w, "
+        f"{medium.url} {medium.size[0]}w, "
+        f"{small.url} {small.size[0]}w"
+    )
+    assert image.proxy_images.srcset(format="webp").count(".webp ") == 3
+    assert image.proxy_images.srcset(format="avif") == ""
+    assert image.proxy_images.sources == [
+        {"type": "image/webp", "srcset": image.proxy_images.srcset(format="webp")}
+    ]
+
+
 # -----------------------------------------------------------------------------
 # Audio
 # -----------------------------------------------------------------------------
@@ -281,3 +334,17 @@ def test__Break__invalid_size(page_test_content_types: "PageObj") -> None:
 
     with pytest.raises(ContentConfigError):
         Break(page=page_test_content_types, size="invalid")
+
+
+def test__Image__slots(page_test_content_types: "PageObj") -> None:
+
+    image = Image(page=page_test_content_types, path="./contents/image.jpg")
+
+    for item in [
+        image,
+        image.proxy_images,
+        image.proxy_colors,
+        *image.proxy_images.all_proxies,
+        *image.proxy_colors.proxies,
+    ]:
+        assert not hasattr(item, "__dict__")
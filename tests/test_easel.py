@@ -1,3 +1,5 @@
+import gc
+import importlib
 import os
 
 import pytest
@@ -57,6 +59,20 @@ def test__Easel__invalid() -> None:
         Easel(TestSites.missing_site_yaml)
 
 
+def test__Easel__invalid_workers(monkeypatch) -> None:
+
+    workers = Globals.workers
+
+    for value in ["four", "4.0", "0", "-1"]:
+
+        monkeypatch.setenv(Key.SITE_WORKERS, value)
+
+        with pytest.raises(SiteConfigError):
+            Easel(TestSites.valid)
+
+        assert Globals.workers == workers
+
+
 def test__Easel__filters_valid() -> None:
 
     easel = Easel(TestSites.valid)
@@ -85,3 +101,35 @@ def test__Easel__filters_invalid() -> None:
 
     with pytest.raises(ThemeConfigError):
         easel._filter__theme_url(path="missing-#.js")
+
+
+def test__Easel__freeze(monkeypatch) -> None:
+
+    easel = Easel(TestSites.valid, testing=True)
+
+    frozen = []
+
+    monkeypatch.setattr(gc, "freeze", lambda: frozen.append(True))
+
+    def render_page_fail(page=None):
+        raise AssertionError("Frozen pages should already be rendered.")
+
+    easel.freeze()
+
+    monkeypatch.setattr(easel, "_render_page", render_page_fail)
+
+    assert frozen == [True]
+
+    with easel.test_client() as client:
+        for page in easel.site.pages:
+            assert client.get(page.url).status_code == 200
+
+
+def test__wsgi(monkeypatch) -> None:
+
+    monkeypatch.setenv(Key.SITE_ROOT, str(TestSites.valid))
+    monkeypatch.setattr(gc, "freeze", lambda: None)
+
+    wsgi = importlib.import_module("easel.wsgi")
+
+    assert isinstance(wsgi.app, Easel)
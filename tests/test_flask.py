@@ -1,4 +1,10 @@
+import os
+import shutil
+
 from easel import Easel
+from easel.site.defaults import Defaults
+from easel.site.globals import Globals
+from easel.site.metrics import Metrics
 from tests.test_configs import TestSites
 
 
@@ -19,3 +25,211 @@ def test__pages():
 
         assert response_index.status_code == 200
         assert response_missing.status_code == 200
+
+
+def test__render_cache(monkeypatch):
+
+    easel = Easel(TestSites.valid)
+
+    rendered = []
+    render_page_original = easel._render_page
+
+    def render_page_counted(page=None):
+        rendered.append(page)
+        return render_page_original(page=page)
+
+    monkeypatch.setattr(easel, "_render_page", render_page_counted)
+
+    with easel.test_client() as client:
+
+        response_first = client.get("/")
+        response_second = client.get("/")
+
+        assert response_first.data == response_second.data
+        assert len(rendered) == 1
+
+        client.get("/page-missing")
+        client.get("/page-missing")
+
+        assert len(rendered) == 2
+
+        # Rebuilding the Site invalidates previously rendered pages.
+        easel.site.build()
+
+        client.get("/")
+
+        assert len(rendered) == 3
+
+
+def test__render_cache_prerender(monkeypatch):
+
+    easel = Easel(TestSites.valid, prerender=True)
+
+    def render_page_fail(page=None):
+        raise AssertionError("Pre-rendered pages should not be rendered again.")
+
+    monkeypatch.setattr(easel, "_render_page", render_page_fail)
+
+    with easel.test_client() as client:
+
+        for page in easel.site.pages:
+            assert client.get(page.url).status_code == 200
+
+        assert client.get("/page-missing").status_code == 200
+
+
+def test__render_cache_disabled(monkeypatch):
+
+    easel = Easel(TestSites.valid, render_cache_size=0)
+
+    with easel.test_client() as client:
+
+        client.get("/")
+
+    assert len(easel._rendered_pages) == 0
+
+
+def test__conditional_requests(monkeypatch):
+
+    easel = Easel(TestSites.valid)
+
+    with easel.test_client() as client:
+
+        response = client.get("/")
+
+        assert response.status_code == 200
+        assert response.headers["ETag"]
+        assert response.headers["Last-Modified"]
+
+        def render_page_fail(page=None):
+            raise AssertionError("Unmodified pages should not be rendered again.")
+
+        monkeypatch.setattr(easel, "_render_page", render_page_fail)
+
+        # Evict the rendered HTML to ensure the validators alone are used.
+        easel.clear_render_cache()
+
+        response_etag = client.get(
+            "/", headers={"If-None-Match": response.headers["ETag"]}
+        )
+        response_last_modified = client.get(
+            "/", headers={"If-Modified-Since": response.headers["Last-Modified"]}
+        )
+
+        assert response_etag.status_code == 304
+        assert response_etag.headers["ETag"] == response.headers["ETag"]
+        assert response_etag.data == b""
+        assert response_last_modified.status_code == 304
+
+        monkeypatch.undo()
+
+        response_stale = client.get("/", headers={"If-None-Match": '"stale"'})
+
+        assert response_stale.status_code == 200
+        assert response_stale.headers["ETag"] == response.headers["ETag"]
+
+
+def test__conditional_requests_404():
+
+    easel = Easel(TestSites.valid)
+
+    with easel.test_client() as client:
+
+        response = client.get("/missing", headers={"If-None-Match": "*"})
+
+        assert response.status_code == 200
+        assert "ETag" not in response.headers
+        assert "Last-Modified" not in response.headers
+
+
+def test__last_modified_templates(tmp_path):
+
+    root = tmp_path / TestSites.theme_custom_valid.name
+
+    shutil.copytree(TestSites.theme_custom_valid, root)
+
+    easel = Easel(root)
+
+    last_modified = easel._get_last_modified(page=easel.site.index)
+
+    # Editing the theme's templates changes the pages' Last-Modified once the
+    # Site is rebuilt. The templates are only checked once per build.
+    template = Globals.theme_paths.template_main_html
+    os.utime(template, (template.stat().st_atime, last_modified.timestamp() + 60))
+
+    assert easel._get_last_modified(page=easel.site.index) == last_modified
+
+    easel.site.build()
+
+    assert easel._get_last_modified(page=easel.site.index) > last_modified
+
+
+def test__last_modified_cover_description(site_copy):
+
+    easel = Easel(site_copy)
+
+    page = easel.site.get_page(page_url="page-lazy")
+
+    for path in [page.cover.path, page.description.path]:
+
+        last_modified = easel._get_last_modified(page=page)
+
+        os.utime(path, (path.stat().st_atime, last_modified.timestamp() + 60))
+
+        assert easel._get_last_modified(page=page) > last_modified
+
+
+def test__metrics():
+
+    Metrics.clear()
+
+    easel = Easel(TestSites.valid, metrics=True)
+
+    with easel.test_client() as client:
+
+        for page in easel.site.pages:
+            client.get(page.url)
+
+        client.get("/page-missing")
+
+        response = client.get(Defaults.METRICS_URL)
+
+    assert response.status_code == 200
+    assert response.content_type == Defaults.METRICS_CONTENT_TYPE
+
+    metrics = response.get_data(as_text=True)
+
+    assert "# TYPE easel_page_render_seconds histogram" in metrics
+    assert 'easel_request_duration_seconds_count{endpoint="theme.render_page"}' in (
+        metrics
+    )
+
+    for page in easel.site.pages:
+        assert Metrics.renders.get(page.url)[1] == 1  # type: ignore
+
+    assert Metrics.renders.get("404") is not None
+
+    # The time spent in Markdown and filters is measured during the render.
+    for phase in [Defaults.METRICS_PHASE_MARKDOWN, Defaults.METRICS_PHASE_FILTERS]:
+        assert sum(
+            Metrics.phases.get(page.url, phase)[0]  # type: ignore
+            for page in easel.site.pages
+        )
+
+    assert Metrics.requests.get("metrics") is None
+
+
+def test__metrics_disabled():
+
+    Metrics.clear()
+
+    easel = Easel(TestSites.valid)
+
+    with easel.test_client() as client:
+
+        client.get("/")
+
+        response = client.get(Defaults.METRICS_URL)
+
+    assert response.content_type != Defaults.METRICS_CONTENT_TYPE
+    assert Metrics.renders.get(easel.site.index.url) is None
@@ -1,12 +1,15 @@
 import copy
 import datetime
 import os
+import pathlib
+import threading
 
 import pytest
 
 from easel.site.defaults import Defaults
 from easel.site.errors import ConfigLoadError
-from easel.site.helpers import SafeDict, Utils
+from easel.site import helpers
+from easel.site.helpers import LRUCache, SafeDict, Timings, Utils
 from tests.test_configs import TestYAML
 
 
@@ -310,3 +313,132 @@ def test__SafeDict__both() -> None:
     assert isinstance(safe_dict["missing_item"], SafeDict)
     assert isinstance(safe_dict.missing_attr.missing_attr, SafeDict)
     assert isinstance(safe_dict["missing_item"]["missing_item"], SafeDict)
+
+
+def test__LRUCache() -> None:
+
+    cache = LRUCache(maxsize=2)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+
+    assert cache.get("a") == 1
+
+    # 'b' is now the least recently used item.
+    cache.set("c", 3)
+
+    assert "b" not in cache
+    assert cache.get("b", "missing") == "missing"
+    assert len(cache) == 2
+
+    cache.clear()
+
+    assert len(cache) == 0
+
+
+def test__Timings() -> None:
+
+    timings = Timings()
+
+    with timings.phase("pages"):
+        pass
+
+    timings.add("pages", 1.0)
+    timings.add("pages", 0.5, item="page-a")
+    timings.add("pages", 0.25, item="page-b")
+    timings.add("pages", 0.25, item="page-b")
+    timings.add("proxy images", 2.0, item="image.jpg")
+
+    assert timings.phases["pages"] >= 1.0
+    assert timings.slowest("pages", count=1) == [("page-a", 0.5)]
+    assert timings.items["pages"]["page-b"] == 0.5
+
+    summary = timings.summary()
+
+    # Item-only sections are listed after the phases.
+    assert summary.index("pages") < summary.index("proxy images")
+    assert "image.jpg" in summary
+
+    assert timings.to_dict() == {
+        "phases": timings.phases,
+        "items": timings.items,
+    }
+
+    timings.reset()
+
+    assert timings.phases == {}
+    assert timings.items == {}
+
+
+# -----------------------------------------------------------------------------
+# Utils.open_atomic
+# -----------------------------------------------------------------------------
+
+
+def test__open_atomic(tmp_path: pathlib.Path) -> None:
+
+    path = tmp_path / "file.txt"
+
+    with Utils.open_atomic(path, "w") as f:
+        f.write("written")
+
+        # Nothing is visible until the block exits.
+        assert not path.exists()
+
+    assert path.read_text() == "written"
+
+    # Same permissions as a file created with open().
+    with open(tmp_path / "reference.txt", "w"):
+        pass
+
+    assert path.stat().st_mode == (tmp_path / "reference.txt").stat().st_mode
+
+    with pytest.raises(RuntimeError):
+        with Utils.open_atomic(path, "w") as f:
+            f.write("partial")
+            raise RuntimeError
+
+    # The original is left untouched and no temporary files are left behind.
+    assert path.read_text() == "written"
+    assert sorted(tmp_path.iterdir()) == [path, tmp_path / "reference.txt"]
+
+
+def test__open_atomic__threads(tmp_path: pathlib.Path) -> None:
+
+    path = tmp_path / "file.txt"
+
+    def write(value: str) -> None:
+        for _ in range(50):
+            with Utils.open_atomic(path, "w") as f:
+                f.write(value * 1024)
+
+    threads = [threading.Thread(target=write, args=(str(i),)) for i in range(4)]
+
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    # Concurrent writers never share a temporary file.
+    assert path.read_text() in [str(i) * 1024 for i in range(4)]
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test__get_umask(monkeypatch) -> None:
+
+    umask = os.umask(0)
+    os.umask(umask)
+
+    monkeypatch.setattr(helpers, "_umask", None)
+
+    # Where possible the umask is read without setting it.
+    if pathlib.Path("/proc/self/status").exists():
+
+        def umask_fail(*args, **kwargs):
+            raise AssertionError("The umask should be read from /proc.")
+
+        monkeypatch.setattr(os, "umask", umask_fail)
+
+    assert Utils.get_umask() == umask
+    assert helpers._umask == umask
@@ -1,3 +1,10 @@
+import pathlib
+import threading
+
+import pymdownx
+
+from easel.site import Site
+from easel.site.globals import Globals
 from easel.site.markdown import Markdown
 
 
@@ -24,3 +31,120 @@ def test__from_string__valid() -> None:
     # fmt:on
 
     assert render_02 == ""
+
+
+def test__converters_reused(monkeypatch) -> None:
+
+    built = []
+    build_converter_original = Markdown._build_converter
+
+    def build_converter_counted(base_path=None):
+        built.append(base_path)
+        return build_converter_original(base_path=base_path)
+
+    monkeypatch.setattr(Markdown, "_build_converter", build_converter_counted)
+    monkeypatch.setattr(Markdown, "_local", threading.local())
+
+    for _ in range(3):
+        Markdown.from_string("Lorem ipsum.")
+
+    assert built == [None]
+
+    # State from one document doesn't leak into the next.
+    render_01 = Markdown.from_string("Lorem[^1]\n\n[^1]: Ipsum.")
+    render_02 = Markdown.from_string("Dolor sit amet.")
+
+    assert "footnote" in render_01
+    assert "footnote" not in render_02
+
+
+def test__converters_per_thread() -> None:
+
+    converters = []
+
+    def get_converter():
+        converters.append(Markdown._get_converter())
+
+    thread = threading.Thread(target=get_converter)
+    thread.start()
+    thread.join()
+
+    get_converter()
+
+    assert converters[0] is not converters[1]
+
+
+def test__from_file__memoized(site_copy: pathlib.Path, monkeypatch) -> None:
+
+    Globals.init(root=site_copy)
+
+    path = site_copy / "contents" / "pages" / "page-lazy" / "markdown.md"
+    path.write_text("# Lorem Ipsum")
+
+    render = Markdown.from_file(path)
+
+    def from_file_fail(*args, **kwargs):
+        raise AssertionError("Unchanged files should not be converted again.")
+
+    monkeypatch.setattr(Markdown, "_from_file", from_file_fail)
+
+    assert Markdown.from_file(path) == render
+
+    # The on-disk tier survives the in-memory cache being cleared.
+    Markdown._rendered.clear()
+
+    assert Markdown.from_file(path) == render
+
+    monkeypatch.undo()
+
+    path.write_text("# Dolor Sit")
+
+    assert Markdown.from_file(path) == "<h1>Dolor Sit</h1>"
+
+
+def test__from_file__key(site_copy: pathlib.Path, monkeypatch) -> None:
+
+    Globals.init(root=site_copy)
+
+    path = site_copy / "contents" / "pages" / "page-lazy" / "description.md"
+
+    key = Markdown.get_key(path)
+
+    assert Markdown.get_key(path) == key
+
+    # Upgrading pymdown-extensions or changing the extensions' configs changes
+    # the rendered HTML.
+    monkeypatch.setattr(pymdownx, "__version__", "0.0.0")
+
+    assert Markdown.get_key(path) != key
+
+    monkeypatch.undo()
+    monkeypatch.setattr(Markdown, "EXTENSIONS", Markdown.EXTENSIONS[:-1])
+
+    assert Markdown.get_key(path) != key
+
+
+def test__from_file__pruned(site_copy: pathlib.Path) -> None:
+
+    Globals.init(root=site_copy)
+
+    site = Site()
+    site.build()
+
+    description = site.get_page("page-lazy").description  # type: ignore
+    description.body
+
+    orphan = Globals.site_cache.markdown / "00" / f"{'0' * 64}.html"
+    orphan.parent.mkdir(parents=True, exist_ok=True)
+    orphan.write_text("<p>Orphan</p>")
+
+    # Rendered Markdown is kept as long as the file is part of the Site.
+    Globals.init(root=site_copy)
+
+    site = Site()
+    site.build()
+
+    key = Markdown.get_key(description.path)
+
+    assert not orphan.exists()
+    assert Globals.site_cache.get_markdown(key) is not None
@@ -0,0 +1,63 @@
+from easel.site.metrics import Histogram, _Metrics
+
+
+def test__Histogram() -> None:
+
+    histogram = Histogram(
+        name="test_seconds", help="Test.", labels=("page",), buckets=(0.1, 1.0)
+    )
+
+    histogram.observe(0.05, "/page")
+    histogram.observe(0.1, "/page")
+    histogram.observe(5.0, "/page")
+    histogram.observe(0.5, 'a"b')
+
+    assert histogram.get("/page") == (5.15, 3)
+    assert histogram.get("/missing") is None
+
+    lines = histogram.expose()
+
+    assert lines[:2] == ["# HELP test_seconds Test.", "# TYPE test_seconds histogram"]
+    assert 'test_seconds_bucket{page="/page",le="0.1"} 2' in lines
+    assert 'test_seconds_bucket{page="/page",le="1"} 2' in lines
+    assert 'test_seconds_bucket{page="/page",le="+Inf"} 3' in lines
+    assert 'test_seconds_count{page="/page"} 3' in lines
+    assert 'test_seconds_bucket{page="a\\"b",le="1"} 1' in lines
+
+    histogram.clear()
+
+    assert histogram.get("/page") is None
+
+
+def test__Metrics__render() -> None:
+
+    metrics = _Metrics()
+
+    # Nothing is recorded while disabled.
+    with metrics.render(page="/page"):
+        with metrics.measure("markdown"):
+            pass
+
+    assert metrics.renders.get("/page") is None
+
+    metrics.enabled = True
+
+    with metrics.render(page="/page"):
+
+        with metrics.measure("markdown"):
+            pass
+
+        # Nested renders are counted as part of the outer render.
+        with metrics.render(page="/nested"):
+            pass
+
+    assert metrics.renders.get("/page")[1] == 1  # type: ignore
+    assert metrics.renders.get("/nested") is None
+    assert metrics.phases.get("/page", "markdown")[1] == 1  # type: ignore
+    assert metrics.phases.get("/page", "template")[1] == 1  # type: ignore
+
+    # Measuring outside of a render is a no-op.
+    with metrics.measure("markdown"):
+        pass
+
+    assert metrics.phases.get("/page", "markdown")[1] == 1  # type: ignore
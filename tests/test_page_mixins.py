@@ -1,3 +1,7 @@
+import os
+import pathlib
+import shutil
+
 import pytest
 
 from easel.site.defaults import Key
@@ -205,3 +209,56 @@ def test__ShowCaptionsMixin__unset(show_captions_pages) -> None:
 def test__ShowCaptionsMixin__invalid_type(show_captions_pages) -> None:
     for cls, ptc in show_captions_pages.items():
         run__ShowCaptionsMixin__invalid_type(cls=cls, ptc=ptc)
+
+
+def test__LazyMixin__directory_contents_walked_once(monkeypatch) -> None:
+
+    Globals.init(root=TestSites.misc_tests)
+
+    path = (
+        TestSites.misc_tests
+        / "contents"
+        / "pages"
+        / "page-test-lazy-mixin-directory-contents"
+    )
+
+    scanned = []
+    scandir_original = os.scandir
+
+    def scandir_counted(*args, **kwargs):
+        scanned.append(args[0])
+        return scandir_original(*args, **kwargs)
+
+    monkeypatch.setattr(os, "scandir", scandir_counted)
+
+    page = Lazy(path=path, config={})
+
+    # Hidden, private, unsupported, YAML files and symlinks are all skipped.
+    assert page.contents == []
+    assert scanned == [path]
+
+
+def test__LazyMixin__symlinked_directories(site_copy: pathlib.Path, tmp_path) -> None:
+
+    Globals.init(root=site_copy)
+
+    page_lazy = site_copy / "contents" / "pages" / "page-lazy"
+
+    # A directory outside of the Page's directory containing a symlink back to
+    # itself.
+    shared = tmp_path / "shared"
+    shared.mkdir()
+    shutil.copy(page_lazy / "cover.jpg", shared / "image.jpg")
+    (shared / "loop").symlink_to(shared, target_is_directory=True)
+
+    path = site_copy / "contents" / "pages" / "page-symlinks"
+    path.mkdir()
+    (path / "linked").symlink_to(shared, target_is_directory=True)
+    (path / "image.jpg").symlink_to(shared / "image.jpg")
+
+    page = Lazy(path=path, config={})
+
+    # Symlinked directories are followed, symlinked files and loops aren't.
+    assert [content.path for content in page.contents] == [
+        path / "linked" / "image.jpg"
+    ]
@@ -0,0 +1,721 @@
+import concurrent.futures
+import json
+import pathlib
+import threading
+import time
+
+import PIL.Image
+import PIL.JpegImagePlugin
+import pytest
+
+from easel import Easel
+from easel.site import Site
+from easel.site.contents import proxies
+from easel.site.contents.proxies import (
+    ProxyGenerator,
+    ProxyProgress,
+    _get_draft_size,
+    generate_proxies,
+)
+from easel.site.defaults import Defaults
+from easel.site.errors import Error, SiteConfigError
+from easel.site.globals import Globals, SiteCache
+from easel.site.helpers import Utils
+from tests.test_configs import TestSites
+
+
+@pytest.fixture
+def site(site_copy: pathlib.Path) -> Site:
+
+    Globals.init(root=site_copy)
+
+    site = Site()
+    site.build()
+
+    return site
+
+
+# -----------------------------------------------------------------------------
+# ProxyGenerator
+# -----------------------------------------------------------------------------
+
+
+def test__ProxyGenerator__build(site: Site) -> None:
+
+    for image in site.iter_images():
+
+        assert image.proxy_images.all_proxies_exist()
+
+        entry = Globals.site_cache.get_proxies(image.proxy_images.key)
+
+        assert sorted(entry["images"]) == [
+            "large.jpg",
+            "large.webp",
+            "medium.jpg",
+            "medium.webp",
+            "small.jpg",
+            "small.webp",
+        ]
+
+        for proxy in image.proxy_colors.proxies:
+            assert entry["colors"][proxy.name] == proxy.color
+            assert len(proxy.color) == 3
+
+
+def test__ProxyGenerator__build_job(site: Site) -> None:
+
+    image = next(site.iter_images())
+
+    assert ProxyGenerator.build_job(image=image) is None
+
+    job = ProxyGenerator.build_job(image=image, force=True)
+
+    assert job is not None
+    assert job["path"] == str(image.path)
+    assert job["colors"] == ["average", "dominant"]
+    assert [proxy["filename"] for proxy in job["images"]] == [
+        "large.jpg",
+        "large.webp",
+        "medium.jpg",
+        "medium.webp",
+        "small.jpg",
+        "small.webp",
+    ]
+    assert [proxy["size"] for proxy in job["images"]] == [
+        proxy.size for proxy in image.proxy_images.all_proxies
+    ]
+    assert all(proxy["save"] for proxy in job["images"])
+
+
+def test__ProxyGenerator__sizes(site_copy: pathlib.Path) -> None:
+
+    with open(site_copy / "site.yaml", "a") as f:
+        f.write(
+            "\ntheme:\n  proxies:\n    formats: []\n    sizes:\n"
+            "      - {name: thumb, size: 64, quality: 70}\n"
+            "      - {name: full, size: 128}\n"
+        )
+
+    Globals.init(root=site_copy)
+
+    site = Site()
+    site.build()
+
+    image = next(site.iter_images())
+
+    assert [proxy.name for proxy in image.proxy_images.proxies] == ["full", "thumb"]
+    assert image.proxy_images.thumb.quality == 70
+    assert image.proxy_images.get("medium") is None
+    assert image.proxy_images.srcset().endswith("/thumb.jpg 64w")
+
+    with pytest.raises(AttributeError):
+        image.proxy_images.medium
+
+    assert sorted(Globals.site_cache.get_proxies(image.proxy_images.key)["images"]) == [
+        "full.jpg",
+        "thumb.jpg",
+    ]
+
+    for proxy in image.proxy_images.proxies:
+        with PIL.Image.open(proxy.path) as proxy_image:
+            assert max(proxy_image.size) == proxy.size[0]
+
+
+def test__ProxyGenerator__workers(site: Site) -> None:
+
+    images = list(site.iter_images())
+
+    colors_inline = {}
+
+    for image in images:
+        job = ProxyGenerator.build_job(image=image, force=True)
+        colors_inline[image.path] = generate_proxies(job)  # type: ignore
+
+    ProxyGenerator(workers=2).run(images=images, force=True)
+
+    for image in images:
+        colors = colors_inline[image.path]["colors"]
+
+        assert image.proxy_colors.average.color == colors["average"]
+        assert image.proxy_colors.dominant.color == colors["dominant"]
+
+
+def test__ProxyGenerator__workers_invalid() -> None:
+
+    workers = Globals.workers
+
+    with pytest.raises(SiteConfigError):
+        Globals.workers = 0
+
+    assert Globals.workers == workers
+
+
+def test__generate_proxies__single_decode(site: Site, monkeypatch) -> None:
+
+    opened = []
+    open_original = PIL.Image.open
+
+    def open_counted(*args, **kwargs):
+        opened.append(args[0])
+        return open_original(*args, **kwargs)
+
+    monkeypatch.setattr(PIL.Image, "open", open_counted)
+
+    image = next(site.iter_images())
+    job = ProxyGenerator.build_job(image=image, force=True)
+
+    result = generate_proxies(job)  # type: ignore
+
+    assert len(opened) == 1
+    assert set(result["colors"]) == {"average", "dominant"}
+    assert set(result["timings"]) == {"images", "colors"}
+
+
+def test__generate_proxies__draft(site: Site, monkeypatch) -> None:
+
+    drafts = []
+    draft_original = PIL.JpegImagePlugin.JpegImageFile.draft
+
+    def draft_recorded(self, mode, size):
+        drafts.append((self.size, size))
+        return draft_original(self, mode, size)
+
+    monkeypatch.setattr(PIL.JpegImagePlugin.JpegImageFile, "draft", draft_recorded)
+
+    image = next(site.iter_images())
+    job = ProxyGenerator.build_job(image=image, force=True)
+
+    generate_proxies(job)  # type: ignore
+
+    assert len(drafts) == 1
+
+    with PIL.Image.open(image.proxy_images.large.path) as large:
+        assert max(large.size) == min(
+            max(image.proxy_images.large.size), max(drafts[0][0])
+        )
+
+
+def test__ProxyGenerator__deferred(site_copy: pathlib.Path) -> None:
+
+    easel = Easel(site_copy, testing=True, lazy_proxies=True)
+
+    images = list(easel.site.iter_images())
+
+    assert not any(image.proxy_images.large.exists() for image in images)
+
+    image = images[0]
+
+    with easel.test_client() as client:
+        response = client.get(
+            f"{Globals.site_paths.static_url_path}/"
+            f"{image.proxy_images.medium.src.as_posix()}"
+        )
+
+    assert response.status_code == 200
+    assert image.proxy_images.all_proxies_exist()
+    assert image.proxy_colors.dominant.load()
+
+    # The generated proxies are recorded in the site-cache.
+    entry = Globals.site_cache.get_proxies(image.proxy_images.key)
+
+    assert sorted(entry["images"]) == sorted(
+        proxy.filename for proxy in image.proxy_images.all_proxies
+    )
+    assert not easel.site.generate_proxy(src=image.proxy_images.small.src.as_posix())
+
+    easel.site.generate_pending_proxies()
+
+    assert all(image.proxy_images.all_proxies_exist() for image in images)
+
+
+def test__ProxyGenerator__deferred_saved(site_copy: pathlib.Path, monkeypatch) -> None:
+
+    monkeypatch.setattr(Defaults, "PROXY_SAVE_INTERVAL", 3600.0)
+
+    # A second, distinct image so a job is still pending after the first.
+    PIL.Image.new("RGB", (64, 64), (255, 0, 0)).save(
+        site_copy / "contents" / "pages" / "page-layout" / "contents" / "image.jpg"
+    )
+
+    Globals.init(root=site_copy)
+    Globals.lazy_proxies = True
+
+    site = Site()
+    site.build()
+
+    generation = site.generation
+    generations = {page.url: site.get_page_generation(page) for page in site.pages}
+
+    image = site.get_page("page-layout-gallery").cover  # type: ignore
+
+    # Pages showing an identical Image share its proxies.
+    stale = {
+        other.page.url
+        for other in site.iter_images()
+        if other.proxy_images.root == image.proxy_images.root
+    }
+
+    def load_manifest() -> dict:
+        with open(Globals.site_cache.path, "r") as f:
+            return json.load(f)
+
+    assert site.generate_proxy(src=image.proxy_images.large.src.as_posix())
+
+    # Only the Pages rendered before the Image's colors were generated are stale.
+    assert site.generation == generation
+    assert stale != {page.url for page in site.pages}
+
+    for page in site.pages:
+        if page.url in stale:
+            assert site.get_page_generation(page) > generations[page.url]
+        else:
+            assert site.get_page_generation(page) == generations[page.url]
+
+    # The site-cache is only saved periodically...
+    assert image.proxy_images.key not in load_manifest()["proxies"]
+
+    # ...and on exit, once the generator is replaced or nothing is pending.
+    site._proxy_generator.close()  # type: ignore
+
+    assert image.proxy_images.key in load_manifest()["proxies"]
+
+
+def test__ProxyGenerator__deferred_coalesced(
+    site_copy: pathlib.Path, monkeypatch
+) -> None:
+
+    Globals.init(root=site_copy)
+    Globals.lazy_proxies = True
+
+    site = Site()
+    site.build()
+
+    image = next(site.iter_images())
+
+    started = threading.Event()
+    release = threading.Event()
+    generated = []
+    generate_proxies_original = proxies.generate_proxies
+
+    def generate_proxies_blocking(job):
+        generated.append(job["path"])
+        started.set()
+        release.wait(timeout=10)
+        return generate_proxies_original(job)
+
+    monkeypatch.setattr(proxies, "generate_proxies", generate_proxies_blocking)
+
+    results = []
+
+    def request(src: str) -> None:
+        results.append(site.generate_proxy(src=src))
+
+    threads = [
+        threading.Thread(target=request, args=(proxy.src.as_posix(),))
+        for proxy in [*image.proxy_images.proxies, image.proxy_images.large]
+    ]
+
+    for thread in threads:
+        thread.start()
+
+    # Give the remaining requests time to start waiting on the first.
+    started.wait(timeout=10)
+    time.sleep(0.2)
+    release.set()
+
+    for thread in threads:
+        thread.join(timeout=10)
+
+    assert generated == [str(image.path)]
+    assert results == [True] * len(threads)
+    assert image.proxy_images.all_proxies_exist()
+
+
+def test__ProxyGenerator__warm_up(site_copy: pathlib.Path, monkeypatch) -> None:
+
+    release = threading.Event()
+    generate_proxies_original = proxies.generate_proxies
+
+    def generate_proxies_blocking(job):
+        release.wait(timeout=10)
+        return generate_proxies_original(job)
+
+    monkeypatch.setattr(proxies, "generate_proxies", generate_proxies_blocking)
+
+    workers = Globals.workers
+
+    try:
+        easel = Easel(site_copy, testing=True, workers=1, warm_proxies=True)
+    finally:
+        Globals.workers = workers
+
+    image = next(easel.site.iter_images())
+    url = f"{Globals.site_paths.static_url_path}/{image.proxy_images.small.src}"
+    generation = easel.site.generation
+
+    assert not easel.site.proxy_progress.is_done
+
+    # Pages aren't cached during the warm-up as they show its progress.
+    with easel.app_context():
+        easel.render_page(page=easel.site.index)
+
+    assert len(easel._rendered_pages) == 0
+
+    # The warm-up wouldn't survive forking worker processes.
+    with pytest.raises(Error):
+        easel.freeze()
+
+    with easel.test_client() as client:
+
+        # The source image is served until the proxy is generated.
+        response = client.get(url)
+
+        assert response.status_code == 200
+        assert response.data == image.path.read_bytes()
+        assert response.cache_control.no_store
+        assert response.cache_control.max_age == 0
+
+        release.set()
+        easel.site._proxy_generator._warm_up.join(timeout=10)  # type: ignore
+
+        response = client.get(url)
+
+        assert response.data == image.proxy_images.small.path.read_bytes()
+
+    assert easel.site.proxy_progress.is_done
+    assert easel.site.generation == generation + 1
+    assert all(
+        image.proxy_images.all_proxies_exist() for image in easel.site.iter_images()
+    )
+
+
+def test__ProxyGenerator__warm_up_close(monkeypatch) -> None:
+
+    # Threads stand in for processes so generate_proxies() can be patched.
+    monkeypatch.setattr(
+        concurrent.futures, "ProcessPoolExecutor", concurrent.futures.ThreadPoolExecutor
+    )
+
+    release = threading.Event()
+    generated = []
+
+    def generate_proxies_blocking(job):
+        generated.append(job["path"])
+        release.wait(timeout=10)
+        return {}
+
+    monkeypatch.setattr(proxies, "generate_proxies", generate_proxies_blocking)
+
+    generator = ProxyGenerator(workers=2)
+
+    jobs = {pathlib.Path(f"root-{i}"): {"path": f"image-{i}.jpg"} for i in range(50)}
+    results = []
+
+    thread = threading.Thread(
+        target=lambda: results.extend(generator._imap_unordered(jobs))
+    )
+    thread.start()
+
+    while len(generated) < 2:
+        time.sleep(0.01)
+
+    # Only a couple of jobs per worker are ever queued.
+    assert len(generator._futures) == 2 * Defaults.PROXY_WARM_UP_QUEUE_SIZE
+
+    start = time.perf_counter()
+    generator.close()
+
+    assert time.perf_counter() - start < 1.0
+
+    release.set()
+    thread.join(timeout=10)
+
+    # Queued jobs are cancelled while running jobs are left to finish.
+    assert not thread.is_alive()
+    assert len(generated) == len(results) == 2
+
+
+def test__ProxyImage__negotiation(site: Site) -> None:
+
+    easel = Easel(TestSites.valid, testing=True)
+
+    proxy = next(easel.site.iter_images()).proxy_images.small
+    url = f"{Globals.site_paths.static_url_path}/{proxy.src.as_posix()}"
+
+    with easel.test_client() as client:
+
+        response = client.get(url, headers={"Accept": "image/webp,*/*;q=0.8"})
+
+        assert response.data == proxy.get_variant("webp").path.read_bytes()
+        assert response.mimetype == "image/webp"
+        assert "Accept" in response.vary
+
+        response.close()
+
+        for accept in ["image/*,*/*;q=0.8", "image/webp;q=0"]:
+
+            response = client.get(url, headers={"Accept": accept})
+
+            assert response.data == proxy.path.read_bytes()
+            assert response.mimetype == "image/jpeg"
+            assert "Accept" in response.vary
+
+            response.close()
+
+
+def test__ProxyProgress() -> None:
+
+    assert ProxyProgress().is_done
+    assert ProxyProgress().percent == 100
+
+    progress = ProxyProgress(done=0, total=4, elapsed=1.0)
+
+    assert not progress.is_done
+    assert progress.eta is None
+
+    progress = ProxyProgress(done=1, total=4, elapsed=2.0)
+
+    assert progress.percent == 25
+    assert progress.eta == 6.0
+
+
+def test__ProxyGenerator__progress_not_started() -> None:
+
+    generator = ProxyGenerator(workers=1)
+
+    # No time has elapsed before a warm-up is started.
+    assert generator.progress == ProxyProgress()
+    assert generator.progress.elapsed == 0.0
+
+
+@pytest.fixture
+def image_noisy() -> PIL.Image.Image:
+    """Returns an image that's three quarters noisy red and one quarter solid
+    blue. Counting exact colors would find blue to be the most common."""
+
+    image = PIL.Image.new("RGB", (128, 128), (20, 40, 200))
+
+    for x in range(96):
+        for y in range(128):
+            image.putpixel((x, y), (200 + (x * 7 + y * 3) % 9, 40 + y % 5, 30))
+
+    return image
+
+
+def test___generate_color__dominant(image_noisy: PIL.Image.Image) -> None:
+
+    red, green, blue = proxies._generate_color__dominant(image_noisy)
+
+    assert 200 <= red <= 208 and 40 <= green <= 44 and blue == 30
+
+    # Returns the exact mean of the pixels in the dominant bin.
+    pixels = [
+        pixel
+        for pixel in proxies._get_color_sample(image_noisy).getdata()
+        if pixel[2] == 30
+    ]
+
+    assert [red, green, blue] == [
+        round(sum(channel) / len(pixels)) for channel in zip(*pixels)
+    ]
+
+    image = PIL.Image.new("RGB", (64, 64), (17, 130, 255))
+
+    assert proxies._generate_color__dominant(image) == [17, 130, 255]
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test___generate_palette(
+    image_noisy: PIL.Image.Image, use_numpy: bool, monkeypatch
+) -> None:
+
+    if use_numpy is True:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(proxies, "numpy", None)
+
+    palette = proxies._generate_palette(image_noisy, size=4)
+
+    assert len(palette) == 4
+    assert palette[0][0] > 150 and palette[0][2] < 100
+
+    palette = proxies._generate_palette(PIL.Image.new("RGB", (64, 64)), size=4)
+
+    # Missing colors are filled with the least common one.
+    assert palette == [[0, 0, 0]] * 4
+
+
+def test__ProxyColorManager__palette(site_copy: pathlib.Path) -> None:
+
+    Globals.init(root=site_copy)
+
+    site = Site()
+    site.build()
+
+    assert next(site.iter_images()).proxy_colors.palette is None
+
+    # Enabling palettes only generates the palettes.
+    with open(site_copy / "site.yaml", "a") as f:
+        f.write("\ntheme:\n  proxies:\n    palette: 4\n")
+
+    Globals.init(root=site_copy)
+
+    site = Site()
+    site.build()
+
+    image = next(site.iter_images())
+    palette = image.proxy_colors.palette
+
+    assert palette is not None
+    assert len(palette.colors) == len(palette.rgb) == 4
+    assert palette.colors != [[0, 0, 0]] * 4
+    assert (
+        Globals.site_cache.get_proxies(image.proxy_colors.key)["colors"]["palette"]
+        == palette.colors
+    )
+
+
+def test___get_draft_size() -> None:
+
+    assert _get_draft_size((6000, 4000), (1024, 1024)) == (1024, 683)
+    assert _get_draft_size((4000, 6000), (1024, 1024)) == (683, 1024)
+    assert _get_draft_size((512, 256), (1024, 1024)) == (512, 256)
+
+
+# -----------------------------------------------------------------------------
+# SiteCache
+# -----------------------------------------------------------------------------
+
+
+def test__SiteCache__content_addressed(site_copy: pathlib.Path) -> None:
+
+    Globals.init(root=site_copy)
+
+    site = Site()
+    site.build()
+
+    images = {image.path: image for image in site.iter_images()}
+    image_paths = sorted(images)
+
+    # Identical images share one set of proxies.
+    assert len({image.proxy_images.root for image in images.values()}) == 1
+    assert Globals.site_cache.path.exists()
+
+    # Replace an image with a different one of the same name.
+    with PIL.Image.open(image_paths[0]) as image:
+        image.rotate(90, expand=True).save(image_paths[1])
+
+    Globals.init(root=site_copy)
+
+    site = Site()
+    site.build()
+
+    images_rebuilt = {image.path: image for image in site.iter_images()}
+
+    assert (
+        images_rebuilt[image_paths[1]].proxy_images.root
+        != images[image_paths[1]].proxy_images.root
+    )
+    assert (
+        images_rebuilt[image_paths[0]].proxy_images.root
+        == images[image_paths[0]].proxy_images.root
+    )
+    assert images_rebuilt[image_paths[1]].proxy_images.all_proxies_exist()
+
+
+def test__SiteCache__digest_reused(site_copy: pathlib.Path, monkeypatch) -> None:
+
+    Globals.init(root=site_copy)
+
+    site = Site()
+    site.build()
+
+    Globals.init(root=site_copy)
+
+    def get_digest(*args, **kwargs):
+        raise AssertionError("Unchanged files should not be re-hashed.")
+
+    monkeypatch.setattr(Utils, "get_digest", get_digest)
+
+    site = Site()
+    site.build()
+
+
+def test__SiteCache__prefetch_digests(site_copy: pathlib.Path, monkeypatch) -> None:
+
+    Globals.init(root=site_copy)
+
+    hashed = []
+    get_digest_original = Utils.get_digest
+
+    def get_digest(path, *args, **kwargs):
+        hashed.append(path)
+        return get_digest_original(path, *args, **kwargs)
+
+    monkeypatch.setattr(Utils, "get_digest", get_digest)
+
+    site = Site()
+    site.build()
+
+    paths = {image.path for image in site.iter_images()}
+
+    # Every image is hashed once, up front, and missing files are skipped.
+    assert sorted(hashed) == sorted(paths)
+
+    Globals.site_cache.prefetch_digests([*paths, site_copy / "missing.jpg"])
+
+    assert sorted(hashed) == sorted(paths)
+
+    for image in site.iter_images():
+        assert image.proxy_images.key == image.proxy_colors.key
+
+
+def test__SiteCache__rebuild_removes_orphans(site_copy: pathlib.Path) -> None:
+
+    Globals.init(root=site_copy)
+
+    orphan = Globals.site_cache.proxies / "00" / "00-orphan"
+    orphan.mkdir(parents=True)
+
+    site = Site()
+    site.build()
+    site.rebuild_cache()
+
+    assert not orphan.exists()
+    assert all(image.proxy_images.all_proxies_exist() for image in site.iter_images())
+
+
+def test__SiteCache__save_merges(site_copy: pathlib.Path) -> None:
+
+    Globals.init(root=site_copy)
+
+    # Two processes e.g. gunicorn workers, loading the same manifest.
+    site_cache_a = Globals.site_cache
+    site_cache_b = SiteCache(Globals)
+    site_cache_b.load()
+
+    site_cache_a.update_proxies("key-a", images=["a.jpg"], colors={"a": [0, 0, 0]})
+    site_cache_b.update_proxies("key-b", images=["b.jpg"])
+    site_cache_b.update_proxies("key-a", images=["a-small.jpg"])
+
+    site_cache_a.save()
+    site_cache_b.save()
+
+    with open(Globals.site_cache.path) as f:
+        manifest = json.load(f)
+
+    assert manifest["proxies"]["key-a"] == {
+        "images": ["a-small.jpg", "a.jpg"],
+        "colors": {"a": [0, 0, 0]},
+    }
+    assert manifest["proxies"]["key-b"] == {"images": ["b.jpg"], "colors": {}}
+
+    # Pruning still drops the entries that weren't accessed.
+    Globals.site_cache.load()
+    Globals.site_cache.get_proxies("key-b")
+    Globals.site_cache.save(prune=True)
+
+    with open(Globals.site_cache.path) as f:
+        manifest = json.load(f)
+
+    assert list(manifest["proxies"]) == ["key-b"]
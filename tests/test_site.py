@@ -1,9 +1,15 @@
+import json
+import os
+import pathlib
+import shutil
+
 import pytest
 
 from easel.site import Site
 from easel.site.defaults import Key
 from easel.site.errors import Error, SiteConfigError
 from easel.site.globals import Globals
+from easel.site.helpers import Utils
 from tests.test_configs import TestSites
 
 
@@ -46,6 +52,30 @@ def test__valid() -> None:
     assert Globals.site_paths.static_url_path == "/site"
 
 
+def test__get_page_aliases() -> None:
+
+    Globals.init(root=TestSites.valid)
+
+    site = Site()
+    site.build()
+
+    page = site.get_page("/page-layout")
+
+    assert page is not None
+
+    for alias in [
+        "page-layout",
+        "page-layout/",
+        "./page-layout",
+        "pages/page-layout",
+        "/pages/page-layout",
+        "./contents/pages/page-layout",
+        "contents/pages/page-layout/",
+        "//page-layout",
+    ]:
+        assert site.get_page(alias) is page
+
+
 def test__not_built() -> None:
 
     Globals.init(root=TestSites.valid)
@@ -61,6 +91,9 @@ def test__not_built() -> None:
     with pytest.raises(Error):
         site.index
 
+    with pytest.raises(Error):
+        site.get_page("page-layout")
+
 
 def test__rebuild_cache() -> None:
 
@@ -111,6 +144,71 @@ def test__index_overload() -> None:
         site.build()
 
 
+# -----------------------------------------------------------------------------
+# SiteCache
+# -----------------------------------------------------------------------------
+
+
+def test__SiteCache__incremental_build(site_copy: pathlib.Path, monkeypatch) -> None:
+
+    Globals.init(root=site_copy)
+
+    site = Site()
+    site.build()
+
+    colors = {
+        image.path: image.proxy_colors.dominant.color for image in site.iter_images()
+    }
+
+    def raise_unexpected(*args, **kwargs):
+        raise AssertionError("Unchanged pages should not be re-processed.")
+
+    Globals.init(root=site_copy)
+
+    with monkeypatch.context() as m:
+
+        m.setattr(Utils, "load_config", raise_unexpected)
+        m.setattr(Utils, "get_digest", raise_unexpected)
+        m.setattr(os, "scandir", raise_unexpected)
+
+        site = Site()
+        site.build()
+
+    assert {
+        image.path: image.proxy_colors.dominant.color for image in site.iter_images()
+    } == colors
+
+
+def test__SiteCache__incremental_build_changes(site_copy: pathlib.Path) -> None:
+
+    Globals.init(root=site_copy)
+
+    site = Site()
+    site.build()
+
+    page_lazy = site.get_page("page-lazy")
+    contents_count = len(page_lazy.contents)  # type: ignore
+
+    # Add a file to a Lazy page and change the title of a Layout page.
+    (page_lazy.path / "contents" / "05-text-block.md").write_text("Lorem")  # type: ignore
+
+    page_layout = site.get_page("page-layout")
+    path_page_yaml = page_layout.path / "page.yaml"  # type: ignore
+    path_page_yaml.write_text(
+        path_page_yaml.read_text().replace(
+            f"title: {page_layout.title}", "title: Changed Title"  # type: ignore
+        )
+    )
+
+    Globals.init(root=site_copy)
+
+    site = Site()
+    site.build()
+
+    assert len(site.get_page("page-lazy").contents) == contents_count + 1  # type: ignore
+    assert site.get_page("page-layout").title == "Changed Title"  # type: ignore
+
+
 # -----------------------------------------------------------------------------
 # SitePaths
 # -----------------------------------------------------------------------------
@@ -180,3 +278,120 @@ def test__SiteConfig__config_theme_type_invalid() -> None:
 
     with pytest.raises(SiteConfigError):
         Globals.init(root=TestSites.config_theme_type_invalid)
+
+
+def test__Site__snapshot(site_copy: pathlib.Path, monkeypatch) -> None:
+
+    Globals.init(root=site_copy)
+
+    site = Site()
+    site.build(from_snapshot=True)
+
+    assert Globals.site_cache.snapshot.exists()
+
+    colors = {
+        image.path: image.proxy_colors.dominant.color for image in site.iter_images()
+    }
+
+    def raise_unexpected(*args, **kwargs):
+        raise AssertionError("Sites loaded from a snapshot should not be built.")
+
+    Globals.init(root=site_copy)
+
+    with monkeypatch.context() as m:
+
+        m.setattr(Site, "_build", raise_unexpected)
+        m.setattr(Utils, "get_digest", raise_unexpected)
+
+        site_snapshot = Site()
+        site_snapshot.build(from_snapshot=True)
+
+    assert [page.url for page in site_snapshot.pages] == [
+        page.url for page in site.pages
+    ]
+    assert site_snapshot.index.url == site.index.url
+    assert site_snapshot.get_page("page-lazy") is not None
+    assert {
+        image.path: image.proxy_colors.dominant.color
+        for image in site_snapshot.iter_images()
+    } == colors
+
+
+def test__Site__snapshot_changed(site_copy: pathlib.Path) -> None:
+
+    Globals.init(root=site_copy)
+
+    site = Site()
+    site.build(from_snapshot=True)
+
+    page_yaml = site_copy / "contents" / "pages" / "page-lazy" / "page.yaml"
+    page_yaml.write_text(
+        page_yaml.read_text().replace("title: PageLazy\n", "title: Changed\n")
+    )
+
+    Globals.init(root=site_copy)
+
+    site = Site()
+    site.build(from_snapshot=True)
+
+    assert site.get_page("page-lazy").title == "Changed"  # type: ignore
+
+    # The snapshot is replaced with the re-built Site.
+    Globals.init(root=site_copy)
+
+    snapshot = Globals.site_cache.get_snapshot()
+
+    assert snapshot is not None
+    assert [page.title for page in snapshot["pages"] if page.url == "/page-lazy"] == [
+        "Changed"
+    ]
+
+
+def test__Site__snapshot_theme_changed(tmp_path: pathlib.Path) -> None:
+
+    root = tmp_path / TestSites.theme_custom_valid.name
+
+    shutil.copytree(TestSites.theme_custom_valid, root)
+
+    Globals.init(root=root)
+
+    site = Site()
+    site.build(from_snapshot=True)
+
+    Globals.init(root=root)
+
+    assert Globals.site_cache.get_snapshot() is not None
+
+    # Changing the theme's config invalidates the snapshot.
+    theme_yaml = root / "custom-theme" / "theme.yaml"
+    theme_yaml.write_text("proxies:\n  palette: 4\n")
+
+    Globals.init(root=root)
+
+    assert Globals.site_cache.get_snapshot() is None
+
+
+def test__Site__profile(site_copy: pathlib.Path) -> None:
+
+    Globals.init(root=site_copy)
+    Globals.profile = True
+
+    try:
+        site = Site()
+        site.build()
+    finally:
+        Globals.profile = False
+
+    with open(Globals.site_cache.profile, "r") as f:
+        profile = json.load(f)
+
+    phases = {"init", "config", "discovery", "pages", "validate", "proxies"}
+
+    assert phases <= set(profile["phases"])
+    assert set(profile["items"]["pages"]) == {page.path.name for page in site.pages}
+
+    # Images sharing proxies are only processed, and timed, once.
+    assert profile["items"]["proxy images"]
+    assert set(profile["items"]["proxy images"]) <= {
+        str(image.src) for image in site.iter_images()
+    }
@@ -1,3 +1,4 @@
+import pathlib
 import sys
 
 import pytest
@@ -119,3 +120,84 @@ def test__SafeDict() -> None:
     assert isinstance(Globals.theme_config["missing_item"], SafeDict)
     assert isinstance(Globals.theme_config.missing_attr.missing_attr, SafeDict)
     assert isinstance(Globals.theme_config["missing_item"]["missing_item"], SafeDict)
+
+
+def test__proxy_formats(site_copy: pathlib.Path) -> None:
+
+    Globals.init(root=site_copy)
+
+    assert Globals.theme_config.proxy_formats == ["webp"]
+
+    with open(site_copy / "site.yaml", "a") as f:
+        f.write("\ntheme:\n  proxies:\n    formats: [avif, webp]\n")
+
+    Globals.init(root=site_copy)
+
+    assert Globals.theme_config.proxy_formats == ["avif", "webp"]
+
+
+@pytest.mark.parametrize("formats", ["webp", "[gif]"])
+def test__proxy_formats_invalid(site_copy: pathlib.Path, formats: str) -> None:
+
+    with open(site_copy / "site.yaml", "a") as f:
+        f.write(f"\ntheme:\n  proxies:\n    formats: {formats}\n")
+
+    with pytest.raises(ThemeConfigError):
+        Globals.init(root=site_copy)
+
+
+def test__proxy_sizes(site_copy: pathlib.Path) -> None:
+
+    Globals.init(root=site_copy)
+
+    assert [size["name"] for size in Globals.theme_config.proxy_sizes] == [
+        "large",
+        "medium",
+        "small",
+    ]
+
+    with open(site_copy / "site.yaml", "a") as f:
+        f.write(
+            "\ntheme:\n  proxies:\n    sizes:\n"
+            "      - {name: thumb, size: 128, quality: 70}\n"
+            "      - {name: full, size: 2048}\n"
+        )
+
+    Globals.init(root=site_copy)
+
+    assert Globals.theme_config.proxy_sizes == [
+        {"name": "full", "size": (2048, 2048), "quality": 95},
+        {"name": "thumb", "size": (128, 128), "quality": 70},
+    ]
+
+
+@pytest.mark.parametrize(
+    "sizes",
+    [
+        "[]",
+        "[small]",
+        "[{size: 256}]",
+        "[{name: _small, size: 256}]",
+        "[{name: small-2x, size: 256}]",
+        "[{name: small, size: 256}, {name: small, size: 512}]",
+        "[{name: small, size: 0}]",
+        "[{name: small, size: 256, quality: 101}]",
+    ],
+)
+def test__proxy_sizes_invalid(site_copy: pathlib.Path, sizes: str) -> None:
+
+    with open(site_copy / "site.yaml", "a") as f:
+        f.write(f"\ntheme:\n  proxies:\n    sizes: {sizes}\n")
+
+    with pytest.raises(ThemeConfigError):
+        Globals.init(root=site_copy)
+
+
+@pytest.mark.parametrize("palette", ["-1", "257", "yes", "[4]"])
+def test__proxy_palette_invalid(site_copy: pathlib.Path, palette: str) -> None:
+
+    with open(site_copy / "site.yaml", "a") as f:
+        f.write(f"\ntheme:\n  proxies:\n    palette: {palette}\n")
+
+    with pytest.raises(ThemeConfigError):
+        Globals.init(root=site_copy)